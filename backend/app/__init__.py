@@ -2,13 +2,35 @@ from flask import Flask
 from flask_cors import CORS
 
 
-def create_app():
+def create_app(preload: bool = False):
+    """
+    Build the Flask app.
+
+    With `preload=True` the app is warmed up before it is returned: every
+    ML artifact is loaded, a few synthetic triages run through /triage,
+    and the heap is frozen (see app/warmup.py). Use it when a pre-forking
+    server imports the app once in the parent, e.g.
+    `gunicorn --preload wsgi:app`, so workers start warm and share pages.
+    """
     app = Flask(__name__)
     CORS(app)
 
     app.config.from_object("app.config.Config")
 
+    from app.serialization import json_provider_class
+    app.json = json_provider_class(app.config["JSON_BACKEND"])(app)
+
+    from app.engine.pipeline import configure_cache
+    from app.engine.instrumentation import configure_instrumentation
+    configure_cache(app.config["TRIAGE_CACHE_SIZE"])
+    configure_instrumentation(app.config["TRIAGE_TIMING_ENABLED"])
+
     from app.routes import api_bp
     app.register_blueprint(api_bp)
 
+    if preload:
+        from app.warmup import warm_up, freeze_heap
+        warm_up(app, rounds=app.config["WARMUP_ROUNDS"])
+        freeze_heap()
+
     return app
@@ -0,0 +1,157 @@
+"""
+Catalog Responses
+==================
+The /symptoms and /diseases bodies only change when the model artifacts
+do, so each is serialized once per artifact version and language. It is
+kept with its gzip (and, if the `brotli` package is installed, brotli)
+encoding and a strong ETag derived from the bytes.
+
+Hindi and Marathi catalogs carry display names from SYMPTOM_TRANSLATIONS
+and DISEASE_NAMES, and disease descriptions / precautions from the
+narrative catalog. Ids and canonical disease names stay English.
+"""
+
+import gzip
+import hashlib
+from threading import Lock
+
+from app.engine.narratives import localize
+from app.engine.translations import SYMPTOM_TRANSLATIONS, translate_disease_name, translate_symptom
+from ml.predictor import get_all_symptoms, get_bundle, get_disease_info, get_severity_map
+
+try:
+    import brotli
+except ImportError:  # optional: gzip only
+    brotli = None
+
+CATALOG_LANGUAGES = tuple(SYMPTOM_TRANSLATIONS)
+
+
+def symptom_display_name(symptom: str, language: str = "en") -> str:
+    """How the catalogs show a symptom id in `language`."""
+    if language == "en":
+        return symptom.replace("_", " ").title()
+    return translate_symptom(symptom, language)
+
+
+def build_symptoms_catalog(language: str = "en") -> dict:
+    """All symptoms, plain and grouped by severity weight."""
+    all_symptoms = get_all_symptoms()
+    severity_map = get_severity_map()
+
+    # Group by severity weight
+    categorized = {
+        "critical": [],     # weight >= 6
+        "high": [],         # weight 4-5
+        "moderate": [],     # weight 3
+        "mild": [],         # weight 1-2
+    }
+
+    names = {s: symptom_display_name(s, language) for s in all_symptoms}
+    for symptom in all_symptoms:
+        weight = severity_map.get(symptom.lower(), 1)
+        entry = {"id": symptom, "name": names[symptom], "weight": weight}
+
+        if weight >= 6:
+            categorized["critical"].append(entry)
+        elif weight >= 4:
+            categorized["high"].append(entry)
+        elif weight >= 3:
+            categorized["moderate"].append(entry)
+        else:
+            categorized["mild"].append(entry)
+
+    return {
+        "symptoms": [{"id": s, "name": names[s]} for s in all_symptoms],
+        "categorized": categorized,
+        "total": len(all_symptoms),
+        "language": language,
+    }
+
+
+def build_diseases_catalog(language: str = "en") -> dict:
+    """All diseases with descriptions, severity tiers and precautions."""
+    diseases = []
+    for name, info in sorted(get_disease_info().items()):
+        description = info.get("description", "")
+        precautions = info.get("precautions", [])
+        entry = {
+            "name": name,
+            "description": description,
+            "severity_tier": info.get("severity_tier", "Low"),
+            "precautions": precautions,
+        }
+        if language != "en":
+            entry["display_name"] = translate_disease_name(name, language)
+            entry["description"] = localize(description, language)
+            entry["precautions"] = [localize(p, language) for p in precautions]
+        diseases.append(entry)
+
+    return {
+        "diseases": diseases,
+        "total": len(diseases),
+        "language": language,
+    }
+
+
+CATALOG_BUILDERS = {
+    "symptoms": build_symptoms_catalog,
+    "diseases": build_diseases_catalog,
+}
+
+
+class EncodedCatalog:
+    """One serialized catalog body with its pre-compressed variants."""
+
+    __slots__ = ("etag", "bodies")
+
+    def __init__(self, body: bytes):
+        self.etag = hashlib.sha256(body).hexdigest()[:32]
+        # mtime=0 keeps the gzip bytes identical across processes
+        self.bodies: dict[str, bytes] = {
+            "identity": body,
+            "gzip": gzip.compress(body, compresslevel=9, mtime=0),
+        }
+        if brotli is not None:
+            self.bodies["br"] = brotli.compress(body)
+
+    def etag_for(self, encoding: str) -> str:
+        """Strong ETag of one representation (each encoding gets its own)."""
+        return self.etag if encoding == "identity" else f"{self.etag}-{encoding}"
+
+
+_cache: dict[tuple[str, str, str], EncodedCatalog] = {}
+_lock = Lock()
+
+
+def artifact_version() -> str:
+    """Checksum of the served artifact bundle."""
+    return get_bundle().manifest["checksum"]
+
+
+def get_catalog(name: str, dumps, language: str = "en") -> EncodedCatalog:
+    """
+    The encoded `name` catalog in `language`, serialized with `dumps`
+    on first use. Entries of older artifact versions are dropped.
+    """
+    if language not in CATALOG_LANGUAGES:
+        raise ValueError(f"Unsupported language: {language}")
+    version = artifact_version()
+    key = (name, language, version)
+    entry = _cache.get(key)
+    if entry is None:
+        with _lock:
+            entry = _cache.get(key)
+            if entry is None:
+                payload = CATALOG_BUILDERS[name](language)
+                entry = EncodedCatalog(dumps(payload).encode("utf-8"))
+                for stale in [k for k in _cache if k[2] != version]:
+                    del _cache[stale]
+                _cache[key] = entry
+    return entry
+
+
+def clear_catalogs() -> None:
+    """Forget every encoded catalog (they are rebuilt on the next request)."""
+    with _lock:
+        _cache.clear()
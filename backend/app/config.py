@@ -2,3 +2,15 @@ class Config:
     DEBUG = True
     SUPPORTED_LANGUAGES = ["en", "hi", "mr"]
     DEFAULT_LANGUAGE = "en"
+    TRIAGE_BATCH_CHUNK_SIZE = 64
+    TRIAGE_BATCH_MAX_RECORDS = 1000
+    TRIAGE_CACHE_SIZE = 1024
+    TRIAGE_TIMING_ENABLED = False
+    WARMUP_ROUNDS = 2
+    CATALOG_MAX_AGE = 3600
+    JSON_BACKEND = "auto"
+    STREAM_SESSION_TTL = 600
+    STREAM_MAX_LIFETIME = 1800
+    STREAM_MAX_SESSIONS = 1024
+    STREAM_MAX_EVENTS = 256
+    STREAM_KEEPALIVE = 15
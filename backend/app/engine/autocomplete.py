@@ -0,0 +1,198 @@
+"""
+Symptom Autocomplete Index
+===========================
+Answers per-keystroke symptom searches from an in-memory index over
+every way of naming a symptom: the model's column names, their English
+display names, every NLP phrase alias and the Hindi / Marathi
+translations.
+
+  • prefix – a character trie over each term and each of its word
+             suffixes ("pain" finds "abdominal pain"). Every node keeps
+             its best few symptoms already ranked, so a lookup is one
+             walk down the trie.
+  • fuzzy  – a character-trigram index for typos ("hedache"); used to
+             fill up the results when prefixes alone find too few.
+
+Results are canonical symptom ids, best first.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import Counter
+
+# Term sources, best first: a symptom's own name beats a translation,
+# which beats a free-text alias
+SOURCE_NAME = 0
+SOURCE_TRANSLATION = 1
+SOURCE_ALIAS = 2
+
+MAX_RESULTS = 10
+# A fuzzy match must contain this share of the query's trigrams...
+FUZZY_MIN_OVERLAP = 0.5
+# ...and be at least this Dice-similar to the query overall
+FUZZY_MIN_SIMILARITY = 0.4
+
+_SPACE_RE = re.compile(r"[\s_]+")
+
+
+def normalize_query(text: str) -> str:
+    """Lowercase, underscores to spaces, whitespace collapsed."""
+    return _SPACE_RE.sub(" ", text.lower()).strip()
+
+
+def _trigrams(text: str, pad_end: bool = True) -> set[str]:
+    # Queries are usually unfinished words, so they are not end-padded
+    padded = f"  {text} " if pad_end else f"  {text}"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class SymptomSearchIndex:
+    """
+    Prefix trie + trigram index over (term, symptom id, source) entries.
+
+    `search()` returns [(symptom id, matched term, "prefix" | "fuzzy")],
+    one entry per symptom, best first.
+    """
+
+    __slots__ = ("_trie", "_terms", "_term_trigrams", "_postings")
+
+    def __init__(self, entries):
+        # term → (best source, symptom ids in first-seen order)
+        terms: dict[str, tuple[int, list[str]]] = {}
+        for term, symptom, source in entries:
+            term = normalize_query(term)
+            if not term:
+                continue
+            best, symptoms = terms.get(term, (source, []))
+            if symptom not in symptoms:
+                symptoms.append(symptom)
+            terms[term] = (min(best, source), symptoms)
+
+        self._terms: list[tuple[str, tuple[str, ...]]] = []
+        self._term_trigrams: list[int] = []
+        self._postings: dict[str, list[int]] = {}
+
+        keys = []
+        for term_id, term in enumerate(sorted(terms)):
+            source, symptoms = terms[term]
+            self._terms.append((term, tuple(symptoms)))
+
+            grams = _trigrams(term)
+            self._term_trigrams.append(len(grams))
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(term_id)
+
+            words = term.split(" ")
+            for start in range(len(words)):
+                # Whole-term matches first, then by source, then shorter terms
+                rank = (start > 0, source, len(term), term)
+                keys.append((rank, " ".join(words[start:]), symptoms))
+
+        # node = [children, {symptom: term}]. Keys are inserted best
+        # first, so each node just keeps the first MAX_RESULTS symptoms
+        # that reach it.
+        self._trie: list = [{}, {}]
+        for rank, key, symptoms in sorted(keys):
+            term = rank[-1]
+            node = self._trie
+            for ch in key:
+                child = node[0].get(ch)
+                if child is None:
+                    child = node[0][ch] = [{}, {}]
+                node = child
+                best = node[1]
+                if len(best) < MAX_RESULTS:
+                    for symptom in symptoms:
+                        if symptom not in best and len(best) < MAX_RESULTS:
+                            best[symptom] = term
+
+        stack = [self._trie]
+        while stack:
+            node = stack.pop()
+            node[1] = tuple(node[1].items())
+            stack.extend(node[0].values())
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def prefix(self, query: str) -> tuple[tuple[str, str], ...]:
+        """(symptom, term) pairs whose term or a word in it starts with `query`."""
+        node = self._trie
+        for ch in query:
+            node = node[0].get(ch)
+            if node is None:
+                return ()
+        return node[1]
+
+    def fuzzy(self, query: str, limit: int = MAX_RESULTS) -> list[tuple[str, str]]:
+        """(symptom, term) pairs sharing most of the query's trigrams."""
+        grams = _trigrams(query, pad_end=False)
+        counts: Counter = Counter()
+        for gram in grams:
+            postings = self._postings.get(gram)
+            if postings:
+                counts.update(postings)
+
+        needed = FUZZY_MIN_OVERLAP * len(grams)
+        scored = []
+        for term_id, common in counts.items():
+            if common >= needed:
+                dice = 2 * common / (len(grams) + self._term_trigrams[term_id])
+                if dice >= FUZZY_MIN_SIMILARITY:
+                    scored.append((-dice, term_id))
+        scored.sort()
+
+        results: dict[str, str] = {}
+        for _, term_id in scored:
+            term, symptoms = self._terms[term_id]
+            for symptom in symptoms:
+                if symptom not in results:
+                    results[symptom] = term
+            if len(results) >= limit:
+                break
+        return list(results.items())[:limit]
+
+    def search(self, query: str, limit: int = 8) -> list[tuple[str, str, str]]:
+        """Ranked matches for a partially typed query."""
+        query = normalize_query(query)
+        limit = max(0, min(limit, MAX_RESULTS))
+        if not query or not limit:
+            return []
+
+        results = [(symptom, term, "prefix") for symptom, term in self.prefix(query)[:limit]]
+        if len(results) < limit and len(query) >= 3:
+            seen = {symptom for symptom, _, _ in results}
+            for symptom, term in self.fuzzy(query, limit):
+                if symptom not in seen:
+                    seen.add(symptom)
+                    results.append((symptom, term, "fuzzy"))
+                    if len(results) == limit:
+                        break
+        return results
+
+
+def _symptom_entries():
+    from app.engine.nlp import NLP_PHRASE_MAP
+    from app.engine.translations import SYMPTOM_TRANSLATIONS
+    from ml.predictor import get_all_symptoms
+
+    columns = get_all_symptoms()
+    known = set(columns)
+    for symptom in columns:
+        yield symptom, symptom, SOURCE_NAME
+    for symptom, name in SYMPTOM_TRANSLATIONS.get("en", {}).items():
+        if symptom in known:
+            yield name, symptom, SOURCE_NAME
+    for language, names in SYMPTOM_TRANSLATIONS.items():
+        if language == "en":
+            continue
+        for symptom, name in names.items():
+            if symptom in known:
+                yield name, symptom, SOURCE_TRANSLATION
+    for phrase, symptom in NLP_PHRASE_MAP.items():
+        if symptom in known:
+            yield phrase, symptom, SOURCE_ALIAS
+
+
+SYMPTOM_SEARCH_INDEX = SymptomSearchIndex(_symptom_entries())
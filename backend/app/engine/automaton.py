@@ -0,0 +1,116 @@
+"""
+Multi-Pattern Phrase Automaton
+===============================
+Aho-Corasick automaton used to find every phrase of a large dictionary
+in a single left-to-right pass over the text.
+
+Built once at import time by the modules that own the phrase tables
+(NLP phrase map, translation catalogs), then shared by every request.
+`feed` resumes from a saved state, for text that arrives in pieces.
+"""
+
+from __future__ import annotations
+from collections import deque
+
+
+class PhraseAutomaton:
+    """
+    Compiled Aho-Corasick automaton over a fixed set of phrases.
+
+    Matching is case-sensitive on purpose: callers lowercase both the
+    phrases and the text once, instead of once per phrase.
+    """
+
+    __slots__ = ("_goto", "_fail", "_out", "_phrases")
+
+    def __init__(self, phrases):
+        # State 0 is the root. `_out[state]` holds the indices of every
+        # phrase ending at that state, longest first, with fail-link
+        # outputs already merged in so matching never walks the chain.
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[tuple[int, ...]] = [()]
+        self._phrases: list[str] = []
+
+        own: list[list[int]] = [[]]
+        for phrase in dict.fromkeys(phrases):
+            if not phrase:
+                continue
+            state = 0
+            for ch in phrase:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    own.append([])
+                state = nxt
+            own[state].append(len(self._phrases))
+            self._phrases.append(phrase)
+
+        self._out = [()] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        for child in queue:
+            self._out[child] = tuple(own[child])
+        while queue:
+            state = queue.popleft()
+            for ch, child in self._goto[state].items():
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(ch, 0)
+                self._out[child] = tuple(own[child]) + self._out[self._fail[child]]
+                queue.append(child)
+
+    def __len__(self) -> int:
+        return len(self._phrases)
+
+    def iter_matches(self, text: str):
+        """
+        Yield (start, end, phrase) for every occurrence of every phrase,
+        including overlapping and nested ones.
+
+        Matches are produced in order of their end offset; matches that
+        end at the same offset are produced longest first.
+        """
+        goto = self._goto
+        fail = self._fail
+        out = self._out
+        phrases = self._phrases
+        state = 0
+        for i, ch in enumerate(text, 1):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for idx in out[state]:
+                phrase = phrases[idx]
+                yield i - len(phrase), i, phrase
+
+    def feed(self, text: str, state: int = 0, offset: int = 0) -> tuple[list[tuple[int, int, str]], int]:
+        """
+        Resumable matching for text that arrives in pieces.
+
+        Continues from `state` (0 = start of text) as if `text` directly
+        followed everything fed before, so phrases spanning two pieces
+        are found. `offset` is the position of `text` in the whole
+        input. Returns the (start, end, phrase) matches ending in this
+        piece, as iter_matches orders them, and the state to resume from.
+        """
+        goto = self._goto
+        fail = self._fail
+        out = self._out
+        phrases = self._phrases
+        matches = []
+        for i, ch in enumerate(text, offset + 1):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for idx in out[state]:
+                phrase = phrases[idx]
+                matches.append((i - len(phrase), i, phrase))
+        return matches, state
+
+    def find_all(self, text: str) -> list[tuple[int, int, str]]:
+        """Return every match in `text` as a list of (start, end, phrase)."""
+        return list(self.iter_matches(text))
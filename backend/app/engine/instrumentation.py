@@ -0,0 +1,172 @@
+"""
+Pipeline Latency Instrumentation
+=================================
+Records wall-clock time per triage phase into fixed-bucket histograms.
+
+Disabled by default. When disabled and no per-request debug output is
+asked for, the pipeline gets a shared no-op trace, so the only cost is
+an empty method call per phase.
+"""
+
+from bisect import bisect_left
+from contextlib import contextmanager
+from threading import Lock, local
+from time import perf_counter
+
+# Histogram bucket upper bounds, in milliseconds (last bucket is +inf)
+BUCKET_BOUNDS_MS: tuple[float, ...] = (
+    0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 25.0, 50.0,
+    100.0, 250.0, 500.0, 1000.0,
+)
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram with count / sum / min / max."""
+
+    __slots__ = ("buckets", "count", "total_ms", "min_ms", "max_ms")
+
+    def __init__(self):
+        self.buckets = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.min_ms = float("inf")
+        self.max_ms = 0.0
+
+    def observe(self, ms: float) -> None:
+        self.buckets[bisect_left(BUCKET_BOUNDS_MS, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        if ms < self.min_ms:
+            self.min_ms = ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-th quantile (max if beyond the last bound)."""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= target and n:
+                return BUCKET_BOUNDS_MS[i] if i < len(BUCKET_BOUNDS_MS) else self.max_ms
+        return self.max_ms
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total_ms / self.count, 4) if self.count else 0.0,
+            "min_ms": round(self.min_ms, 4) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 4),
+            "p50_ms": self.quantile(0.50),
+            "p95_ms": self.quantile(0.95),
+            "p99_ms": self.quantile(0.99),
+            "buckets": {
+                **{f"le_{b}": n for b, n in zip(BUCKET_BOUNDS_MS, self.buckets)},
+                "le_inf": self.buckets[-1],
+            },
+        }
+
+
+_enabled = False
+_histograms: dict[str, LatencyHistogram] = {}
+_lock = Lock()
+_thread = local()
+
+
+class PhaseTrace:
+    """Timings for a single pipeline run, one mark per finished phase."""
+
+    __slots__ = ("timings_ms", "_last")
+
+    def __init__(self):
+        self.timings_ms: dict[str, float] = {}
+        self._last = perf_counter()
+
+    def mark(self, phase: str) -> None:
+        """Record the time since the previous mark as `phase`."""
+        now = perf_counter()
+        self.timings_ms[phase] = self.timings_ms.get(phase, 0.0) + (now - self._last) * 1000
+        self._last = now
+
+    def skip(self) -> None:
+        """Restart the clock without recording (e.g. time spent on other records)."""
+        self._last = perf_counter()
+
+    def finish(self) -> dict[str, float]:
+        """Record the total, feed the histograms if enabled, return the timings."""
+        self.timings_ms["total"] = sum(self.timings_ms.values())
+        if _enabled:
+            record(self.timings_ms)
+        return self.timings_ms
+
+
+class _NullTrace:
+    """Shared no-op trace used when nothing is being measured."""
+
+    __slots__ = ()
+
+    def mark(self, phase: str) -> None:
+        pass
+
+    def skip(self) -> None:
+        pass
+
+    def finish(self) -> dict[str, float]:
+        return {}
+
+
+NULL_TRACE = _NullTrace()
+
+
+def start_trace(debug: bool = False):
+    """Return a live trace if timing is enabled or requested, else the no-op trace."""
+    if _enabled or debug:
+        return PhaseTrace()
+    return NULL_TRACE
+
+
+def record(timings_ms: dict[str, float]) -> None:
+    """Add one run's per-phase timings to the histograms."""
+    if getattr(_thread, "paused", False):
+        return
+    with _lock:
+        for phase, ms in timings_ms.items():
+            hist = _histograms.get(phase)
+            if hist is None:
+                hist = _histograms[phase] = LatencyHistogram()
+            hist.observe(ms)
+
+
+def configure_instrumentation(enabled: bool) -> None:
+    """Turn histogram recording on or off."""
+    global _enabled
+    _enabled = bool(enabled)
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def get_phase_latency() -> dict:
+    """Snapshot of every phase histogram."""
+    with _lock:
+        return {phase: hist.to_dict() for phase, hist in _histograms.items()}
+
+
+@contextmanager
+def paused():
+    """Keep this thread's timings out of the histograms for the duration."""
+    _thread.paused = True
+    try:
+        yield
+    finally:
+        _thread.paused = False
+
+
+def reset_phase_latency() -> None:
+    """Drop all recorded histograms."""
+    with _lock:
+        _histograms.clear()
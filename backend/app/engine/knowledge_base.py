@@ -275,3 +275,18 @@ MARATHI_MARKERS = [
     "potaat", "doka", "khup", "thoda", "kaahi", "nahi",
     "shwas", "ghasa", "anga", "tras",
 ]
+
+# The same markers for text typed in Devanagari, plus the function words
+# that tell the two languages apart
+HINDI_DEVANAGARI_MARKERS = [
+    "है", "हैं", "मुझे", "मेरा", "मेरी", "मेरे", "दर्द", "बुखार",
+    "पेट", "सिर", "बहुत", "थोड़ा", "कुछ", "नहीं", "सांस", "साँस",
+    "गला", "गले", "बदन", "परेशानी", "रहा", "रही", "और", "में", "का",
+    "की", "के", "भी", "था", "थी",
+]
+
+MARATHI_DEVANAGARI_MARKERS = [
+    "आहे", "आहेत", "मला", "माझा", "माझी", "माझे", "दुखतंय", "दुखत",
+    "होतंय", "ताप", "पोटात", "डोकं", "डोके", "खूप", "काही", "नाही",
+    "घसा", "अंग", "त्रास", "आणि", "मध्ये", "पण", "होते", "आहेस",
+]
@@ -0,0 +1,77 @@
+"""
+Localized Narrative Catalog
+============================
+Phases 5–8 build their text from a small, fixed set of fragments
+(risk-level templates, disease descriptions, precautions, rule
+explanations). Every fragment is rendered once per language up front,
+so the phases can emit localized text directly and Phase 9 does not
+have to re-translate those fields on every request.
+
+Text that is not in the catalog (anything quoting the user, ages,
+symptom lists) falls back to on-the-fly translation.
+"""
+
+from app.engine.translations import translate_full_text
+
+NARRATIVE_LANGUAGES = ("hi", "mr")
+
+_CATALOG: dict[str, dict[str, str]] = {lang: {} for lang in NARRATIVE_LANGUAGES}
+_built = False
+
+
+def register_fragments(*fragments: str) -> None:
+    """Pre-render English fragments in every catalog language."""
+    for fragment in fragments:
+        if not fragment:
+            continue
+        for lang, catalog in _CATALOG.items():
+            if fragment not in catalog:
+                catalog[fragment] = translate_full_text(fragment, lang)
+
+
+def localize(fragment: str, language: str) -> str:
+    """Return `fragment` in `language`, from the catalog when possible."""
+    if language == "en" or not fragment:
+        return fragment
+    catalog = _CATALOG.get(language)
+    if catalog is not None:
+        text = catalog.get(fragment)
+        if text is not None:
+            return text
+    return translate_full_text(fragment, language)
+
+
+def build_catalog() -> None:
+    """
+    Register the data-driven fragments: silent-emergency explanations and
+    per-disease sentences, descriptions and precaution blocks. The fixed
+    templates register themselves when their phase module is imported.
+    """
+    global _built
+    if _built:
+        return
+
+    from app.engine.knowledge_base import SILENT_EMERGENCY_PATTERNS
+    from app.engine.phase5_explain import disease_association
+    from app.engine.phase7_action import precautions_block
+    from ml.predictor import get_disease_info
+
+    register_fragments(*(p["explanation"] for p in SILENT_EMERGENCY_PATTERNS))
+
+    for disease, info in get_disease_info().items():
+        register_fragments(
+            disease_association(disease),
+            info.get("description", ""),
+            precautions_block(info.get("precautions", [])),
+        )
+
+    _built = True
+
+
+def is_catalog_built() -> bool:
+    return _built
+
+
+def catalog_size() -> dict[str, int]:
+    """Number of pre-rendered fragments per language."""
+    return {lang: len(catalog) for lang, catalog in _CATALOG.items()}
@@ -13,6 +13,8 @@ Capabilities:
 
 from __future__ import annotations
 import re
+from bisect import bisect_right
+from app.engine.automaton import PhraseAutomaton
 from ml.predictor import get_all_symptoms
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -1103,10 +1105,21 @@ _NEGATION_WORDS = {
     "nahi", "nai", "nahin", "nah", "na", "mat",
 }
 
-# Compiled once for reuse
-_NEGATION_RE = re.compile(
-    r'\b(' + '|'.join(re.escape(w) for w in sorted(_NEGATION_WORDS, key=len, reverse=True)) + r')\b',
-    re.IGNORECASE,
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  PHRASE AUTOMATON
+#  Every NLP phrase plus every model column (underscored and readable form)
+#  compiled once into a single Aho-Corasick automaton.
+# ─────────────────────────────────────────────────────────────────────────────
+
+_COLUMN_NAMES: frozenset[str] = frozenset(get_all_symptoms())
+_READABLE_COLUMNS: dict[str, str] = {col.replace("_", " "): col for col in _COLUMN_NAMES}
+_READABLE_NAMES: dict[str, str] = {col: readable for readable, col in _READABLE_COLUMNS.items()}
+# Either spelling of a column name → the column
+_COLUMN_PHRASES: dict[str, str] = {**_READABLE_COLUMNS, **{col: col for col in _COLUMN_NAMES}}
+
+PHRASE_AUTOMATON = PhraseAutomaton(
+    sorted(set(NLP_PHRASE_MAP) | _COLUMN_NAMES | set(_READABLE_COLUMNS))
 )
 
 
@@ -1114,36 +1127,123 @@ _NEGATION_RE = re.compile(
 #  PUBLIC API
 # ─────────────────────────────────────────────────────────────────────────────
 
-def _split_into_clauses(text: str) -> list[str]:
+# One regex pass splits the text into word runs, punctuation runs that
+# end a clause, and commas. Clause breaks and negation words are then
+# plain set lookups on the tokens.
+_TOKEN_RE = re.compile(r"\w+(?:'t\b)?|[.!;]+|,")
+_CLAUSE_BREAK_WORDS = frozenset({"and", "but", "however", "although", "yet"})
+
+# A negation word reaches this many characters (~6 words) ahead of it
+NEGATION_WINDOW = 60
+# Scope value for "no negation word earlier in this clause"
+_NO_NEGATION = -NEGATION_WINDOW - 1
+
+
+def _markers(text: str, offset: int = 0) -> tuple[list[tuple[int, int]], list[tuple[int, int]]]:
     """
-    Split input text into clauses at sentence / conjunction boundaries.
-    Each clause is processed independently so negation in one clause
-    doesn't affect symptoms mentioned in another.
+    The (start, end) offsets of every clause break and every negation
+    word in `text`, shifted by `offset`.
     """
-    # Split on sentence endings, commas, "and", "but", "however", semicolons
-    parts = re.split(
-        r'[.!;]+|\band\b|\bbut\b|\bhowever\b|\balthough\b|\byet\b|,',
-        text,
-        flags=re.IGNORECASE,
-    )
-    return [p.strip() for p in parts if p.strip()]
-
+    breaks = []
+    negations = []
+    for m in _TOKEN_RE.finditer(text):
+        token = m.group()
+        start, end = m.span()
+        if token not in _NEGATION_WORDS and token.endswith("'t"):
+            # Not a contraction we know ("don't"): the word ends at the apostrophe
+            token = token[:-2]
+            end -= 2
+        if token in _NEGATION_WORDS:
+            negations.append((start + offset, end + offset))
+        elif token in _CLAUSE_BREAK_WORDS or token[0] in ".!;,":
+            breaks.append((start + offset, end + offset))
+    return breaks, negations
+
+
+def _tokenize(text: str) -> tuple[list[tuple[int, int]], list[tuple[int, int]]]:
+    """
+    Split lowercased text into clauses at sentence / conjunction
+    boundaries and find every negation word, in a single pass. Each
+    clause is processed independently so negation in one clause doesn't
+    affect symptoms mentioned in another.
 
-def _clause_is_negated(clause: str, symptom_phrase: str) -> bool:
+    Returns the (start, end) offsets of each stripped, non-empty clause
+    and the (start, end) offsets of each negation word.
+    """
+    breaks, negations = _markers(text)
+
+    spans = []
+    pos = 0
+    for start, end in breaks:
+        spans.append((pos, start))
+        pos = end
+    spans.append((pos, len(text)))
+
+    clauses = []
+    for start, end in spans:
+        part = text[start:end]
+        lead = len(part) - len(part.lstrip())
+        trail = len(part) - len(part.rstrip())
+        if lead < len(part):
+            clauses.append((start + lead, end - trail))
+    return clauses, negations
+
+
+class _ScannedText:
     """
-    Check whether a symptom phrase inside this clause is negated.
-    We look for negation words appearing BEFORE the symptom phrase
-    within a window of ~6 words.
+    One lowercased input after a single tokenizer pass and a single pass
+    of the phrase automaton.
+
+    `matches` maps phrase → start offsets (first occurrence per clause).
+    `scope[i]` is the start of the last negation word that ends at or
+    before offset i in the same clause, so "is the phrase at i negated"
+    is one list lookup.
     """
-    clause_lower = clause.lower()
-    phrase_lower = symptom_phrase.lower()
-    idx = clause_lower.find(phrase_lower)
-    if idx == -1:
-        return False
 
-    # Look at the 60 chars before the match
-    window = clause_lower[max(0, idx - 60):idx]
-    return bool(_NEGATION_RE.search(window))
+    __slots__ = ("matches", "scope")
+
+    def __init__(self, text: str):
+        spans, negations = _tokenize(text)
+        starts = [start for start, _ in spans]
+
+        # Matches that straddle a clause boundary are dropped, as they
+        # would never have been found by scanning clause by clause.
+        self.matches: dict[str, list[int]] = {}
+        seen: set[tuple[str, int]] = set()
+        for start, end, phrase in PHRASE_AUTOMATON.iter_matches(text):
+            ci = bisect_right(starts, start) - 1
+            if ci < 0 or end > spans[ci][1]:
+                continue
+            if (phrase, ci) in seen:
+                continue
+            seen.add((phrase, ci))
+            self.matches.setdefault(phrase, []).append(start)
+
+        # One merge pass over clauses and negation words. Each negation
+        # word covers the offsets from its end to the next one's end (or
+        # the clause end); everything else keeps the "none" value.
+        scope = [_NO_NEGATION] * (len(text) + 1)
+        k = 0
+        for clause_start, clause_end in spans:
+            if k == len(negations):
+                break
+            while k < len(negations) and negations[k][0] < clause_start:
+                k += 1
+            last = _NO_NEGATION
+            pos = clause_start
+            while k < len(negations) and negations[k][1] <= clause_end:
+                neg_start, neg_end = negations[k]
+                if last != _NO_NEGATION:
+                    scope[pos:neg_end] = [last] * (neg_end - pos)
+                last, pos = neg_start, neg_end
+                k += 1
+            if last != _NO_NEGATION:
+                scope[pos:clause_end + 1] = [last] * (clause_end + 1 - pos)
+        self.scope = scope
+
+    def is_negated(self, idx: int) -> bool:
+        """Whether a negation word precedes offset `idx` within the window."""
+        return self.scope[idx] >= idx - NEGATION_WINDOW
 
 
 def extract_symptoms_nlp(raw_text: str) -> tuple[list[str], list[str]]:
@@ -1158,33 +1258,202 @@ def extract_symptoms_nlp(raw_text: str) -> tuple[list[str], list[str]]:
     if not text_lower:
         return [], []
 
-    clauses = _split_into_clauses(text_lower)
+    scanned = _ScannedText(text_lower)
+    is_negated = scanned.is_negated
     extracted: set[str] = set()
     negated: set[str] = set()
 
-    # Sort phrase map by length (longest first) so "chest pain" matches before "pain"
-    sorted_phrases = sorted(NLP_PHRASE_MAP.keys(), key=len, reverse=True)
-
-    for clause in clauses:
-        for phrase in sorted_phrases:
-            if phrase in clause:
-                col = NLP_PHRASE_MAP[phrase]
-                if _clause_is_negated(clause, phrase):
-                    negated.add(col)
-                else:
-                    extracted.add(col)
-
-    # Also do direct column-name matching (underscored names in text)
-    all_cols = set(get_all_symptoms())
-    for col in all_cols:
-        readable = col.replace("_", " ")
-        for clause in clauses:
-            if readable in clause or col in clause:
-                if col not in extracted and col not in negated:
-                    if not any(_clause_is_negated(c, readable) for c in clauses if readable in c):
-                        extracted.add(col)
+    # Every phrase hit counts, including ones nested inside a longer hit
+    # ("chest pain" also contains "pain"), exactly as with per-phrase scans.
+    for phrase, hits in scanned.matches.items():
+        col = NLP_PHRASE_MAP.get(phrase)
+        if col is None:
+            continue
+        for idx in hits:
+            if is_negated(idx):
+                negated.add(col)
+            else:
+                extracted.add(col)
+
+    # Also do direct column-name matching (underscored or readable names
+    # in text). Only the readable form is checked for negation.
+    for phrase in scanned.matches:
+        col = _COLUMN_PHRASES.get(phrase)
+        if col is None or col in extracted or col in negated:
+            continue
+        if not any(is_negated(idx) for idx in scanned.matches.get(_READABLE_NAMES[col], ())):
+            extracted.add(col)
 
     # Remove anything negated from extracted
     extracted -= negated
 
     return sorted(extracted), sorted(negated)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  STREAMING EXTRACTION
+#  Symptoms from a transcript that arrives in chunks (live dictation).
+#  Each chunk is scanned once; nothing already committed is re-read.
+# ─────────────────────────────────────────────────────────────────────────────
+
+class _ScanState:
+    """
+    Where the scan of the committed text stopped: its length, the
+    automaton state, and what the still-open clause has seen so far.
+    """
+
+    __slots__ = ("length", "automaton", "clause", "clause_start", "phrases", "negations")
+
+    def __init__(self, length=0, automaton=0, clause=0, clause_start=0, phrases=frozenset(), negations=()):
+        self.length = length
+        self.automaton = automaton
+        self.clause = clause              # number of clause breaks so far
+        self.clause_start = clause_start  # end of the last clause break
+        self.phrases = phrases            # phrases already hit in the open clause
+        self.negations = negations        # negation words in the open clause
+
+
+class _Evidence:
+    """Columns hit by phrase-map phrases and by column names, by polarity."""
+
+    __slots__ = ("mapped", "mapped_negated", "columns", "columns_negated")
+
+    def __init__(self):
+        self.mapped: set[str] = set()
+        self.mapped_negated: set[str] = set()
+        self.columns: set[str] = set()
+        self.columns_negated: set[str] = set()
+
+    def merge(self, other: _Evidence) -> None:
+        self.mapped |= other.mapped
+        self.mapped_negated |= other.mapped_negated
+        self.columns |= other.columns
+        self.columns_negated |= other.columns_negated
+
+    def resolve(self) -> tuple[set[str], set[str]]:
+        """(extracted, negated), by the same rules as extract_symptoms_nlp."""
+        negated = set(self.mapped_negated)
+        extracted = self.mapped | {
+            col for col in self.columns
+            if col not in self.mapped and col not in negated and col not in self.columns_negated
+        }
+        return extracted - negated, negated
+
+
+def _scan_piece(state: _ScanState, piece: str, evidence: _Evidence) -> _ScanState:
+    """
+    Scan one lowercased piece that follows `state`, adding its phrase
+    hits to `evidence`. Returns the state after the piece.
+    """
+    base = state.length
+    breaks, piece_negations = _markers(piece, base)
+    matches, automaton = PHRASE_AUTOMATON.feed(piece, state.automaton, base)
+
+    break_starts = [start for start, _ in breaks]
+    negations = list(state.negations) + piece_negations
+    negation_ends = [end for _, end in negations]
+    seen = {(phrase, state.clause) for phrase in state.phrases}
+
+    for start, end, phrase in matches:
+        # The last clause break starting before the match ends must end
+        # before it starts, or the match straddles two clauses
+        k = bisect_right(break_starts, end - 1) - 1
+        if k >= 0:
+            clause, clause_start = state.clause + k + 1, breaks[k][1]
+        else:
+            clause, clause_start = state.clause, state.clause_start
+        if start < clause_start or (phrase, clause) in seen:
+            continue
+        seen.add((phrase, clause))
+
+        j = bisect_right(negation_ends, start) - 1
+        negated = j >= 0 and negations[j][0] >= max(clause_start, start - NEGATION_WINDOW)
+
+        col = NLP_PHRASE_MAP.get(phrase)
+        if col is not None:
+            (evidence.mapped_negated if negated else evidence.mapped).add(col)
+        col = _COLUMN_PHRASES.get(phrase)
+        if col is not None:
+            evidence.columns.add(col)
+            if negated and phrase == _READABLE_NAMES[col]:
+                evidence.columns_negated.add(col)
+
+    clause = state.clause + len(breaks)
+    clause_start = breaks[-1][1] if breaks else state.clause_start
+    return _ScanState(
+        length=base + len(piece),
+        automaton=automaton,
+        clause=clause,
+        clause_start=clause_start,
+        phrases=frozenset(phrase for phrase, ci in seen if ci == clause),
+        negations=tuple(n for n in negations if n[0] >= clause_start),
+    )
+
+
+class IncrementalExtractor:
+    """
+    extract_symptoms_nlp for a transcript that arrives in chunks.
+
+    Chunks are joined with a space. A final chunk is committed: it is
+    scanned once and its evidence kept. An interim chunk (a recognizer's
+    current guess at the utterance after the committed text) is scanned
+    on top of the committed state and replaced by the next chunk. Once
+    every chunk is final, `symptoms()` equals extract_symptoms_nlp on the
+    joined transcript.
+    """
+
+    __slots__ = ("_state", "_evidence", "_interim", "_current", "_committed")
+
+    def __init__(self):
+        self._state = _ScanState()
+        self._evidence = _Evidence()
+        self._interim: _Evidence | None = None
+        self._current: dict[str, str] = {}
+        self._committed = False     # any final chunk yet, empty or not
+
+    def _scan(self, text: str, evidence: _Evidence) -> _ScanState:
+        piece = text.lower()
+        # The separator goes in even around empty chunks, as " ".join does;
+        # skipping it would glue the chunks on either side together
+        if self._committed:
+            piece = " " + piece
+        return _scan_piece(self._state, piece, evidence)
+
+    def update(self, text: str, final: bool = True) -> list[dict]:
+        """
+        Add a chunk. Returns the changes it caused, as
+        {"symptom", "op"} dicts with op "add", "negate" or "remove".
+        """
+        if final:
+            self._state = self._scan(text, self._evidence)
+            self._committed = True
+            self._interim = None
+        else:
+            self._interim = _Evidence()
+            self._scan(text, self._interim)
+
+        extracted, negated = self.symptoms()
+        current = {col: "add" for col in extracted}
+        current.update((col, "negate") for col in negated)
+
+        deltas = [
+            {"symptom": col, "op": op}
+            for col, op in sorted(current.items())
+            if self._current.get(col) != op
+        ]
+        deltas += [
+            {"symptom": col, "op": "remove"}
+            for col in sorted(self._current.keys() - current.keys())
+        ]
+        self._current = current
+        return deltas
+
+    def symptoms(self) -> tuple[list[str], list[str]]:
+        """(extracted_symptoms, negated_symptoms) for everything so far."""
+        evidence = self._evidence
+        if self._interim is not None:
+            evidence = _Evidence()
+            evidence.merge(self._evidence)
+            evidence.merge(self._interim)
+        extracted, negated = evidence.resolve()
+        return sorted(extracted), sorted(negated)
@@ -9,25 +9,105 @@ Uses the NLP engine for:
   • direct column-name matching
 """
 
+import re
+
 from app.models import UserProfile, TriageInput
 from app.engine.knowledge_base import (
     SYMPTOM_SYNONYMS,
     HINDI_MARKERS,
     MARATHI_MARKERS,
+    HINDI_DEVANAGARI_MARKERS,
+    MARATHI_DEVANAGARI_MARKERS,
 )
 from app.engine.nlp import extract_symptoms_nlp, NLP_PHRASE_MAP
+from app.engine.translations import DISEASE_NAMES, MEDICAL_PHRASES, SYMPTOM_TRANSLATIONS
 from ml.predictor import get_all_symptoms
 
 
+# ── Language detection ──────────────────────────────────────────────────────
+# One regex pass splits the text into Latin and Devanagari words (dandas
+# and digits excluded) and tells the two scripts apart by the first
+# character of each word. Words, and runs of up to MARKER_MAX_WORDS of
+# them, are looked up in LANGUAGE_MARKERS: marker → ((language, weight), ...).
+# Markers match whole words only, so "sir" no longer fires on "desire".
+
+_WORD_RE = re.compile(r"[a-z]+|[\u0900-\u0963\u0971-\u097f]+")
+_DEVANAGARI_START = "\u0900"
+_DEVANAGARI_RE = re.compile(r"[\u0900-\u097f]")
+
+# Words found in only one language's translation catalog count for less
+# than the hand-picked markers
+CATALOG_MARKER_WEIGHT = 0.5
+# Romanized text needs this much evidence to not be English
+MIN_MARKER_SCORE = 2.0
+
+
+def _catalog_words(language: str) -> set[str]:
+    words = set()
+    for catalog in (SYMPTOM_TRANSLATIONS, DISEASE_NAMES, MEDICAL_PHRASES):
+        for value in catalog.get(language, {}).values():
+            words.update(_WORD_RE.findall(value.lower()))
+    return words
+
+
+def _build_language_markers() -> dict[str, tuple[tuple[str, float], ...]]:
+    weights: dict[str, dict[str, float]] = {}
+
+    hindi, marathi = _catalog_words("hi"), _catalog_words("mr")
+    for language, words in (("hi", hindi - marathi), ("mr", marathi - hindi)):
+        for word in words:
+            if word[0] >= _DEVANAGARI_START:
+                weights[word] = {language: CATALOG_MARKER_WEIGHT}
+
+    curated: dict[str, dict[str, float]] = {}
+    for language, markers in (
+        ("hi", HINDI_MARKERS + HINDI_DEVANAGARI_MARKERS),
+        ("mr", MARATHI_MARKERS + MARATHI_DEVANAGARI_MARKERS),
+    ):
+        for marker in markers:
+            curated.setdefault(marker, {})[language] = 1.0
+    weights.update(curated)
+
+    return {marker: tuple(langs.items()) for marker, langs in weights.items()}
+
+
+LANGUAGE_MARKERS = _build_language_markers()
+MARKER_MAX_WORDS = max(marker.count(" ") + 1 for marker in LANGUAGE_MARKERS)
+# First words of the multi-word markers ("ho" of "ho raha")
+_PHRASE_HEADS = frozenset(marker.split(" ")[0] for marker in LANGUAGE_MARKERS if " " in marker)
+
+
 def detect_language(text: str) -> str:
-    """Detect input language from text using keyword markers."""
-    text_lower = text.lower()
-    hindi_score = sum(1 for w in HINDI_MARKERS if w in text_lower)
-    marathi_score = sum(1 for w in MARATHI_MARKERS if w in text_lower)
+    """
+    Detect input language from text using keyword markers.
 
-    if marathi_score >= 2:
+    Devanagari text is Hindi unless the Marathi markers outweigh the
+    Hindi ones. Latin text is English unless one language's markers add
+    up to MIN_MARKER_SCORE; on a tie Marathi wins.
+    """
+    words = _WORD_RE.findall(text.lower())
+    matched = LANGUAGE_MARKERS.keys() & words
+    for i in [i for i, word in enumerate(words) if word in _PHRASE_HEADS]:
+        for n in range(2, MARKER_MAX_WORDS + 1):
+            key = " ".join(words[i:i + n])
+            if key in LANGUAGE_MARKERS:
+                matched.add(key)
+
+    scores = {"hi": 0.0, "mr": 0.0}
+    for marker in matched:
+        for language, weight in LANGUAGE_MARKERS[marker]:
+            scores[language] += weight
+
+    if _DEVANAGARI_RE.search(text):
+        devanagari = sum(len(word) for word in words if word[0] >= _DEVANAGARI_START)
+        latin = sum(map(len, words)) - devanagari
+    else:
+        devanagari = latin = 0
+    if devanagari > latin:
+        return "mr" if scores["mr"] > scores["hi"] else "hi"
+    if scores["mr"] >= MIN_MARKER_SCORE and scores["mr"] >= scores["hi"]:
         return "mr"
-    if hindi_score >= 2:
+    if scores["hi"] >= MIN_MARKER_SCORE:
         return "hi"
     return "en"
 
@@ -140,9 +220,7 @@ def process_input(data: dict) -> TriageInput:
         user_profile=UserProfile(age=age, gender=gender),
         input_language=language,
         input_method=input_method,
+        negated_symptoms=negated,
     )
 
-    # Attach NLP metadata for pipeline to surface in response
-    triage_input._negated_symptoms = negated  # type: ignore[attr-defined]
-
     return triage_input
@@ -5,6 +5,12 @@ Catches dangerous but subtle symptom patterns often missed by users.
 """
 
 from app.engine.knowledge_base import SILENT_EMERGENCY_PATTERNS
+from app.engine.rules import SymptomRuleIndex
+
+# Patterns indexed by symptom bitmask; age / gender are checked per hit
+SILENT_PATTERN_INDEX = SymptomRuleIndex(
+    (pattern["symptoms"], pattern) for pattern in SILENT_EMERGENCY_PATTERNS
+)
 
 
 def detect_silent_emergency(
@@ -22,23 +28,18 @@ def detect_silent_emergency(
             "risk_pattern_explanation": str
         }
     """
-    symptom_set = set(normalized_symptoms)
     highest_flag = "Low"
     explanations = []
 
     flag_rank = {"Low": 0, "Moderate": 1, "High": 2}
 
-    for pattern in SILENT_EMERGENCY_PATTERNS:
-        required_symptoms = pattern["symptoms"]
+    # Only patterns whose symptoms are all present come back
+    for pattern in SILENT_PATTERN_INDEX.match(normalized_symptoms):
         age_min = pattern.get("age_min")
         gender_req = pattern.get("gender")
         flag = pattern["flag"]
         explanation = pattern["explanation"]
 
-        # Check symptom match
-        if not required_symptoms.issubset(symptom_set):
-            continue
-
         # Check age modifier
         if age_min is not None:
             if age is None or age < age_min:
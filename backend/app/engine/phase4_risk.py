@@ -11,17 +11,27 @@ from app.engine.knowledge_base import (
     MEDIUM_SYMPTOMS,
     LOW_SYMPTOMS,
 )
+from app.engine.rules import SymptomRuleIndex
 from ml.predictor import predict_disease, get_symptom_severity
 
+# Clusters indexed by symptom bitmask
+CLUSTER_INDEX = SymptomRuleIndex(
+    (cluster_symptoms, cluster) for cluster_symptoms, *cluster in HIGH_RISK_CLUSTERS
+)
+
 
 def classify_risk(
     normalized_symptoms: list[str],
     neglect_detected: str,
     silent_risk_flag: str,
+    ml_result: dict | None = None,
 ) -> dict:
     """
     Combine all signals to assign a risk level.
 
+    `ml_result` may be passed in when the prediction was already made as
+    part of a batch; otherwise the ML model is queried here.
+
     Returns:
         {
             "risk_level": "Low" | "Medium" | "High",
@@ -37,7 +47,8 @@ def classify_risk(
         }
 
     # ── 1. ML Prediction ────────────────────────────────────────────────
-    ml_result = predict_disease(normalized_symptoms)
+    if ml_result is None:
+        ml_result = predict_disease(normalized_symptoms)
     ml_severity = ml_result.get("severity_tier", "Low")
     ml_confidence = ml_result.get("confidence", 0)
 
@@ -52,10 +63,9 @@ def classify_risk(
         rule_risk = "Medium"
 
     # Check cluster matches
-    for cluster_symptoms, cluster_severity, _ in HIGH_RISK_CLUSTERS:
-        if cluster_symptoms.issubset(symptom_set):
-            if _severity_rank(cluster_severity) > _severity_rank(rule_risk):
-                rule_risk = cluster_severity
+    for cluster_severity, _ in CLUSTER_INDEX.match(symptom_set):
+        if _severity_rank(cluster_severity) > _severity_rank(rule_risk):
+            rule_risk = cluster_severity
 
     # ── 3. Weighted severity score from symptom weights ─────────────────
     total_weight = sum(get_symptom_severity(s) for s in normalized_symptoms)
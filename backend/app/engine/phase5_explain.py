@@ -2,29 +2,66 @@
 Phase 5: Explainability-First Risk Narratives
 ===============================================
 Generates human-readable explanations in 3 sections.
+Fixed sentences come pre-rendered from the narrative catalog.
 """
 
+from app.engine.narratives import localize, register_fragments
+from app.engine.translations import translate_full_text
 
-def generate_explanation(
+NEGLECT_NOTICED = (
+    "We also noticed that the way you described your symptoms "
+    "may be underestimating their significance."
+)
+
+MATTERS_FALLBACK = {
+    "Low": "Your symptoms appear to be mild based on the patterns we analyzed.",
+    "Medium": "Some of your symptoms may benefit from professional evaluation.",
+    "High": (
+        "The combination of symptoms you described can sometimes "
+        "be associated with conditions that need prompt attention."
+    ),
+}
+
+WHAT_THIS_MEANS = {
+    "High": (
+        "Based on the overall pattern, we recommend seeking medical "
+        "attention as soon as possible. This is a precautionary recommendation, "
+        "not a diagnosis."
+    ),
+    "Medium": (
+        "We recommend consulting a healthcare professional within the "
+        "next 24-48 hours. In the meantime, monitor your symptoms closely "
+        "and seek immediate care if they worsen."
+    ),
+    "Low": (
+        "Your symptoms appear manageable with self-care for now. "
+        "However, if symptoms persist or worsen, please consult a "
+        "healthcare professional."
+    ),
+}
+
+register_fragments(*MATTERS_FALLBACK.values(), *WHAT_THIS_MEANS.values())
+
+
+def disease_association(disease: str) -> str:
+    """Sentence linking the symptom pattern to a predicted condition."""
+    return (
+        f"Based on your symptom pattern, this can sometimes be "
+        f"associated with conditions like {disease}."
+    )
+
+
+def describe_what_we_noticed(
     normalized_symptoms: list[str],
-    risk_level: str,
     neglect_detected: str,
-    neglect_reason: str,
-    silent_risk_flag: str,
-    risk_pattern_explanation: str,
-    ml_prediction: dict | None,
     age: int | None = None,
-    gender: str | None = None,
-) -> dict:
+    language: str = "en",
+) -> str:
     """
-    Build a 3-part explanation:
-      - "What we noticed"
-      - "Why it matters"
-      - "What this means for you"
-
-    Returns: dict with the 3 keys.
+    Build the "What we noticed" section. This is the only part of the
+    explanation that carries the exact age, so it is always translated
+    on the fly.
     """
-    # ── What we noticed ─────────────────────────────────────────────────
     symptom_names = [s.replace("_", " ") for s in normalized_symptoms]
     noticed_parts = []
 
@@ -37,12 +74,36 @@ def generate_explanation(
         noticed_parts.append(f"Your age is {age}.")
 
     if neglect_detected == "Yes":
-        noticed_parts.append(
-            "We also noticed that the way you described your symptoms "
-            "may be underestimating their significance."
-        )
+        noticed_parts.append(NEGLECT_NOTICED)
 
     what_we_noticed = " ".join(noticed_parts) if noticed_parts else "No symptoms were reported."
+    return translate_full_text(what_we_noticed, language)
+
+
+def generate_explanation(
+    normalized_symptoms: list[str],
+    risk_level: str,
+    neglect_detected: str,
+    neglect_reason: str,
+    silent_risk_flag: str,
+    risk_pattern_explanation: str,
+    ml_prediction: dict | None,
+    age: int | None = None,
+    gender: str | None = None,
+    language: str = "en",
+) -> dict:
+    """
+    Build a 3-part explanation:
+      - "What we noticed"
+      - "Why it matters"
+      - "What this means for you"
+
+    Returns: dict with the 3 keys, already in `language`.
+    """
+    # ── What we noticed ─────────────────────────────────────────────────
+    what_we_noticed = describe_what_we_noticed(
+        normalized_symptoms, neglect_detected, age, language=language
+    )
 
     # ── Why it matters ──────────────────────────────────────────────────
     matters_parts = []
@@ -55,10 +116,7 @@ def generate_explanation(
         confidence = ml_prediction.get("confidence", 0)
         description = ml_prediction.get("disease_description", "")
         if disease and confidence >= 0.5:
-            matters_parts.append(
-                f"Based on your symptom pattern, this can sometimes be "
-                f"associated with conditions like {disease}."
-            )
+            matters_parts.append(disease_association(disease))
             if description:
                 matters_parts.append(description)
 
@@ -66,41 +124,16 @@ def generate_explanation(
         matters_parts.append(neglect_reason)
 
     if not matters_parts:
-        if risk_level == "Low":
-            matters_parts.append(
-                "Your symptoms appear to be mild based on the patterns we analyzed."
-            )
-        elif risk_level == "Medium":
-            matters_parts.append(
-                "Some of your symptoms may benefit from professional evaluation."
-            )
-        else:
-            matters_parts.append(
-                "The combination of symptoms you described can sometimes "
-                "be associated with conditions that need prompt attention."
-            )
-
-    why_it_matters = " ".join(matters_parts)
+        matters_parts.append(
+            MATTERS_FALLBACK.get(risk_level, MATTERS_FALLBACK["High"])
+        )
+
+    why_it_matters = " ".join(localize(part, language) for part in matters_parts)
 
     # ── What this means for you ─────────────────────────────────────────
-    if risk_level == "High":
-        what_this_means = (
-            "Based on the overall pattern, we recommend seeking medical "
-            "attention as soon as possible. This is a precautionary recommendation, "
-            "not a diagnosis."
-        )
-    elif risk_level == "Medium":
-        what_this_means = (
-            "We recommend consulting a healthcare professional within the "
-            "next 24-48 hours. In the meantime, monitor your symptoms closely "
-            "and seek immediate care if they worsen."
-        )
-    else:
-        what_this_means = (
-            "Your symptoms appear manageable with self-care for now. "
-            "However, if symptoms persist or worsen, please consult a "
-            "healthcare professional."
-        )
+    what_this_means = localize(
+        WHAT_THIS_MEANS.get(risk_level, WHAT_THIS_MEANS["Low"]), language
+    )
 
     return {
         "what_we_noticed": what_we_noticed,
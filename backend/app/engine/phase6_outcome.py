@@ -2,13 +2,67 @@
 Phase 6: Outcome Awareness – "What if I ignore this?"
 =======================================================
 Bridges risk awareness → action ethically.
+Text comes pre-rendered from the narrative catalog.
 """
 
+from app.engine.narratives import localize, register_fragments
+
+HIGH_SHORT_TERM = (
+    "In some cases, delaying care for these symptoms could lead to "
+    "rapid worsening. Conditions associated with these patterns "
+    "may progress quickly and benefit greatly from early intervention."
+)
+
+CHEST_ADDENDUM = (
+    " Chest-related symptoms in particular may indicate "
+    "time-sensitive conditions where every hour matters."
+)
+
+HIGH_LONG_TERM = (
+    "Over time, untreated symptoms of this severity could potentially "
+    "lead to complications that are harder to manage. Early detection "
+    "and treatment generally lead to better outcomes."
+)
+
+MEDIUM_SHORT_TERM = (
+    "If left unattended, these symptoms may persist or gradually "
+    "worsen over the next few days. Some conditions start mild but "
+    "can escalate if not properly evaluated."
+)
+
+MEDIUM_LONG_TERM = (
+    "Prolonged neglect of these symptoms could potentially lead to "
+    "chronic issues or complications. A timely check-up can help "
+    "prevent this."
+)
+
+LOW_SHORT_TERM = (
+    "These symptoms are generally self-limiting and may improve "
+    "with rest and basic self-care within a few days."
+)
+
+LOW_LONG_TERM = (
+    "If symptoms persist beyond a week or new symptoms develop, "
+    "it would be wise to consult a healthcare professional to rule "
+    "out any underlying causes."
+)
+
+register_fragments(
+    HIGH_SHORT_TERM,
+    HIGH_SHORT_TERM + CHEST_ADDENDUM,
+    HIGH_LONG_TERM,
+    MEDIUM_SHORT_TERM,
+    MEDIUM_LONG_TERM,
+    LOW_SHORT_TERM,
+    LOW_LONG_TERM,
+)
+
 
 def generate_outcome_awareness(
     risk_level: str,
     normalized_symptoms: list[str],
     ml_prediction: dict | None = None,
+    language: str = "en",
 ) -> dict:
     """
     Describe possible consequences of delaying care.
@@ -18,59 +72,30 @@ def generate_outcome_awareness(
             "short_term": str,
             "long_term": str
         }
+        already in `language`.
     """
-    severity_tier = ""
-    if ml_prediction:
-        severity_tier = ml_prediction.get("severity_tier", "Low")
-
     symptom_set = set(normalized_symptoms)
 
     # ── High Risk ───────────────────────────────────────────────────────
     if risk_level == "High":
-        short_term = (
-            "In some cases, delaying care for these symptoms could lead to "
-            "rapid worsening. Conditions associated with these patterns "
-            "may progress quickly and benefit greatly from early intervention."
-        )
+        short_term = HIGH_SHORT_TERM
 
         if "chest_pain" in symptom_set or "breathlessness" in symptom_set:
-            short_term += (
-                " Chest-related symptoms in particular may indicate "
-                "time-sensitive conditions where every hour matters."
-            )
+            short_term += CHEST_ADDENDUM
 
-        long_term = (
-            "Over time, untreated symptoms of this severity could potentially "
-            "lead to complications that are harder to manage. Early detection "
-            "and treatment generally lead to better outcomes."
-        )
+        long_term = HIGH_LONG_TERM
 
     # ── Medium Risk ─────────────────────────────────────────────────────
     elif risk_level == "Medium":
-        short_term = (
-            "If left unattended, these symptoms may persist or gradually "
-            "worsen over the next few days. Some conditions start mild but "
-            "can escalate if not properly evaluated."
-        )
-        long_term = (
-            "Prolonged neglect of these symptoms could potentially lead to "
-            "chronic issues or complications. A timely check-up can help "
-            "prevent this."
-        )
+        short_term = MEDIUM_SHORT_TERM
+        long_term = MEDIUM_LONG_TERM
 
     # ── Low Risk ────────────────────────────────────────────────────────
     else:
-        short_term = (
-            "These symptoms are generally self-limiting and may improve "
-            "with rest and basic self-care within a few days."
-        )
-        long_term = (
-            "If symptoms persist beyond a week or new symptoms develop, "
-            "it would be wise to consult a healthcare professional to rule "
-            "out any underlying causes."
-        )
+        short_term = LOW_SHORT_TERM
+        long_term = LOW_LONG_TERM
 
     return {
-        "short_term": short_term,
-        "long_term": long_term,
+        "short_term": localize(short_term, language),
+        "long_term": localize(long_term, language),
     }
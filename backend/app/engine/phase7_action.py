@@ -2,66 +2,77 @@
 Phase 7: Actionable Recommendations
 =====================================
 Tells the user what to do next based on risk level.
+Text comes pre-rendered from the narrative catalog.
 """
 
+from app.engine.narratives import localize, register_fragments
+
+ACTION_BLOCKS = {
+    "High": (
+        "⚠️ IMMEDIATE ACTION RECOMMENDED:\n"
+        "• Please seek medical attention as soon as possible.\n"
+        "• Visit the nearest hospital or call emergency services.\n"
+        "• Do not drive yourself — ask someone to take you or call an ambulance.\n"
+        "• Stay calm and avoid physical exertion until you receive medical help."
+    ),
+    "Medium": (
+        "📋 CONSULTATION RECOMMENDED:\n"
+        "• Schedule a doctor's appointment within the next 24-48 hours.\n"
+        "• Monitor your symptoms closely — note any changes.\n"
+        "• Seek immediate care if symptoms suddenly worsen."
+        "\n"
+        "\n🔍 WARNING SIGNS TO WATCH:\n"
+        "• Sudden increase in severity\n"
+        "• New symptoms appearing (especially difficulty breathing, "
+        "chest pain, or confusion)\n"
+        "• Symptoms not improving after 48 hours"
+    ),
+    "Low": (
+        "🟢 SELF-CARE GUIDANCE:\n"
+        "• Get adequate rest and stay hydrated.\n"
+        "• Monitor your symptoms over the next few days.\n"
+        "• Use over-the-counter remedies only as directed.\n"
+        "• Consult a doctor if symptoms persist beyond a week."
+    ),
+}
+
+DISCLAIMER = (
+    "\n⚕️ IMPORTANT: This is not a medical diagnosis. "
+    "Please consult a qualified healthcare professional for proper evaluation."
+)
+
+register_fragments(*ACTION_BLOCKS.values(), DISCLAIMER)
+
+
+def precautions_block(precautions: list[str]) -> str:
+    """Disease-specific precautions section ("" when there are none)."""
+    if not precautions:
+        return ""
+    prec_list = "\n".join(f"• {p.strip().capitalize()}" for p in precautions if p)
+    return f"\n📌 SPECIFIC PRECAUTIONS:\n{prec_list}"
+
 
 def generate_recommendations(
     risk_level: str,
     ml_prediction: dict | None = None,
+    language: str = "en",
 ) -> str:
     """
     Generate actionable next steps.
 
-    Returns: recommendation string
+    Returns: recommendation string, already in `language`
     """
     precautions = []
     if ml_prediction:
         precautions = ml_prediction.get("precautions", [])
 
-    parts = []
-
-    if risk_level == "High":
-        parts.append(
-            "⚠️ IMMEDIATE ACTION RECOMMENDED:\n"
-            "• Please seek medical attention as soon as possible.\n"
-            "• Visit the nearest hospital or call emergency services.\n"
-            "• Do not drive yourself — ask someone to take you or call an ambulance.\n"
-            "• Stay calm and avoid physical exertion until you receive medical help."
-        )
-
-    elif risk_level == "Medium":
-        parts.append(
-            "📋 CONSULTATION RECOMMENDED:\n"
-            "• Schedule a doctor's appointment within the next 24-48 hours.\n"
-            "• Monitor your symptoms closely — note any changes.\n"
-            "• Seek immediate care if symptoms suddenly worsen."
-        )
-        parts.append(
-            "\n🔍 WARNING SIGNS TO WATCH:\n"
-            "• Sudden increase in severity\n"
-            "• New symptoms appearing (especially difficulty breathing, "
-            "chest pain, or confusion)\n"
-            "• Symptoms not improving after 48 hours"
-        )
-
-    else:  # Low
-        parts.append(
-            "🟢 SELF-CARE GUIDANCE:\n"
-            "• Get adequate rest and stay hydrated.\n"
-            "• Monitor your symptoms over the next few days.\n"
-            "• Use over-the-counter remedies only as directed.\n"
-            "• Consult a doctor if symptoms persist beyond a week."
-        )
+    parts = [ACTION_BLOCKS.get(risk_level, ACTION_BLOCKS["Low"])]
 
     # Add disease-specific precautions from dataset
     if precautions:
-        prec_list = "\n".join(f"• {p.strip().capitalize()}" for p in precautions if p)
-        parts.append(f"\n📌 SPECIFIC PRECAUTIONS:\n{prec_list}")
+        parts.append(precautions_block(precautions))
 
     # Always add disclaimer
-    parts.append(
-        "\n⚕️ IMPORTANT: This is not a medical diagnosis. "
-        "Please consult a qualified healthcare professional for proper evaluation."
-    )
+    parts.append(DISCLAIMER)
 
-    return "\n".join(parts)
+    return "\n".join(localize(part, language) for part in parts)
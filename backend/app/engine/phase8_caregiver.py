@@ -2,46 +2,69 @@
 Phase 8: Family / Caregiver Escalation Logic
 ==============================================
 Suggests involving a trusted person for high-risk cases.
+Text comes pre-rendered from the narrative catalog.
 """
 
+from app.engine.narratives import localize, register_fragments
 
-def evaluate_caregiver_alert(risk_level: str, age: int | None = None) -> dict:
+# Age thresholds for caregiver involvement
+ELDERLY_HIGH_RISK_AGE = 60
+ELDERLY_MEDIUM_RISK_AGE = 65
+
+HIGH_RISK_REASON = (
+    "Given the urgency of your symptoms, we strongly recommend "
+    "informing a trusted family member, friend, or caregiver. "
+    "Having someone aware of your situation can help ensure you "
+    "receive timely assistance, especially if symptoms worsen."
+)
+
+ELDERLY_ADDENDUM = (
+    " This is particularly important for individuals above 60, "
+    "where prompt support can make a significant difference."
+)
+
+MEDIUM_RISK_ELDERLY_REASON = (
+    "As a precaution, it may be helpful to let a family member "
+    "or caregiver know about your symptoms so they can assist "
+    "with your doctor's visit if needed."
+)
+
+register_fragments(
+    HIGH_RISK_REASON,
+    HIGH_RISK_REASON + ELDERLY_ADDENDUM,
+    MEDIUM_RISK_ELDERLY_REASON,
+)
+
+
+def evaluate_caregiver_alert(
+    risk_level: str,
+    age: int | None = None,
+    language: str = "en",
+) -> dict:
     """
     Determine if caregiver involvement should be suggested.
 
     Returns:
         {
             "caregiver_alert_suggestion": "Yes" | "No",
-            "caregiver_reason": str
+            "caregiver_reason": str (already in `language`)
         }
     """
     if risk_level == "High":
-        reason = (
-            "Given the urgency of your symptoms, we strongly recommend "
-            "informing a trusted family member, friend, or caregiver. "
-            "Having someone aware of your situation can help ensure you "
-            "receive timely assistance, especially if symptoms worsen."
-        )
-
-        if age and age >= 60:
-            reason += (
-                " This is particularly important for individuals above 60, "
-                "where prompt support can make a significant difference."
-            )
+        reason = HIGH_RISK_REASON
+
+        if age and age >= ELDERLY_HIGH_RISK_AGE:
+            reason += ELDERLY_ADDENDUM
 
         return {
             "caregiver_alert_suggestion": "Yes",
-            "caregiver_reason": reason,
+            "caregiver_reason": localize(reason, language),
         }
 
-    if risk_level == "Medium" and age and age >= 65:
+    if risk_level == "Medium" and age and age >= ELDERLY_MEDIUM_RISK_AGE:
         return {
             "caregiver_alert_suggestion": "Yes",
-            "caregiver_reason": (
-                "As a precaution, it may be helpful to let a family member "
-                "or caregiver know about your symptoms so they can assist "
-                "with your doctor's visit if needed."
-            ),
+            "caregiver_reason": localize(MEDIUM_RISK_ELDERLY_REASON, language),
         }
 
     return {
@@ -7,6 +7,7 @@ Includes medical keyword translations.
 """
 
 import re
+from app.engine.narratives import localize
 from app.engine.translations import (
     translate_disease_name,
     translate_symptom,
@@ -76,11 +77,19 @@ TRANSLATIONS = {
 }
 
 
-def localize_response(response: dict, language: str) -> dict:
+def localize_response(
+    response: dict,
+    language: str,
+    narratives_localized: bool = False,
+) -> dict:
     """
     Translate key fields in the response dict to the target language.
     English responses are returned as-is.
     Translates disease names, symptoms, descriptions, and all medical keywords.
+
+    With `narratives_localized=True` the Phase 5–8 text fields (explanation,
+    what_if_ignored, recommended_action, caregiver_reason) are taken to be
+    in `language` already and are left alone.
     """
     if language == "en" or language not in TRANSLATIONS:
         return response
@@ -131,8 +140,8 @@ def localize_response(response: dict, language: str) -> dict:
         ]
 
     # ── Translate explanations ───────────────────────────────────────────────
-    if "explanation" in localized and isinstance(localized["explanation"], dict):
-        explanation = localized["explanation"]
+    explanation = localized.get("explanation")
+    if not narratives_localized and isinstance(explanation, dict):
         if "what_we_noticed" in explanation:
             explanation["what_we_noticed"] = translate_full_text(
                 explanation["what_we_noticed"], language
@@ -148,7 +157,7 @@ def localize_response(response: dict, language: str) -> dict:
 
     # ── Translate risk pattern explanation ────────────────────────────────────
     if "risk_pattern_explanation" in localized:
-        localized["risk_pattern_explanation"] = translate_full_text(
+        localized["risk_pattern_explanation"] = localize(
             localized["risk_pattern_explanation"], language
         )
 
@@ -159,13 +168,13 @@ def localize_response(response: dict, language: str) -> dict:
         )
 
     # ── Translate caregiver reason ────────────────────────────────────────────
-    if "caregiver_reason" in localized:
+    if "caregiver_reason" in localized and not narratives_localized:
         localized["caregiver_reason"] = translate_full_text(
             localized["caregiver_reason"], language
         )
 
     # ── Translate what_if_ignored ────────────────────────────────────────────
-    if "what_if_ignored" in localized and isinstance(localized["what_if_ignored"], dict):
+    if not narratives_localized and isinstance(localized.get("what_if_ignored"), dict):
         if "short_term" in localized["what_if_ignored"]:
             localized["what_if_ignored"]["short_term"] = translate_full_text(
                 localized["what_if_ignored"]["short_term"], language
@@ -176,7 +185,7 @@ def localize_response(response: dict, language: str) -> dict:
             )
 
     # ── Translate recommended action ──────────────────────────────────────────
-    if "recommended_action" in localized:
+    if "recommended_action" in localized and not narratives_localized:
         localized["recommended_action"] = translate_full_text(
             localized["recommended_action"], language
         )
@@ -203,3 +212,47 @@ def localize_response(response: dict, language: str) -> dict:
             ]
 
     return localized
+
+
+def localize_result(result, language: str):
+    """
+    Translate a pipeline TriageResult to `language` in place (no copies).
+
+    Same translations as `localize_response(..., narratives_localized=True)`:
+    Phases 5–8 already wrote their text in `language`, so only labels,
+    disease and symptom names and the Phase 2–3 reasons are translated.
+    """
+    if language == "en" or language not in TRANSLATIONS:
+        return result
+
+    t = TRANSLATIONS[language]
+    result.risk_level = t.get(result.risk_level, result.risk_level)
+    result.confidence_band = t.get(result.confidence_band, result.confidence_band)
+    result.neglect_detected = t.get(result.neglect_detected, result.neglect_detected)
+    result.caregiver_alert_suggestion = t.get(
+        result.caregiver_alert_suggestion, result.caregiver_alert_suggestion
+    )
+    result.silent_emergency_flag = t.get(result.silent_emergency_flag, result.silent_emergency_flag)
+    result.disclaimer = t.get("disclaimer", result.disclaimer)
+
+    if result.predicted_condition:
+        result.predicted_condition = translate_disease_name(result.predicted_condition, language)
+    if result.top_3_conditions:
+        result.top_3_conditions = [
+            (translate_disease_name(disease, language), prob)
+            for disease, prob in result.top_3_conditions
+        ]
+
+    result.risk_pattern_explanation = localize(result.risk_pattern_explanation, language)
+    result.neglect_reason = translate_full_text(result.neglect_reason, language)
+
+    if result.nlp is not None:
+        nlp = result.nlp
+        nlp["extracted_symptoms"] = [translate_symptom(s, language) for s in nlp["extracted_symptoms"]]
+        nlp["negated_symptoms"] = [translate_symptom(s, language) for s in nlp["negated_symptoms"]]
+    summary = result.input_summary
+    if "normalized_symptoms" in summary:
+        summary["normalized_symptoms"] = [
+            translate_symptom(s, language) for s in summary["normalized_symptoms"]
+        ]
+    return result
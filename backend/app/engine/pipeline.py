@@ -1,19 +1,83 @@
 """
 Triage Pipeline – Orchestrator
 ================================
-Runs Phase 1 → Phase 9 sequentially and builds the final TriageResult.
+Runs Phase 1 → Phase 9 sequentially and fills in the final TriageResult.
+Batches share a single ML inference call per chunk of records.
+Results are cached on the canonical post-Phase-1 state (see `_cache_key`);
+cached results are shared and never modified.
 """
 
+from bisect import bisect_right
+from contextlib import contextmanager
+from itertools import islice
+from threading import local
+from time import perf_counter
+
 from app.models import TriageInput, TriageResult
 from app.engine.phase1_input import process_input
 from app.engine.phase2_neglect import detect_neglect
 from app.engine.phase3_silent import detect_silent_emergency
 from app.engine.phase4_risk import classify_risk
-from app.engine.phase5_explain import generate_explanation
+from app.engine.cache import TriageCache
+from app.engine.instrumentation import NULL_TRACE, start_trace, record, is_enabled
+from app.engine.knowledge_base import SILENT_EMERGENCY_PATTERNS
+from app.engine.phase5_explain import generate_explanation, describe_what_we_noticed
 from app.engine.phase6_outcome import generate_outcome_awareness
 from app.engine.phase7_action import generate_recommendations
-from app.engine.phase8_caregiver import evaluate_caregiver_alert
-from app.engine.phase9_language import localize_response
+from app.engine.phase8_caregiver import (
+    evaluate_caregiver_alert,
+    ELDERLY_HIGH_RISK_AGE,
+    ELDERLY_MEDIUM_RISK_AGE,
+)
+from app.engine.phase9_language import localize_result
+from app.engine.narratives import build_catalog
+from app.engine.translations import translate_symptom
+from ml.predictor import predict_disease_batch
+
+DEFAULT_BATCH_CHUNK_SIZE = 64
+DEFAULT_CACHE_SIZE = 1024
+
+# Every age threshold any phase branches on. Ages falling between the
+# same two boundaries produce identical results apart from the age itself.
+AGE_BUCKET_BOUNDARIES: list[int] = sorted(
+    {p["age_min"] for p in SILENT_EMERGENCY_PATTERNS if p.get("age_min") is not None}
+    | {ELDERLY_HIGH_RISK_AGE, ELDERLY_MEDIUM_RISK_AGE}
+)
+
+_cache = TriageCache(DEFAULT_CACHE_SIZE)
+_thread = local()
+
+# Pre-render every Phase 5–8 narrative fragment in all languages
+build_catalog()
+
+
+def configure_cache(maxsize: int) -> None:
+    """Set the result cache capacity (0 disables caching)."""
+    _cache.resize(maxsize)
+
+
+def get_cache_stats() -> dict:
+    """Return size, capacity and hit / miss / eviction counters."""
+    return _cache.stats()
+
+
+def clear_cache() -> None:
+    """Empty the result cache and reset its counters."""
+    _cache.clear()
+
+
+@contextmanager
+def private_cache():
+    """
+    Send this thread's cache lookups to a throwaway cache of the same
+    size for the duration; the shared cache and its counters never see
+    them (used for synthetic warm-up traffic).
+    """
+    _thread.cache = TriageCache(_cache.maxsize)
+    try:
+        yield
+    finally:
+        del _thread.cache
 
 
 def run_triage(data: dict) -> dict:
@@ -22,44 +86,149 @@ def run_triage(data: dict) -> dict:
 
     Args:
         data: Raw request dict with age, gender, symptoms, etc.
+              A truthy "debug" key adds per-phase timings to the response.
 
     Returns:
         Final response dict ready for JSON serialization.
     """
+    return run_triage_result(data).to_dict()
+
+
+def run_triage_result(data: dict) -> TriageResult:
+    """Execute the full triage pipeline and return the TriageResult itself."""
+    debug = bool(data.get("debug"))
+    trace = start_trace(debug)
 
     # ── Phase 1: Input Parsing ──────────────────────────────────────────
     triage_input: TriageInput = process_input(data)
+    trace.mark("phase1_input")
+
+    result = _run_phases(triage_input, trace=trace)
+    return _finish_trace(result, trace, debug)
+
+
+def _finish_trace(result: TriageResult, trace, debug: bool) -> TriageResult:
+    """Close the trace and, if asked for, attach its timings to the result."""
+    timings = trace.finish()
+    if debug:
+        result.debug = {
+            "timings_ms": {phase: round(ms, 4) for phase, ms in timings.items()},
+        }
+    return result
+
+
+def run_triage_batch(records, chunk_size: int = DEFAULT_BATCH_CHUNK_SIZE):
+    """
+    Execute the triage pipeline over many records.
+
+    Records are consumed lazily in chunks of `chunk_size`; each chunk runs
+    Phase 1 per record, then one batched ML prediction, then Phases 2–9.
+    Results are yielded one by one, in input order. A record that is not
+    a dict, has no symptoms, or fails during processing yields an error
+    entry instead of aborting the batch; if a chunk's ML prediction
+    fails, each of its records that needed one does.
+
+    Args:
+        records: Iterable of raw request dicts.
+        chunk_size: Number of records sharing one ML inference call.
+
+    Yields:
+        TriageResult objects, or {"error": str, ...} entries.
+    """
+    records = iter(records)
+    while True:
+        chunk = list(islice(records, chunk_size))
+        if not chunk:
+            return
 
+        inputs = []
+        traces = []
+        for data in chunk:
+            if not isinstance(data, dict):
+                inputs.append({"error": "Invalid triage record"})
+                continue
+            if not data.get("symptoms") and not data.get("raw_text"):
+                inputs.append({"error": "Please provide symptoms or raw_text"})
+                continue
+            debug = bool(data.get("debug"))
+            trace = start_trace(debug)
+            try:
+                inputs.append(process_input(data))
+            except Exception as e:
+                inputs.append({"error": "An internal error occurred", "detail": str(e)})
+                continue
+            trace.mark("phase1_input")
+            traces.append((trace, debug))
+
+        to_predict = [
+            ti.normalized_symptoms for ti in inputs
+            if isinstance(ti, TriageInput) and ti.normalized_symptoms
+        ]
+        start = perf_counter()
+        try:
+            predictions = iter(predict_disease_batch(to_predict))
+            ml_error = None
+        except Exception as e:
+            predictions = None
+            ml_error = {"error": "An internal error occurred", "detail": str(e)}
+        if is_enabled() and to_predict:
+            record({"ml_batch": (perf_counter() - start) * 1000})
+
+        traces = iter(traces)
+        for ti in inputs:
+            if not isinstance(ti, TriageInput):
+                yield ti
+                continue
+            trace, debug = next(traces)
+            if ti.normalized_symptoms and ml_error is not None:
+                yield dict(ml_error)
+                continue
+            ml_result = next(predictions) if ti.normalized_symptoms else None
+            trace.skip()
+            try:
+                result = _run_phases(ti, ml_result, trace=trace)
+            except Exception as e:
+                yield {"error": "An internal error occurred", "detail": str(e)}
+                continue
+            yield _finish_trace(result, trace, debug)
+
+
+def _run_phases(
+    triage_input: TriageInput,
+    ml_result: dict | None = None,
+    trace=NULL_TRACE,
+) -> TriageResult:
+    """Run Phases 2–9 on a parsed input and fill in its TriageResult."""
     if not triage_input.normalized_symptoms:
-        return {
-            "risk_level": "Low",
-            "confidence_band": "low",
-            "explanation": {
+        return TriageResult(
+            explanation={
                 "what_we_noticed": "No recognizable symptoms were provided.",
                 "why_it_matters": "We could not perform a meaningful assessment.",
                 "what_this_means": "Please try again with specific symptoms.",
             },
-            "neglect_detected": "No",
-            "neglect_reason": "",
-            "silent_emergency_flag": "Low",
-            "risk_pattern_explanation": "",
-            "what_if_ignored": {"short_term": "", "long_term": ""},
-            "recommended_action": "Please provide your symptoms for assessment.",
-            "predicted_condition": "",
-            "ml_confidence": 0,
-            "top_3_conditions": [],
-            "caregiver_alert_suggestion": "No",
-            "caregiver_reason": "",
-            "language": triage_input.input_language,
-            "input_summary": triage_input.to_dict(),
-            "disclaimer": "This is not a medical diagnosis. Please consult a healthcare professional.",
-        }
+            what_if_ignored={"short_term": "", "long_term": ""},
+            recommended_action="Please provide your symptoms for assessment.",
+            language=triage_input.input_language,
+            input_summary=triage_input.to_dict(),
+        )
 
     # ── Phase 2: Neglect Detection ──────────────────────────────────────
     neglect = detect_neglect(
         triage_input.raw_symptoms,
         triage_input.normalized_symptoms,
     )
+    trace.mark("phase2_neglect")
+
+    # ── Cache lookup ────────────────────────────────────────────────────
+    cache = getattr(_thread, "cache", _cache)
+    key = _cache_key(triage_input, neglect) if cache.enabled else None
+    if key is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            result = _personalize(cached, triage_input, neglect)
+            trace.mark("cache_hit")
+            return result
+    trace.mark("cache_lookup")
 
     # ── Phase 3: Silent Emergency Detection ─────────────────────────────
     silent = detect_silent_emergency(
@@ -67,15 +236,21 @@ def run_triage(data: dict) -> dict:
         age=triage_input.user_profile.age,
         gender=triage_input.user_profile.gender,
     )
+    trace.mark("phase3_silent")
 
     # ── Phase 4: Risk Classification ────────────────────────────────────
     risk = classify_risk(
         triage_input.normalized_symptoms,
         neglect["neglect_detected"],
         silent["silent_risk_flag"],
+        ml_result=ml_result,
     )
 
     ml_prediction = risk.get("ml_prediction")
+    trace.mark("phase4_risk")
+
+    # Phases 5–8 emit text in the response language directly
+    language = triage_input.input_language
 
     # ── Phase 5: Explainability ─────────────────────────────────────────
     explanation = generate_explanation(
@@ -88,57 +263,126 @@ def run_triage(data: dict) -> dict:
         ml_prediction,
         age=triage_input.user_profile.age,
         gender=triage_input.user_profile.gender,
+        language=language,
     )
+    trace.mark("phase5_explain")
 
     # ── Phase 6: Outcome Awareness ──────────────────────────────────────
     outcome = generate_outcome_awareness(
         risk["risk_level"],
         triage_input.normalized_symptoms,
         ml_prediction,
+        language=language,
     )
+    trace.mark("phase6_outcome")
 
     # ── Phase 7: Recommendations ────────────────────────────────────────
     action = generate_recommendations(
         risk["risk_level"],
         ml_prediction,
+        language=language,
     )
+    trace.mark("phase7_action")
 
     # ── Phase 8: Caregiver Escalation ───────────────────────────────────
     caregiver = evaluate_caregiver_alert(
         risk["risk_level"],
         age=triage_input.user_profile.age,
+        language=language,
     )
+    trace.mark("phase8_caregiver")
 
-    # ── Build response ──────────────────────────────────────────────────
-    # NLP metadata
-    negated = getattr(triage_input, '_negated_symptoms', [])
-
-    response = {
-        "risk_level": risk["risk_level"],
-        "confidence_band": risk["confidence_band"],
-        "explanation": explanation,
-        "neglect_detected": neglect["neglect_detected"],
-        "neglect_reason": neglect["neglect_reason"],
-        "silent_emergency_flag": silent["silent_risk_flag"],
-        "risk_pattern_explanation": silent["risk_pattern_explanation"],
-        "what_if_ignored": outcome,
-        "recommended_action": action,
-        "predicted_condition": ml_prediction.get("predicted_disease", "") if ml_prediction else "",
-        "ml_confidence": ml_prediction.get("confidence", 0) if ml_prediction else 0,
-        "top_3_conditions": ml_prediction.get("top_3", []) if ml_prediction else [],
-        "caregiver_alert_suggestion": caregiver["caregiver_alert_suggestion"],
-        "caregiver_reason": caregiver["caregiver_reason"],
-        "language": triage_input.input_language,
-        "input_summary": triage_input.to_dict(),
-        "nlp": {
+    # ── Build result ────────────────────────────────────────────────────
+    result = TriageResult(
+        risk_level=risk["risk_level"],
+        confidence_band=risk["confidence_band"],
+        explanation=explanation,
+        neglect_detected=neglect["neglect_detected"],
+        neglect_reason=neglect["neglect_reason"],
+        silent_emergency_flag=silent["silent_risk_flag"],
+        risk_pattern_explanation=silent["risk_pattern_explanation"],
+        what_if_ignored=outcome,
+        recommended_action=action,
+        caregiver_alert_suggestion=caregiver["caregiver_alert_suggestion"],
+        caregiver_reason=caregiver["caregiver_reason"],
+        language=language,
+        input_summary=triage_input.to_dict(),
+        nlp={
             "extracted_symptoms": triage_input.normalized_symptoms,
-            "negated_symptoms": negated,
+            "negated_symptoms": triage_input.negated_symptoms,
             "symptom_count": len(triage_input.normalized_symptoms),
         },
-        "disclaimer": "This is not a medical diagnosis. Please consult a healthcare professional.",
-    }
+    )
+    if ml_prediction:
+        result.predicted_condition = ml_prediction.get("predicted_disease", "")
+        result.ml_confidence = ml_prediction.get("confidence", 0)
+        result.top_3_conditions = ml_prediction.get("top_3", [])
 
     # ── Phase 9: Multilingual ───────────────────────────────────────────
-    response = localize_response(response, triage_input.input_language)
+    localize_result(result, language)
+    trace.mark("phase9_language")
+
+    if key is not None:
+        # The cache keeps this object; the caller gets its own copy,
+        # free to change or localize without touching the cache
+        cache.put(key, result)
+        result = result.copy()
+
+    return result
+
+
+def _age_bucket(age) -> int | None:
+    """Map an age onto the interval between the thresholds the rules use."""
+    if not age:
+        return None
+    return bisect_right(AGE_BUCKET_BOUNDARIES, age)
+
+
+def _cache_key(triage_input: TriageInput, neglect: dict) -> tuple | None:
+    """
+    Canonical key for everything Phases 3–9 depend on: sorted symptoms,
+    age bucket, gender, the neglect signals from the raw text, and the
+    response language. Returns None for inputs that cannot be keyed.
+    """
+    age = triage_input.user_profile.age
+    if age is not None and not isinstance(age, int):
+        return None
+    return (
+        tuple(sorted(triage_input.normalized_symptoms)),
+        _age_bucket(age),
+        triage_input.user_profile.gender,
+        neglect["neglect_detected"],
+        neglect["neglect_reason"],
+        triage_input.input_language,
+    )
+
+
+def _personalize(cached: TriageResult, triage_input: TriageInput, neglect: dict) -> TriageResult:
+    """
+    Copy a cached result, replacing the fields that are specific to one
+    request rather than to its cache key: the exact age in "What we
+    noticed", the negated symptoms, and the input summary.
+    """
+    language = triage_input.input_language
+    negated = triage_input.negated_symptoms
+    input_summary = triage_input.to_dict()
+
+    what_we_noticed = describe_what_we_noticed(
+        triage_input.normalized_symptoms,
+        neglect["neglect_detected"],
+        age=triage_input.user_profile.age,
+        language=language,
+    )
+
+    if language != "en":
+        negated = [translate_symptom(s, language) for s in negated]
+        input_summary["normalized_symptoms"] = [
+            translate_symptom(s, language)
+            for s in input_summary["normalized_symptoms"]
+        ]
 
-    return response
+    personalized = cached.copy()
+    personalized.explanation["what_we_noticed"] = what_we_noticed
+    personalized.nlp["negated_symptoms"] = negated
+    personalized.input_summary = input_summary
+    return personalized
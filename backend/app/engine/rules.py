@@ -0,0 +1,80 @@
+"""
+Symptom Rule Index
+===================
+Compiled form of the knowledge-base rules that fire on a set of symptoms
+(silent-emergency patterns, high-risk clusters).
+
+Every symptom named by a rule gets one bit, so a rule becomes an integer
+mask and "all of the rule's symptoms are present" is a single AND and
+compare. Each rule is filed under its rarest symptom — the one shared
+with the fewest other rules — so a request only looks at rules that
+could possibly match, however large the rule set grows.
+"""
+
+from __future__ import annotations
+
+
+class SymptomRuleIndex:
+    """
+    Bitmask index over rules of the form (required symptoms, payload).
+
+    `match()` returns the payloads of every rule whose symptoms are all
+    present, in the order the rules were given.
+    """
+
+    __slots__ = ("_bits", "_buckets", "_always", "_payloads")
+
+    def __init__(self, rules):
+        rules = [(frozenset(symptoms), payload) for symptoms, payload in rules]
+
+        self._bits: dict[str, int] = {}
+        usage: dict[str, int] = {}
+        for symptoms, _ in rules:
+            for symptom in sorted(symptoms):
+                if symptom not in self._bits:
+                    self._bits[symptom] = 1 << len(self._bits)
+                usage[symptom] = usage.get(symptom, 0) + 1
+
+        # symptom bit → [(rule mask, rule position), ...]
+        self._buckets: dict[int, list[tuple[int, int]]] = {}
+        # Rules with no symptoms match every input
+        self._always: list[int] = []
+        self._payloads: list = []
+        for pos, (symptoms, payload) in enumerate(rules):
+            self._payloads.append(payload)
+            if not symptoms:
+                self._always.append(pos)
+                continue
+            mask = 0
+            for symptom in symptoms:
+                mask |= self._bits[symptom]
+            rarest = min(symptoms, key=lambda s: (usage[s], s))
+            self._buckets.setdefault(self._bits[rarest], []).append((mask, pos))
+
+    def __len__(self) -> int:
+        return len(self._payloads)
+
+    def mask_of(self, symptoms) -> int:
+        """Bitmask of the given symptoms; symptoms no rule uses are ignored."""
+        bits = self._bits
+        mask = 0
+        for symptom in symptoms:
+            mask |= bits.get(symptom, 0)
+        return mask
+
+    def match(self, symptoms) -> list:
+        """Payloads of every rule fully covered by `symptoms`, in rule order."""
+        present = self.mask_of(symptoms)
+        hits = list(self._always)
+        if present:
+            buckets = self._buckets
+            remaining = present
+            while remaining:
+                bit = remaining & -remaining
+                remaining ^= bit
+                for mask, pos in buckets.get(bit, ()):
+                    if present & mask == mask:
+                        hits.append(pos)
+            hits.sort()
+        payloads = self._payloads
+        return [payloads[pos] for pos in hits]
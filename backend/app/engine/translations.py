@@ -845,6 +845,93 @@ MEDICAL_PHRASES = {
 }
 
 
+# ── Compiled translators ─────────────────────────────────────────────────────
+# One case-insensitive alternation per language, longest alternative first,
+# compiled once. Each text is translated in a single scan; the replacement
+# is a dict lookup on the lowercased match.
+
+def _trie_pattern(words) -> str:
+    """
+    Build a regex alternation from `words`, factored into a prefix trie so
+    the engine tests one branch per character instead of one per word.
+    Optional tails are greedy, so the longest word at a position wins.
+    """
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = True
+
+    def build(node: dict) -> str:
+        terminal = "" in node
+        branches = [re.escape(ch) + build(child) for ch, child in node.items() if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if terminal:
+            return "(?:" + body + ")?"
+        return body
+
+    return build(trie) if trie else "(?!)"
+
+
+class _CompiledTranslator:
+    """Single-pass phrase replacer built from an English → target mapping."""
+
+    __slots__ = ("_pattern", "_lookup")
+
+    def __init__(self, pairs):
+        lookup: dict[str, str] = {}
+        for english, translated in pairs:
+            if english:
+                # Earlier entries win, as they did with sequential replacement
+                lookup.setdefault(english.casefold(), translated)
+        self._lookup = lookup
+        self._pattern = re.compile(_trie_pattern(lookup), re.IGNORECASE)
+
+    def _replace(self, match: re.Match) -> str:
+        # IGNORECASE also matches "ſ" for "s" (casefold maps it back) and
+        # "ı"/"İ" for "i" (nothing does; those are left as written)
+        text = match.group(0)
+        return self._lookup.get(text.casefold(), text)
+
+    def translate(self, text: str) -> str:
+        return self._pattern.sub(self._replace, text)
+
+
+def _symptom_pairs(language: str):
+    """(english, translated) pairs for every symptom, display name then key."""
+    targets = SYMPTOM_TRANSLATIONS.get(language, {})
+    for symptom_key, english_name in SYMPTOM_TRANSLATIONS["en"].items():
+        translated_name = targets.get(symptom_key, english_name)
+        yield english_name, translated_name
+        yield symptom_key, translated_name
+
+
+_SYMPTOM_TRANSLATORS: dict[str, _CompiledTranslator] = {
+    lang: _CompiledTranslator(_symptom_pairs(lang))
+    for lang in SYMPTOM_TRANSLATIONS if lang != "en"
+}
+
+# Medical phrases take precedence over symptom names, as they were
+# previously replaced first.
+_FULL_TEXT_TRANSLATORS: dict[str, _CompiledTranslator] = {
+    lang: _CompiledTranslator(
+        list(MEDICAL_PHRASES.get(lang, {}).items()) + list(_symptom_pairs(lang))
+    )
+    for lang in (SYMPTOM_TRANSLATIONS.keys() | MEDICAL_PHRASES.keys()) - {"en"}
+}
+
+
+def compiled_languages() -> dict[str, list[str]]:
+    """Languages with a compiled symptom / full-text translator."""
+    return {
+        "symptoms": sorted(_SYMPTOM_TRANSLATORS),
+        "full_text": sorted(_FULL_TEXT_TRANSLATORS),
+    }
+
+
 def translate_symptom_in_text(text: str, language: str) -> str:
     """
     Translate symptom names within a text string.
@@ -853,24 +940,8 @@ def translate_symptom_in_text(text: str, language: str) -> str:
     if language == "en" or not text:
         return text
 
-    translated_text = text
-
-    # Translate each symptom
-    if language in SYMPTOM_TRANSLATIONS:
-        for symptom_key, english_name in SYMPTOM_TRANSLATIONS["en"].items():
-            # Get the translated name
-            translated_name = SYMPTOM_TRANSLATIONS[language].get(symptom_key, english_name)
-
-            # Replace the English name with translated name (case-insensitive)
-            pattern = re.compile(re.escape(english_name), re.IGNORECASE)
-            translated_text = pattern.sub(translated_name, translated_text)
-
-            # Also replace underscored format
-            underscored = symptom_key
-            pattern = re.compile(re.escape(underscored), re.IGNORECASE)
-            translated_text = pattern.sub(translated_name, translated_text)
-
-    return translated_text
+    translator = _SYMPTOM_TRANSLATORS.get(language)
+    return translator.translate(text) if translator else text
 
 
 def translate_text_with_symptom_names(text: str, language: str) -> str:
@@ -898,18 +969,6 @@ def translate_full_text(text: str, language: str) -> str:
     """
     if language == "en" or not text:
         return text
-    
-    translated = text
-    
-    # First, translate common medical phrases
-    if language in MEDICAL_PHRASES:
-        phrases = MEDICAL_PHRASES[language]
-        for english_phrase, translated_phrase in phrases.items():
-            # Case-insensitive replacement
-            pattern = re.compile(re.escape(english_phrase), re.IGNORECASE)
-            translated = pattern.sub(translated_phrase, translated)
-    
-    # Then, translate symptom names
-    translated = translate_symptom_in_text(translated, language)
-    
-    return translated
+
+    translator = _FULL_TEXT_TRANSLATORS.get(language)
+    return translator.translate(text) if translator else text
@@ -1,34 +1,31 @@
 """
 Data models for the Health Triage Copilot.
-Plain Python classes – no ORM needed for the MVP.
+Slotted dataclasses – no ORM needed for the MVP.
 """
 
+from dataclasses import dataclass, field
 
+
+@dataclass(slots=True)
 class UserProfile:
-    def __init__(self, age: int = None, gender: str = None):
-        self.age = age
-        self.gender = gender
+    age: int | None = None
+    gender: str | None = None
 
     def to_dict(self):
         return {"age": self.age, "gender": self.gender}
 
 
+@dataclass(slots=True)
 class TriageInput:
     """Encapsulates everything captured in Phase 1."""
 
-    def __init__(
-        self,
-        raw_symptoms: str,
-        normalized_symptoms: list[str],
-        user_profile: UserProfile,
-        input_language: str = "en",
-        input_method: str = "text",
-    ):
-        self.raw_symptoms = raw_symptoms
-        self.normalized_symptoms = normalized_symptoms
-        self.user_profile = user_profile
-        self.input_language = input_language
-        self.input_method = input_method
+    raw_symptoms: str
+    normalized_symptoms: list[str]
+    user_profile: UserProfile
+    input_language: str = "en"
+    input_method: str = "text"
+    # Symptoms the NLP engine found negated ("no fever"); not part of the summary
+    negated_symptoms: list[str] = field(default_factory=list)
 
     def to_dict(self):
         return {
@@ -40,49 +37,62 @@ class TriageInput:
         }
 
 
+DISCLAIMER = "This is not a medical diagnosis. Please consult a healthcare professional."
+
+
+@dataclass(slots=True)
 class TriageResult:
-    """Final output structure returned by the pipeline."""
-
-    def __init__(
-        self,
-        risk_level: str = "Low",
-        confidence_band: str = "low",
-        explanation: str = "",
-        neglect_detected: str = "No",
-        neglect_reason: str = "",
-        silent_emergency_flag: str = "Low",
-        risk_pattern_explanation: str = "",
-        what_if_ignored: str = "",
-        recommended_action: str = "",
-        caregiver_alert_suggestion: str = "No",
-        caregiver_reason: str = "",
-        language: str = "en",
-    ):
-        self.risk_level = risk_level
-        self.confidence_band = confidence_band
-        self.explanation = explanation
-        self.neglect_detected = neglect_detected
-        self.neglect_reason = neglect_reason
-        self.silent_emergency_flag = silent_emergency_flag
-        self.risk_pattern_explanation = risk_pattern_explanation
-        self.what_if_ignored = what_if_ignored
-        self.recommended_action = recommended_action
-        self.caregiver_alert_suggestion = caregiver_alert_suggestion
-        self.caregiver_reason = caregiver_reason
-        self.language = language
+    """
+    Final output structure returned by the pipeline.
+
+    Phases 2–9 fill it in directly. `nlp` and `debug` are left out of
+    the response when None.
+    """
+
+    risk_level: str = "Low"
+    confidence_band: str = "low"
+    explanation: dict = field(default_factory=dict)
+    neglect_detected: str = "No"
+    neglect_reason: str = ""
+    silent_emergency_flag: str = "Low"
+    risk_pattern_explanation: str = ""
+    what_if_ignored: dict = field(default_factory=dict)
+    recommended_action: str = ""
+    predicted_condition: str = ""
+    ml_confidence: float = 0
+    top_3_conditions: list = field(default_factory=list)
+    caregiver_alert_suggestion: str = "No"
+    caregiver_reason: str = ""
+    language: str = "en"
+    input_summary: dict = field(default_factory=dict)
+    nlp: dict | None = None
+    disclaimer: str = DISCLAIMER
+    debug: dict | None = None
+
+    def copy(self) -> "TriageResult":
+        """A copy that shares no dict or list with this result."""
+        return TriageResult(*[_copy_tree(getattr(self, name)) for name in _RESPONSE_FIELDS])
 
     def to_dict(self):
-        return {
-            "risk_level": self.risk_level,
-            "confidence_band": self.confidence_band,
-            "explanation": self.explanation,
-            "neglect_detected": self.neglect_detected,
-            "neglect_reason": self.neglect_reason,
-            "silent_emergency_flag": self.silent_emergency_flag,
-            "risk_pattern_explanation": self.risk_pattern_explanation,
-            "what_if_ignored": self.what_if_ignored,
-            "recommended_action": self.recommended_action,
-            "caregiver_alert_suggestion": self.caregiver_alert_suggestion,
-            "caregiver_reason": self.caregiver_reason,
-            "language": self.language,
-        }
+        """
+        The response as a dict, built again for every encode. Field
+        values are shared, not copied: a shallow mapping, a few µs.
+        """
+        response = {name: getattr(self, name) for name in _RESPONSE_FIELDS}
+        if self.nlp is None:
+            del response["nlp"]
+        if self.debug is None:
+            del response["debug"]
+        return response
+
+
+_RESPONSE_FIELDS = TriageResult.__slots__
+
+
+def _copy_tree(value):
+    # Response values are JSON-shaped: only dicts and lists are mutable
+    if type(value) is dict:
+        return {k: _copy_tree(v) for k, v in value.items()}
+    if type(value) is list:
+        return [_copy_tree(v) for v in value]
+    return value
@@ -2,9 +2,15 @@
 API Routes for the Health Triage Copilot
 """
 
-from flask import Blueprint, request, jsonify
-from app.engine.pipeline import run_triage
-from ml.predictor import get_all_symptoms, get_severity_map, get_disease_info
+import json
+
+from flask import Blueprint, Response, current_app, request, jsonify, stream_with_context
+from app.engine.pipeline import run_triage_result, run_triage_batch, get_cache_stats
+from app.engine.instrumentation import get_phase_latency, is_enabled
+from app.warmup import readiness
+from app.catalogs import get_catalog, symptom_display_name
+from app.engine.autocomplete import MAX_RESULTS, SYMPTOM_SEARCH_INDEX
+from app.streams import StreamClosed, format_event, get_registry
 
 api_bp = Blueprint("api", __name__)
 
@@ -19,6 +25,20 @@ def health_check():
     })
 
 
+@api_bp.route("/ready")
+def readiness_check():
+    """
+    Readiness probe for load balancers.
+
+    200 once this worker has loaded its artifacts and been warmed up
+    (see app/warmup.py), 503 until then. A worker started without
+    preload warms up during its first probe. The body lists what is
+    loaded, the artifact bundle version and the warm-up timing.
+    """
+    ready, report = readiness(current_app._get_current_object())
+    return jsonify(report), 200 if ready else 503
+
+
 @api_bp.route("/triage", methods=["POST"])
 def triage():
     """
@@ -31,7 +51,8 @@ def triage():
             "symptoms": list[str] | str,
             "raw_text": str (optional),
             "input_method": "text" | "voice",
-            "language": "en" | "hi" | "mr"
+            "language": "en" | "hi" | "mr",
+            "debug": bool (optional, adds per-phase timings)
         }
     """
     try:
@@ -45,7 +66,7 @@ def triage():
         if not symptoms and not raw_text:
             return jsonify({"error": "Please provide symptoms or raw_text"}), 400
 
-        result = run_triage(data)
+        result = run_triage_result(data)
         return jsonify(result)
 
     except Exception as e:
@@ -55,59 +76,267 @@ def triage():
         }), 500
 
 
+NDJSON_MIMETYPES = {"application/x-ndjson", "application/ndjson", "application/jsonl"}
+
+
+def _iter_ndjson_records(stream):
+    """Lazily parse one JSON record per non-blank line of the request body."""
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError:
+            yield None
+
+
+@api_bp.route("/triage/batch", methods=["POST"])
+def triage_batch():
+    """
+    Batch triage endpoint.
+
+    Accepts either a JSON array of /triage payloads, or NDJSON
+    (Content-Type: application/x-ndjson) with one payload per line.
+
+    Streams back NDJSON, one line per record in input order, as soon as
+    each result is ready:
+        {"index": int, "result": {...}}
+        {"index": int, "error": str}
+
+    A JSON array is parsed whole, so it may hold at most
+    TRIAGE_BATCH_MAX_RECORDS records (413 otherwise); NDJSON is read
+    line by line and has no limit.
+    """
+    if request.mimetype in NDJSON_MIMETYPES:
+        records = _iter_ndjson_records(request.stream)
+    else:
+        records = request.get_json(silent=True)
+        if not isinstance(records, list):
+            return jsonify({"error": "Expected a JSON array or NDJSON body"}), 400
+        max_records = current_app.config.get("TRIAGE_BATCH_MAX_RECORDS", 1000)
+        if len(records) > max_records:
+            return jsonify({
+                "error": f"A JSON array batch may hold at most {max_records} records; "
+                         "send larger batches as NDJSON",
+            }), 413
+
+    chunk_size = current_app.config.get("TRIAGE_BATCH_CHUNK_SIZE", 64)
+
+    def generate():
+        results = run_triage_batch(records, chunk_size=chunk_size)
+        for index, result in enumerate(results):
+            if isinstance(result, dict):
+                line = {"index": index, **result}
+            else:
+                line = {"index": index, "result": result}
+            yield current_app.json.dumps(line) + "\n"
+
+    return Response(stream_with_context(generate()), mimetype="application/x-ndjson")
+
+
+@api_bp.route("/triage/stream", methods=["POST"])
+def open_stream():
+    """
+    Open a dictation stream for live symptom extraction.
+
+    Returns 201 with {"session_id": str, "events_url": str}. Post
+    transcript chunks to /triage/stream/<session_id>/chunks; symptom
+    changes are also pushed as server-sent events from events_url.
+    """
+    session = get_registry(current_app.config).open()
+    return jsonify({
+        "session_id": session.id,
+        "events_url": f"/triage/stream/{session.id}/events",
+    }), 201
+
+
+def _get_stream(session_id: str):
+    session = get_registry(current_app.config).get(session_id)
+    if session is None:
+        return None, (jsonify({"error": "Unknown or expired stream"}), 404)
+    return session, None
+
+
+@api_bp.route("/triage/stream/<session_id>/chunks", methods=["POST"])
+def stream_chunk(session_id):
+    """
+    Add a transcript chunk to a dictation stream.
+
+    Accepts JSON:
+        {
+            "text": str,
+            "final": bool (default true; false = interim guess that the
+                           next chunk replaces)
+        }
+    Returns the event it produced:
+        {"seq": int, "final": bool, "deltas": [{"symptom", "op"}],
+         "symptoms": list[str], "negated": list[str]}
+    where op is "add", "negate" or "remove".
+    """
+    session, error = _get_stream(session_id)
+    if error:
+        return error
+
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict) or not isinstance(data.get("text"), str):
+        return jsonify({"error": "Expected a JSON object with a text string"}), 400
+
+    try:
+        event = session.push(data["text"], final=bool(data.get("final", True)))
+    except StreamClosed:
+        return jsonify({"error": "Stream is closed"}), 409
+    return jsonify(event)
+
+
+@api_bp.route("/triage/stream/<session_id>/events", methods=["GET"])
+def stream_events(session_id):
+    """
+    Server-sent events for a dictation stream: one "symptoms" event per
+    chunk (same body as the chunk response, id = seq), keep-alive
+    comments while idle, and an "end" event once the stream is closed
+    or expires. Reconnecting clients resume after their Last-Event-ID
+    (from the events still retained, see app/streams.py).
+    """
+    session, error = _get_stream(session_id)
+    if error:
+        return error
+
+    try:
+        cursor = int(request.headers.get("Last-Event-ID", 0))
+    except ValueError:
+        cursor = 0
+    keepalive = current_app.config.get("STREAM_KEEPALIVE", 15)
+    dumps = current_app.json.dumps
+    registry = get_registry(current_app.config)
+
+    def generate():
+        nonlocal cursor
+        while True:
+            events, closed = session.wait(cursor, keepalive)
+            for event in events:
+                yield format_event(event, dumps)
+            if events:
+                cursor = events[-1]["seq"]
+            if not closed and session.expired():
+                registry.discard(session.id)
+                closed = True
+            if closed:
+                yield "event: end\ndata: {}\n\n"
+                return
+            if not events:
+                yield ": keep-alive\n\n"
+
+    response = Response(stream_with_context(generate()), mimetype="text/event-stream")
+    response.headers["Cache-Control"] = "no-cache"
+    # Stop reverse proxies from buffering the stream
+    response.headers["X-Accel-Buffering"] = "no"
+    return response
+
+
+@api_bp.route("/triage/stream/<session_id>", methods=["DELETE"])
+def close_stream(session_id):
+    """Close a dictation stream; its event stream ends."""
+    if not get_registry(current_app.config).discard(session_id):
+        return jsonify({"error": "Unknown or expired stream"}), 404
+    return "", 204
+
+
+@api_bp.route("/metrics/cache", methods=["GET"])
+def cache_metrics():
+    """Triage result cache size and hit / miss / eviction counters."""
+    return jsonify(get_cache_stats())
+
+
+@api_bp.route("/metrics/latency", methods=["GET"])
+def latency_metrics():
+    """Per-phase triage latency histograms (empty unless timing is enabled)."""
+    return jsonify({
+        "enabled": is_enabled(),
+        "phases": get_phase_latency(),
+    })
+
+
+def _catalog_response(name: str) -> Response:
+    """
+    Serve a pre-encoded catalog in the requested ?language=: the best
+    encoding the client accepts, a strong ETag, Cache-Control, and 304
+    on a matching If-None-Match.
+    """
+    language = request.args.get("language", current_app.config["DEFAULT_LANGUAGE"])
+    if language not in current_app.config["SUPPORTED_LANGUAGES"]:
+        return jsonify({"error": f"Unsupported language: {language}"}), 400
+
+    catalog = get_catalog(name, current_app.json.dumps, language)
+    accepted = request.accept_encodings
+    encoding = next(
+        (enc for enc in ("br", "gzip") if enc in catalog.bodies and accepted[enc]),
+        "identity",
+    )
+
+    response = Response(catalog.bodies[encoding], mimetype="application/json")
+    if encoding != "identity":
+        response.content_encoding = encoding
+    response.vary.add("Accept-Encoding")
+    response.set_etag(catalog.etag_for(encoding))
+    response.cache_control.public = True
+    response.cache_control.max_age = current_app.config.get("CATALOG_MAX_AGE", 3600)
+    return response.make_conditional(request)
+
+
 @api_bp.route("/symptoms", methods=["GET"])
 def get_symptoms():
-    """Return all available symptoms grouped by severity."""
-    all_symptoms = get_all_symptoms()
-    severity_map = get_severity_map()
-
-    # Group by severity weight
-    categorized = {
-        "critical": [],     # weight >= 6
-        "high": [],         # weight 4-5
-        "moderate": [],     # weight 3
-        "mild": [],         # weight 1-2
-    }
-
-    for symptom in all_symptoms:
-        weight = severity_map.get(symptom.lower(), 1)
-        readable = symptom.replace("_", " ").title()
-        entry = {"id": symptom, "name": readable, "weight": weight}
-
-        if weight >= 6:
-            categorized["critical"].append(entry)
-        elif weight >= 4:
-            categorized["high"].append(entry)
-        elif weight >= 3:
-            categorized["moderate"].append(entry)
-        else:
-            categorized["mild"].append(entry)
+    """
+    Return all available symptoms grouped by severity.
+
+    Optional ?language=en|hi|mr localizes the display names; ids stay
+    the canonical symptom columns.
+    """
+    return _catalog_response("symptoms")
+
+
+@api_bp.route("/symptoms/autocomplete", methods=["GET"])
+def autocomplete_symptoms():
+    """
+    Symptom suggestions for a partially typed query.
+
+    Query params: q (English, romanized or Devanagari text), limit
+    (default 8, max 10), language (display names, default en).
+    Returns canonical symptom ids, best first:
+        {"query": str, "results": [{"id", "name", "matched", "match"}]}
+    where "match" is "prefix" or "fuzzy" (typo-tolerant).
+    """
+    query = request.args.get("q", "")
+    language = request.args.get("language", current_app.config["DEFAULT_LANGUAGE"])
+    if language not in current_app.config["SUPPORTED_LANGUAGES"]:
+        return jsonify({"error": f"Unsupported language: {language}"}), 400
+    try:
+        limit = int(request.args.get("limit", 8))
+    except ValueError:
+        return jsonify({"error": "limit must be an integer"}), 400
+    if not 1 <= limit <= MAX_RESULTS:
+        return jsonify({"error": f"limit must be between 1 and {MAX_RESULTS}"}), 400
 
     return jsonify({
-        "symptoms": [
-            {"id": s, "name": s.replace("_", " ").title()}
-            for s in all_symptoms
+        "query": query,
+        "results": [
+            {
+                "id": symptom,
+                "name": symptom_display_name(symptom, language),
+                "matched": term,
+                "match": match,
+            }
+            for symptom, term, match in SYMPTOM_SEARCH_INDEX.search(query, limit)
         ],
-        "categorized": categorized,
-        "total": len(all_symptoms),
     })
 
 
 @api_bp.route("/diseases", methods=["GET"])
 def get_diseases():
-    """Return all diseases with descriptions and severity tiers."""
-    disease_info = get_disease_info()
-
-    diseases = []
-    for name, info in sorted(disease_info.items()):
-        diseases.append({
-            "name": name,
-            "description": info.get("description", ""),
-            "severity_tier": info.get("severity_tier", "Low"),
-            "precautions": info.get("precautions", []),
-        })
+    """
+    Return all diseases with descriptions and severity tiers.
 
-    return jsonify({
-        "diseases": diseases,
-        "total": len(diseases),
-    })
+    Optional ?language=en|hi|mr adds a localized display_name and
+    translates descriptions and precautions; `name` stays canonical.
+    """
+    return _catalog_response("diseases")
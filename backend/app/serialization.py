@@ -0,0 +1,141 @@
+"""
+Response Serialization
+=======================
+The Flask JSON providers for this app, chosen by the JSON_BACKEND
+setting ("auto", "orjson" or "stdlib"):
+
+  • orjson – the default (orjson is in requirements.txt). Several times
+             faster than any stdlib encoding; responses are written as
+             bytes, with no str round trip.
+  • stdlib – the fallback when orjson is missing: Flask's default
+             provider, except that it writes UTF-8 instead of
+             \\u-escaping non-ASCII text (Hindi / Marathi bodies shrink by
+             about half). The json module's UTF-8 path is slower than its
+             ASCII one, so on English text this costs time over Flask's
+             stock encoder; install orjson for speed.
+
+"auto" picks orjson when it is installed. Both sort keys like Flask does
+and write compact JSON (no spaces after "," and ":") unless indenting,
+so the two agree byte for byte on strings, ints, lists and dicts. They
+differ on floats, which each formats its own way (stdlib `1e-05`,
+`1e+16`, `NaN`; orjson `0.00001`, `1e16`, `null`), so switching backends
+can change triage responses that carry such values.
+"""
+
+from flask.json.provider import DefaultJSONProvider
+
+from app.models import TriageResult
+
+try:
+    import orjson
+except ImportError:  # optional: stdlib json only
+    orjson = None
+
+
+# The separators orjson writes, without and with OPT_INDENT_2
+_COMPACT = (",", ":")
+_INDENTED = (",", ": ")
+
+# Encoder arguments orjson can honour
+_ORJSON_ARGS = {"indent", "separators", "sort_keys", "ensure_ascii"}
+
+
+class TriageJSONProvider(DefaultJSONProvider):
+    """
+    Flask's provider with UTF-8 output. A TriageResult is encoded through
+    its shallow `to_dict` mapping, which costs about as much as encoding
+    an equivalent dict plus building that dict; Flask's own fallback for
+    dataclasses, `dataclasses.asdict`, deep-copies every nested dict and
+    list first.
+    """
+
+    ensure_ascii = False
+
+    def dumps(self, obj, **kwargs) -> str:
+        # Compact by default, the only unindented form orjson writes
+        if kwargs.get("indent") is None:
+            kwargs.setdefault("separators", _COMPACT)
+        return super().dumps(obj, **kwargs)
+
+    @staticmethod
+    def default(o):
+        if isinstance(o, TriageResult):
+            return o.to_dict()
+        return DefaultJSONProvider.default(o)
+
+
+class OrjsonProvider(TriageJSONProvider):
+    """
+    TriageJSONProvider on top of orjson. Calls orjson cannot express
+    (other encoder arguments, indents other than 2, other separators,
+    ensure_ascii, ints beyond 64 bits) fall back to the stdlib encoder.
+    """
+
+    def _option(self, indent, sort_keys: bool) -> int:
+        # Dataclasses and datetimes go through `default`, as with Flask
+        option = (
+            orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_SERIALIZE_NUMPY
+        )
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def _encode(self, obj, kwargs: dict, option: int = 0) -> bytes | None:
+        """orjson bytes for `obj`, or None if the stdlib encoder must do it."""
+        indent = kwargs.get("indent")
+        separators = kwargs.get("separators")
+        if (
+            kwargs.keys() - _ORJSON_ARGS
+            or kwargs.get("ensure_ascii", self.ensure_ascii)
+            or indent not in (None, 2)
+            or (separators is not None and tuple(separators) != (_INDENTED if indent else _COMPACT))
+        ):
+            return None
+        sort_keys = kwargs.get("sort_keys", self.sort_keys)
+        try:
+            return orjson.dumps(obj, default=self.default, option=self._option(indent, sort_keys) | option)
+        except orjson.JSONEncodeError:
+            return None
+
+    def dumps(self, obj, **kwargs) -> str:
+        data = self._encode(obj, kwargs)
+        if data is None:
+            return super().dumps(obj, **kwargs)
+        return data.decode()
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        pretty = (self.compact is None and self._app.debug) or self.compact is False
+        dump_args = {"indent": 2} if pretty else {"separators": _COMPACT}
+        data = self._encode(obj, dump_args, orjson.OPT_APPEND_NEWLINE)
+        if data is None:
+            data = f"{super().dumps(obj, **dump_args)}\n"
+        return self._app.response_class(data, mimetype=self.mimetype)
+
+
+JSON_PROVIDERS: dict[str, type[TriageJSONProvider]] = {"stdlib": TriageJSONProvider}
+if orjson is not None:
+    JSON_PROVIDERS["orjson"] = OrjsonProvider
+
+
+def json_provider_class(backend: str = "auto") -> type[TriageJSONProvider]:
+    """The provider class for a JSON_BACKEND setting."""
+    if backend == "auto":
+        return JSON_PROVIDERS.get("orjson", TriageJSONProvider)
+    try:
+        return JSON_PROVIDERS[backend]
+    except KeyError:
+        raise ValueError(
+            f"JSON backend {backend!r} is not available "
+            f"(installed: {', '.join(JSON_PROVIDERS)})"
+        ) from None
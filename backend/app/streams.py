@@ -0,0 +1,170 @@
+"""
+Dictation Streams
+==================
+Live symptom extraction while the patient is still speaking. A client
+opens a stream, posts transcript chunks as the recognizer produces them
+(interim guesses and final utterances), and gets symptom changes back
+on each post and as server-sent events.
+
+Each stream owns an IncrementalExtractor (app/engine/nlp.py), so a chunk
+costs a scan of that chunk only, not of the whole transcript so far.
+
+Limits (app/config.py):
+  • STREAM_SESSION_TTL   – seconds without a chunk before a stream expires
+  • STREAM_MAX_LIFETIME  – seconds a stream may stay open at all; an
+                           event stream ends when its stream does
+  • STREAM_MAX_EVENTS    – events kept for replay; older ones are dropped
+                           (every event carries the full symptom lists,
+                           so a client only ever needs the latest)
+  • STREAM_MAX_SESSIONS  – open streams per process; the oldest goes first
+
+Deployment: streams live in the memory of the process that opened them.
+Behind several workers, route each stream to one worker (sticky
+sessions, e.g. on the session id in the URL), and use a threaded or
+async worker class: every connected event stream holds a thread while
+it waits for chunks. See wsgi.py.
+"""
+
+import secrets
+from collections import deque
+from threading import Condition, Lock
+from time import monotonic
+
+from app.engine.nlp import IncrementalExtractor
+
+
+class StreamClosed(Exception):
+    """A chunk was posted to a stream that has been closed."""
+
+
+class StreamSession:
+    """One dictation stream: its extractor and its latest events."""
+
+    __slots__ = (
+        "id", "extractor", "events", "seq", "closed",
+        "created", "touched", "ttl", "lifetime", "_cond",
+    )
+
+    def __init__(self, session_id: str, ttl: float = 600, lifetime: float = 1800, max_events: int = 256):
+        self.id = session_id
+        self.extractor = IncrementalExtractor()
+        self.events: deque[dict] = deque(maxlen=max_events)
+        self.seq = 0                # id of the last event
+        self.closed = False
+        self.created = self.touched = monotonic()
+        self.ttl = ttl
+        self.lifetime = lifetime
+        self._cond = Condition()
+
+    def expired(self, now: float | None = None) -> bool:
+        """Idle for longer than the TTL, or open for longer than the lifetime."""
+        now = monotonic() if now is None else now
+        return now - self.touched > self.ttl or now - self.created > self.lifetime
+
+    def push(self, text: str, final: bool = True) -> dict:
+        """Feed a chunk; returns (and publishes) the resulting event."""
+        with self._cond:
+            if self.closed:
+                raise StreamClosed(self.id)
+            deltas = self.extractor.update(text, final)
+            symptoms, negated = self.extractor.symptoms()
+            self.seq += 1
+            event = {
+                "seq": self.seq,
+                "final": final,
+                "deltas": deltas,
+                "symptoms": symptoms,
+                "negated": negated,
+            }
+            self.events.append(event)
+            self.touched = monotonic()
+            self._cond.notify_all()
+            return event
+
+    def close(self) -> None:
+        with self._cond:
+            self.closed = True
+            self._cond.notify_all()
+
+    def wait(self, after: int, timeout: float) -> tuple[list[dict], bool]:
+        """
+        The retained events after event id `after`, blocking up to
+        `timeout` seconds for one to arrive. Returns (events, closed).
+        """
+        with self._cond:
+            self._cond.wait_for(lambda: self.seq > after or self.closed, timeout)
+            missing = self.seq - after
+            events = list(self.events)
+            return events[-missing:] if missing > 0 else [], self.closed
+
+
+class StreamRegistry:
+    """The open streams of this process, with expiry and a size cap."""
+
+    def __init__(self, ttl: float = 600, lifetime: float = 1800, max_sessions: int = 1024, max_events: int = 256):
+        self.ttl = ttl
+        self.lifetime = lifetime
+        self.max_sessions = max_sessions
+        self.max_events = max_events
+        self._sessions: dict[str, StreamSession] = {}
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def _expire(self) -> None:
+        now = monotonic()
+        for sid in [sid for sid, s in self._sessions.items() if s.expired(now)]:
+            self._sessions.pop(sid).close()
+
+    def open(self) -> StreamSession:
+        with self._lock:
+            self._expire()
+            if len(self._sessions) >= self.max_sessions:
+                # Dicts keep insertion order: drop the oldest stream
+                oldest = next(iter(self._sessions))
+                self._sessions.pop(oldest).close()
+            session = StreamSession(
+                secrets.token_urlsafe(16),
+                ttl=self.ttl,
+                lifetime=self.lifetime,
+                max_events=self.max_events,
+            )
+            self._sessions[session.id] = session
+            return session
+
+    def get(self, session_id: str) -> StreamSession | None:
+        session = self._sessions.get(session_id)
+        if session is not None and session.expired():
+            self.discard(session_id)
+            return None
+        return session
+
+    def discard(self, session_id: str) -> bool:
+        with self._lock:
+            session = self._sessions.pop(session_id, None)
+        if session is None:
+            return False
+        session.close()
+        return True
+
+
+_registry: StreamRegistry | None = None
+
+
+def get_registry(config) -> StreamRegistry:
+    """The process-wide registry, created from the app config on first use."""
+    global _registry
+    if _registry is None:
+        _registry = StreamRegistry(
+            ttl=config.get("STREAM_SESSION_TTL", 600),
+            lifetime=config.get("STREAM_MAX_LIFETIME", 1800),
+            max_sessions=config.get("STREAM_MAX_SESSIONS", 1024),
+            max_events=config.get("STREAM_MAX_EVENTS", 256),
+        )
+    return _registry
+
+
+def format_event(event: dict, dumps) -> str:
+    """One server-sent event frame for a stream event."""
+    return f"id: {event['seq']}\nevent: symptoms\ndata: {dumps(event)}\n\n"
@@ -0,0 +1,175 @@
+"""
+Worker Warm-up
+===============
+Gets a freshly created app to steady-state latency before it serves
+traffic. Used by `create_app(preload=True)`:
+
+  1. load every ML artifact (model, labels, symptom index, severity map)
+  2. encode the /symptoms and /diseases catalogs in every language, and
+     push a few synthetic triages through the real /triage route, so the
+     NLP automaton, translators, narrative catalog, JSON encoder and
+     Flask request path have all run once
+  3. `gc.freeze()` the heap
+
+`readiness()` reports all of this for the /ready endpoint. A worker is
+ready only once it is warm. Apps created without preload (run.py, tests,
+single-process servers) warm up on their first readiness probe instead,
+which takes a few tens of milliseconds. The synthetic requests use a
+private result cache and record no latency samples, so a warm-up never
+touches what real traffic has cached or measured.
+
+Under a pre-forking server (e.g. `gunicorn --preload wsgi:app`) step 3
+keeps the loaded objects out of the collector's reach, so their pages
+stay copy-on-write shared with every worker.
+"""
+
+import gc
+from threading import Lock
+from time import perf_counter
+
+from app.catalogs import CATALOG_LANGUAGES
+from app.engine.pipeline import private_cache
+from app.engine.autocomplete import SYMPTOM_SEARCH_INDEX
+from app.engine.instrumentation import paused
+from app.engine.narratives import catalog_size, is_catalog_built
+from app.engine.nlp import PHRASE_AUTOMATON
+from app.engine.phase3_silent import SILENT_PATTERN_INDEX
+from app.engine.phase4_risk import CLUSTER_INDEX
+from app.engine.translations import compiled_languages
+from ml.predictor import artifact_status, bundle_info, load_artifacts
+
+# One request per code path that compiles or loads something on first use
+WARMUP_REQUESTS: tuple[dict, ...] = (
+    {"age": 34, "gender": "female", "symptoms": ["headache", "high_fever", "vomiting"]},
+    {
+        "age": 67, "gender": "male", "language": "en",
+        "raw_text": "I have chest pain and sweating since morning, no fever. It is probably nothing.",
+    },
+    {"age": 45, "gender": "female", "language": "hi", "raw_text": "mujhe bukhar aur sir dard hai, khansi nahi hai"},
+    {"age": 29, "gender": "male", "language": "mr", "raw_text": "mala taap aahe ani doka dukhtay"},
+)
+
+# Catalogs are encoded on first request; build them before traffic arrives
+WARMUP_GETS: tuple[str, ...] = tuple(
+    f"/{name}?language={language}"
+    for name in ("symptoms", "diseases")
+    for language in CATALOG_LANGUAGES
+)
+
+_status = {
+    "warmed_up": False,
+    "requests": 0,
+    "warmup_ms": None,
+    "frozen_objects": 0,
+    "error": None,
+}
+
+_warmup_lock = Lock()
+
+
+def _check(response, path: str) -> None:
+    if response.status_code != 200:
+        raise RuntimeError(
+            f"Warm-up request to {path} failed ({response.status_code}): "
+            f"{response.get_data(as_text=True)}"
+        )
+
+
+def warm_up(app, rounds: int = 2) -> dict:
+    """
+    Load all artifacts and run `rounds` passes of WARMUP_REQUESTS through
+    the app. Returns the warm-up status (see `get_warmup_status`).
+    """
+    start = perf_counter()
+    load_artifacts()
+
+    requests = 0
+    client = app.test_client()
+    # Synthetic traffic must not show up as cache entries or latency samples
+    with private_cache(), paused():
+        for path in WARMUP_GETS:
+            _check(client.get(path), path)
+            requests += 1
+        for _ in range(max(rounds, 1)):
+            for payload in WARMUP_REQUESTS:
+                _check(client.post("/triage", json=payload), "/triage")
+                requests += 1
+
+    _status.update(
+        warmed_up=True,
+        error=None,
+        requests=requests,
+        warmup_ms=round((perf_counter() - start) * 1000, 2),
+    )
+    return get_warmup_status()
+
+
+def freeze_heap() -> int:
+    """
+    Collect garbage, then move every surviving object to the permanent
+    generation so later collections never touch (and un-share) them.
+    Returns the number of frozen objects.
+    """
+    gc.collect()
+    gc.freeze()
+    _status["frozen_objects"] = gc.get_freeze_count()
+    return _status["frozen_objects"]
+
+
+def ensure_warm(app) -> bool:
+    """
+    Warm up `app` unless this process already is warm (preloaded, or
+    probed before). A failed warm-up is recorded in the status and
+    retried on the next call. Returns whether the process is warm.
+    """
+    if _status["warmed_up"]:
+        return True
+    with _warmup_lock:
+        if not _status["warmed_up"]:
+            try:
+                warm_up(app, rounds=app.config["WARMUP_ROUNDS"])
+            except Exception as e:
+                _status["error"] = f"{type(e).__name__}: {e}"
+    return _status["warmed_up"]
+
+
+def get_warmup_status() -> dict:
+    """Whether this process has been warmed up, and how long it took."""
+    return dict(_status)
+
+
+def index_status() -> dict:
+    """Sizes of the structures compiled at import time."""
+    return {
+        "phrase_automaton": len(PHRASE_AUTOMATON),
+        "silent_pattern_index": len(SILENT_PATTERN_INDEX),
+        "risk_cluster_index": len(CLUSTER_INDEX),
+        "symptom_search": len(SYMPTOM_SEARCH_INDEX),
+        "translators": compiled_languages(),
+        "narrative_catalog": catalog_size() if is_catalog_built() else None,
+    }
+
+
+def readiness(app=None) -> tuple[bool, dict]:
+    """
+    Whether this worker can serve at steady-state latency, with the
+    details: artifacts loaded, compiled indexes, bundle version, warm-up.
+    Given the app, a worker that is not warm yet is warmed up first.
+    """
+    if app is not None:
+        ensure_warm(app)
+    artifacts = artifact_status()
+    indexes = index_status()
+    warmup = get_warmup_status()
+    ready = (
+        all(artifacts.values())
+        and all(indexes[name] for name in ("phrase_automaton", "narrative_catalog"))
+        and warmup["warmed_up"]
+    )
+    return ready, {
+        "ready": ready,
+        "artifacts": artifacts,
+        "bundle": bundle_info(),
+        "indexes": indexes,
+        "warmup": warmup,
+    }
@@ -0,0 +1,9 @@
+"""
+Performance Benchmarks for Health Triage Copilot
+=================================================
+Times the NLP engine, the ML predictor, every pipeline phase and the
+/triage endpoint on generated, reproducible workloads.
+
+    python -m benchmarks.bench_triage run -o before.json
+    python -m benchmarks.bench_triage compare before.json after.json
+"""
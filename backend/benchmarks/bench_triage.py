@@ -0,0 +1,437 @@
+"""
+Triage Benchmark Runner
+========================
+Times each stage of the triage path on the generated workloads and
+writes the results as JSON; `compare` diffs two result files and flags
+regressions.
+
+    python -m benchmarks.bench_triage run -o results.json
+    python -m benchmarks.bench_triage run --filter phase4 --rounds 10
+    python -m benchmarks.bench_triage compare base.json new.json --threshold 0.1
+
+Every case is timed over the same prepared inputs for `--rounds` rounds
+(after one warm-up round, with GC paused as `timeit` does); the median
+per-call time is what `compare` looks at. One more, untimed pass under
+`tracemalloc` records the median peak memory allocated per call, which
+`compare` reports alongside. The pipeline result cache is disabled
+throughout so repeated rounds measure real work.
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import tracemalloc
+from datetime import datetime, timezone
+from time import perf_counter
+
+# Allow `python benchmarks/bench_triage.py` as well as `python -m benchmarks.bench_triage`
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask.json.provider import DefaultJSONProvider
+
+from app import create_app
+from app.engine import pipeline
+from app.engine.autocomplete import SYMPTOM_SEARCH_INDEX
+from app.engine.nlp import extract_symptoms_nlp
+from app.engine.phase1_input import detect_language, process_input
+from app.engine.phase2_neglect import detect_neglect
+from app.engine.phase3_silent import detect_silent_emergency
+from app.engine.phase4_risk import classify_risk
+from app.engine.phase5_explain import generate_explanation
+from app.engine.phase6_outcome import generate_outcome_awareness
+from app.engine.phase7_action import generate_recommendations
+from app.engine.phase8_caregiver import evaluate_caregiver_alert
+from app.engine.phase9_language import localize_response
+from app.serialization import JSON_PROVIDERS
+from ml.predictor import predict_disease
+from benchmarks.workloads import DEFAULT_SEED, WORKLOADS, generate_all
+
+DEFAULT_COUNT = 200
+DEFAULT_ROUNDS = 5
+DEFAULT_THRESHOLD = 0.10
+RESULTS_VERSION = 1
+
+TEXT_WORKLOADS = ("free_text", "hindi", "marathi", "hindi_devanagari", "marathi_devanagari")
+
+
+# ── Case preparation ─────────────────────────────────────────────────────────
+
+class _Prepared:
+    """One request run through Phases 1–4 ahead of time."""
+
+    __slots__ = (
+        "record", "triage_input", "symptoms", "age", "gender", "language",
+        "neglect", "silent", "ml", "risk",
+    )
+
+    def __init__(self, record: dict):
+        self.record = record
+        ti = self.triage_input = process_input(dict(record))
+        self.symptoms = ti.normalized_symptoms
+        self.age = ti.user_profile.age
+        self.gender = ti.user_profile.gender
+        self.language = ti.input_language
+        self.neglect = detect_neglect(ti.raw_symptoms, self.symptoms)
+        self.silent = detect_silent_emergency(self.symptoms, self.age, self.gender)
+        self.ml = predict_disease(self.symptoms) if self.symptoms else None
+        self.risk = classify_risk(
+            self.symptoms,
+            self.neglect["neglect_detected"],
+            self.silent["silent_risk_flag"],
+            ml_result=self.ml,
+        )
+
+
+def _keystrokes(records: list[dict]) -> list[str]:
+    """Every prefix typed on the way to each chip's name, as autocomplete sees it."""
+    queries = []
+    for record in records:
+        for symptom in record["symptoms"]:
+            name = symptom.replace("_", " ")
+            queries.extend(name[:n] for n in range(1, len(name) + 1))
+    return queries
+
+
+def _typos(records: list[dict]) -> list[str]:
+    """Each chip's name with its middle character dropped."""
+    queries = []
+    for record in records:
+        for symptom in record["symptoms"]:
+            name = symptom.replace("_", " ")
+            middle = len(name) // 2
+            queries.append(name[:middle] + name[middle + 1:])
+    return queries
+
+
+def _build_cases(workloads: dict[str, list[dict]]):
+    """
+    Yield (name, workload, fn, calls) for every benchmark case, where
+    `calls` is a list of (args, kwargs) prepared up front.
+    """
+    prepared = {
+        name: [_Prepared(r) for r in records]
+        for name, records in workloads.items()
+    }
+    # Phases 2–9 only ever run on inputs with at least one symptom
+    scored = {
+        name: [p for p in items if p.symptoms]
+        for name, items in prepared.items()
+    }
+
+    for name in TEXT_WORKLOADS:
+        yield "nlp.extract_symptoms_nlp", name, extract_symptoms_nlp, [
+            ((r["raw_text"],), {}) for r in workloads[name]
+        ]
+
+    for name in TEXT_WORKLOADS:
+        yield "phase1.detect_language", name, detect_language, [
+            ((r["raw_text"],), {}) for r in workloads[name]
+        ]
+
+    yield "autocomplete.search", "keystrokes", SYMPTOM_SEARCH_INDEX.search, [
+        ((q,), {}) for q in _keystrokes(workloads["chips"])
+    ]
+    yield "autocomplete.search", "typos", SYMPTOM_SEARCH_INDEX.search, [
+        ((q,), {}) for q in _typos(workloads["chips"])
+    ]
+
+    for name in ("chips", "free_text"):
+        yield "ml.predict_disease", name, predict_disease, [
+            ((p.symptoms,), {}) for p in scored[name]
+        ]
+
+    for name, items in scored.items():
+        yield "phase1.process_input", name, process_input, [
+            ((dict(p.record),), {}) for p in prepared[name]
+        ]
+        yield "phase2.detect_neglect", name, detect_neglect, [
+            ((p.triage_input.raw_symptoms, p.symptoms), {}) for p in items
+        ]
+        yield "phase3.detect_silent_emergency", name, detect_silent_emergency, [
+            ((p.symptoms, p.age, p.gender), {}) for p in items
+        ]
+        # The ML prediction is timed on its own above
+        yield "phase4.classify_risk", name, classify_risk, [
+            (
+                (p.symptoms, p.neglect["neglect_detected"], p.silent["silent_risk_flag"]),
+                {"ml_result": p.ml},
+            )
+            for p in items
+        ]
+        yield "phase5.generate_explanation", name, generate_explanation, [
+            (
+                (
+                    p.symptoms,
+                    p.risk["risk_level"],
+                    p.neglect["neglect_detected"],
+                    p.neglect["neglect_reason"],
+                    p.silent["silent_risk_flag"],
+                    p.silent["risk_pattern_explanation"],
+                    p.ml,
+                ),
+                {"age": p.age, "gender": p.gender, "language": p.language},
+            )
+            for p in items
+        ]
+        yield "phase6.generate_outcome_awareness", name, generate_outcome_awareness, [
+            ((p.risk["risk_level"], p.symptoms, p.ml), {"language": p.language})
+            for p in items
+        ]
+        yield "phase7.generate_recommendations", name, generate_recommendations, [
+            ((p.risk["risk_level"], p.ml), {"language": p.language})
+            for p in items
+        ]
+        yield "phase8.evaluate_caregiver_alert", name, evaluate_caregiver_alert, [
+            ((p.risk["risk_level"],), {"age": p.age, "language": p.language})
+            for p in items
+        ]
+
+    # Phase 9 translating a full English response, as for callers that
+    # build responses outside the pipeline
+    english = [
+        pipeline.run_triage({**p.record, "language": "en"})
+        for p in scored["chips"] + scored["free_text"]
+    ]
+    for language in ("hi", "mr"):
+        yield f"phase9.localize_response.{language}", "chips+free_text", localize_response, [
+            ((response, language), {}) for response in english
+        ]
+
+    for name in WORKLOADS:
+        yield "pipeline.run_triage", name, pipeline.run_triage, [
+            ((dict(r),), {}) for r in workloads[name]
+        ]
+
+    # Response encoding per language: Flask's stock provider (ASCII
+    # escapes, from the dict form) against every backend installed here.
+    # Compact output, as served with DEBUG off.
+    app = create_app()
+    providers = {"flask": DefaultJSONProvider(app)}
+    providers.update((backend, cls(app)) for backend, cls in JSON_PROVIDERS.items())
+    for provider in providers.values():
+        provider.compact = True
+    for name in ("free_text", "hindi", "marathi"):
+        results = [pipeline.run_triage_result(dict(r)) for r in workloads[name]]
+        for backend, provider in providers.items():
+            yield f"serialize.{backend}", name, provider.response, [
+                ((result.to_dict() if backend == "flask" else result,), {})
+                for result in results
+            ]
+
+    client = app.test_client()
+    for name in WORKLOADS:
+        yield "api.post_triage", name, client.post, [
+            (("/triage",), {"json": r}) for r in workloads[name]
+        ]
+
+
+# ── Timing ───────────────────────────────────────────────────────────────────
+
+def _time_case(fn, calls, rounds: int) -> dict:
+    """Per-call timings in microseconds over `rounds` passes of `calls`."""
+    for args, kwargs in calls:
+        fn(*args, **kwargs)
+
+    per_call = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(rounds):
+            start = perf_counter()
+            for args, kwargs in calls:
+                fn(*args, **kwargs)
+            per_call.append((perf_counter() - start) / len(calls) * 1e6)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    return {
+        "calls": len(calls),
+        "rounds": rounds,
+        "median_us": round(statistics.median(per_call), 3),
+        "mean_us": round(statistics.fmean(per_call), 3),
+        "min_us": round(min(per_call), 3),
+        "max_us": round(max(per_call), 3),
+        "stdev_us": round(statistics.stdev(per_call), 3) if rounds > 1 else 0.0,
+    }
+
+
+def _measure_allocations(fn, calls) -> float:
+    """Median peak memory allocated per call, in KiB."""
+    peaks = []
+    tracemalloc.start()
+    try:
+        for args, kwargs in calls:
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            fn(*args, **kwargs)
+            peaks.append(tracemalloc.get_traced_memory()[1] - before)
+    finally:
+        tracemalloc.stop()
+    return round(statistics.median(peaks) / 1024, 3)
+
+
+def run_benchmarks(
+    count: int = DEFAULT_COUNT,
+    rounds: int = DEFAULT_ROUNDS,
+    seed: int = DEFAULT_SEED,
+    name_filter: str | None = None,
+    progress=None,
+) -> dict:
+    """Run every (matching) case and return the results document."""
+    cache_size = pipeline.get_cache_stats()["maxsize"]
+    pipeline.configure_cache(0)
+    try:
+        results = {}
+        for name, workload, fn, calls in _build_cases(generate_all(count, seed)):
+            key = f"{name}[{workload}]"
+            if name_filter and name_filter not in key:
+                continue
+            if not calls:
+                continue
+            results[key] = _time_case(fn, calls, rounds)
+            results[key]["alloc_kb"] = _measure_allocations(fn, calls)
+            if progress:
+                progress(key, results[key])
+    finally:
+        pipeline.configure_cache(cache_size)
+
+    return {
+        "version": RESULTS_VERSION,
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": seed,
+            "count": count,
+            "rounds": rounds,
+        },
+        "results": results,
+    }
+
+
+# ── Comparison ───────────────────────────────────────────────────────────────
+
+def compare_results(base: dict, new: dict, threshold: float = DEFAULT_THRESHOLD) -> list[dict]:
+    """
+    Compare median timings case by case.
+
+    Each row has status "regression" (slower by more than `threshold`),
+    "improvement" (faster by more than `threshold`), "same", or
+    "added" / "removed" for cases present in only one run. Peak
+    allocations per call are carried along (None for older result files).
+    """
+    base_results = base.get("results", {})
+    new_results = new.get("results", {})
+    rows = []
+    for key in sorted(base_results.keys() | new_results.keys()):
+        before = base_results.get(key)
+        after = new_results.get(key)
+        if before is None or after is None:
+            rows.append({
+                "case": key,
+                "status": "added" if before is None else "removed",
+                "base_us": before["median_us"] if before else None,
+                "new_us": after["median_us"] if after else None,
+                "ratio": None,
+                "base_kb": before.get("alloc_kb") if before else None,
+                "new_kb": after.get("alloc_kb") if after else None,
+            })
+            continue
+        ratio = after["median_us"] / before["median_us"] if before["median_us"] else float("inf")
+        if ratio > 1 + threshold:
+            status = "regression"
+        elif ratio < 1 - threshold:
+            status = "improvement"
+        else:
+            status = "same"
+        rows.append({
+            "case": key,
+            "status": status,
+            "base_us": before["median_us"],
+            "new_us": after["median_us"],
+            "ratio": round(ratio, 3),
+            "base_kb": before.get("alloc_kb"),
+            "new_kb": after.get("alloc_kb"),
+        })
+    return rows
+
+
+def _format_us(value) -> str:
+    return "-" if value is None else f"{value:,.1f}"
+
+
+def _print_comparison(rows: list[dict]) -> None:
+    width = max((len(r["case"]) for r in rows), default=10)
+    print(
+        f"{'case':<{width}}  {'base µs':>10}  {'new µs':>10}  {'ratio':>7}  "
+        f"{'base KiB':>9}  {'new KiB':>9}  status"
+    )
+    for r in rows:
+        ratio = "-" if r["ratio"] is None else f"{r['ratio']:.2f}x"
+        marker = {"regression": "  ⚠", "improvement": "  ✓"}.get(r["status"], "")
+        print(
+            f"{r['case']:<{width}}  {_format_us(r['base_us']):>10}  "
+            f"{_format_us(r['new_us']):>10}  {ratio:>7}  "
+            f"{_format_us(r['base_kb']):>9}  {_format_us(r['new_kb']):>9}  {r['status']}{marker}"
+        )
+
+
+# ── CLI ──────────────────────────────────────────────────────────────────────
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Triage pipeline benchmarks")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="run the benchmarks and save JSON results")
+    run.add_argument("-o", "--output", help="write results to this JSON file")
+    run.add_argument("-n", "--count", type=int, default=DEFAULT_COUNT,
+                     help="requests generated per workload")
+    run.add_argument("-r", "--rounds", type=int, default=DEFAULT_ROUNDS,
+                     help="timed passes over each case")
+    run.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    run.add_argument("-f", "--filter", help="only run cases whose name contains this")
+
+    cmp_ = sub.add_parser("compare", help="compare two result files")
+    cmp_.add_argument("base")
+    cmp_.add_argument("new")
+    cmp_.add_argument("-t", "--threshold", type=float, default=DEFAULT_THRESHOLD,
+                      help="relative change that counts as a regression (default 0.10)")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        def progress(key, stats):
+            print(f"  {key:<60} {stats['median_us']:>12,.1f} µs {stats['alloc_kb']:>10,.1f} KiB")
+
+        print(f"\n⏱  Running benchmarks ({args.count} requests/workload, {args.rounds} rounds)...")
+        doc = run_benchmarks(args.count, args.rounds, args.seed, args.filter, progress)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                json.dump(doc, f, indent=2)
+            print(f"\n💾 Results saved to {args.output}")
+        return 0
+
+    with open(args.base, encoding="utf-8") as f:
+        base = json.load(f)
+    with open(args.new, encoding="utf-8") as f:
+        new = json.load(f)
+    for field in ("seed", "count"):
+        if base.get("meta", {}).get(field) != new.get("meta", {}).get(field):
+            print(f"⚠  Runs used different {field} values; timings may not be comparable\n")
+    rows = compare_results(base, new, args.threshold)
+    _print_comparison(rows)
+    regressions = sum(r["status"] == "regression" for r in rows)
+    if regressions:
+        print(f"\n⚠  {regressions} regression(s) above {args.threshold:.0%}")
+        return 1
+    print("\n✅ No regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,198 @@
+"""
+Benchmark Workloads
+====================
+Deterministic generators for realistic triage requests:
+
+  • chips      – 1–6 symptoms picked from the selector, no free text
+  • free_text  – long English descriptions with negations and minimizers
+  • hindi      – romanized Hindi free text
+  • marathi    – romanized Marathi free text
+  • hindi_devanagari, marathi_devanagari
+               – Hindi / Marathi typed in Devanagari, with no language
+                 given, so the script path of language detection decides
+                 it. The NLP engine matches romanized phrases only, so
+                 these records also carry selector chips (the text
+                 describes them), as the app sends both; responses then
+                 go through the Hindi / Marathi translators.
+
+The same seed always produces the same requests, so two benchmark runs
+on different code measure the same work.
+"""
+
+import random
+
+from app.engine.nlp import NLP_PHRASE_MAP
+from app.engine.knowledge_base import MINIMIZATION_PHRASES
+from app.engine.translations import SYMPTOM_TRANSLATIONS
+from ml.predictor import get_all_symptoms
+
+DEFAULT_SEED = 20260211
+
+WORKLOADS = ("chips", "free_text", "hindi", "marathi", "hindi_devanagari", "marathi_devanagari")
+
+_AGES = (None, 8, 19, 27, 34, 42, 48, 55, 61, 67, 74, 83)
+_GENDERS = ("male", "female", "")
+
+_EN_OPENERS = (
+    "Since yesterday I have {}",
+    "For the past three days there is {}",
+    "I woke up with {}",
+    "My mother says I have {}",
+    "Along with that I noticed {}",
+    "Today evening I started getting {}",
+)
+_EN_NEGATIONS = (
+    "I don't have {}",
+    "there is no {}",
+    "never had {} before",
+)
+_EN_FILLERS = (
+    "it gets worse at night",
+    "I took a paracetamol in the morning",
+    "I have been working long hours",
+    "nobody else at home is sick",
+    "it comes and goes",
+)
+
+_HI_PHRASES = (
+    "bukhar", "sir dard", "pet dard", "khansi", "gala dard", "badan dard",
+    "chakkar", "ulti", "thakaan", "saans nahi aa rahi",
+    "saans lene mein taklif", "ji ghabra raha",
+)
+_HI_TEMPLATES = (
+    "mujhe {} ho raha hai",
+    "kal se {} hai",
+    "bahut {} hai",
+    "thoda sa {} hai",
+    "mera {} bahut pareshani de raha hai",
+)
+_HI_NEGATIONS = ("{} nahi hai",)
+
+_MR_PHRASES = (
+    "doka dukhtay", "taap", "potaat dukhte", "khokalaa",
+    "shwas ghene kathin", "chakkar", "ulti",
+)
+_MR_TEMPLATES = (
+    "mala {} aahe",
+    "kalpasun {} hotay",
+    "khup {} aahe",
+    "thoda {} aahe",
+    "mazha {} tras det aahe",
+)
+_MR_NEGATIONS = ("{} nahi",)
+
+_HI_DEVANAGARI_TEMPLATES = (
+    "मुझे {} हो रहा है",
+    "कल से {} है",
+    "बहुत {} है",
+    "थोड़ा सा {} है",
+    "मेरा {} बहुत परेशानी दे रहा है",
+)
+_HI_DEVANAGARI_NEGATIONS = ("{} नहीं है",)
+
+_MR_DEVANAGARI_TEMPLATES = (
+    "मला {} आहे",
+    "कालपासून {} होतंय",
+    "खूप {} आहे",
+    "थोडा {} आहे",
+    "माझा {} त्रास देत आहे",
+)
+_MR_DEVANAGARI_NEGATIONS = ("{} नाही",)
+
+
+def _known(phrases) -> list[str]:
+    """Keep only phrases the NLP engine actually recognizes."""
+    return [p for p in phrases if p in NLP_PHRASE_MAP]
+
+
+def _base_record(rng: random.Random, language: str) -> dict:
+    record = {"gender": rng.choice(_GENDERS), "language": language}
+    age = rng.choice(_AGES)
+    if age is not None:
+        record["age"] = age
+    return record
+
+
+def _chips(rng: random.Random) -> dict:
+    record = _base_record(rng, "en")
+    record["symptoms"] = rng.sample(get_all_symptoms(), rng.randint(1, 6))
+    return record
+
+
+def _free_text(rng: random.Random, phrases: list[str]) -> dict:
+    record = _base_record(rng, "en")
+    sentences = []
+    for _ in range(rng.randint(4, 9)):
+        roll = rng.random()
+        if roll < 0.6:
+            sentences.append(rng.choice(_EN_OPENERS).format(rng.choice(phrases)))
+        elif roll < 0.75:
+            sentences.append(rng.choice(_EN_NEGATIONS).format(rng.choice(phrases)))
+        else:
+            sentences.append(rng.choice(_EN_FILLERS))
+    if rng.random() < 0.3:
+        sentences.append(f"it is {rng.choice(MINIMIZATION_PHRASES)}, nothing much")
+    record["raw_text"] = ". ".join(sentences) + "."
+    return record
+
+
+def _regional(rng, language, phrases, templates, negations) -> dict:
+    record = _base_record(rng, language)
+    parts = []
+    for _ in range(rng.randint(2, 5)):
+        pool = negations if rng.random() < 0.15 else templates
+        parts.append(rng.choice(pool).format(rng.choice(phrases)))
+    record["raw_text"] = ", ".join(parts)
+    return record
+
+
+def _devanagari(rng, language, templates, negations) -> dict:
+    record = _base_record(rng, language)
+    del record["language"]
+    names = SYMPTOM_TRANSLATIONS[language]
+    pool = [s for s in get_all_symptoms() if s in names]
+    record["symptoms"] = rng.sample(pool, rng.randint(1, 4))
+    parts = [rng.choice(templates).format(names[s]) for s in record["symptoms"]]
+    if rng.random() < 0.3:
+        parts.append(rng.choice(negations).format(names[rng.choice(pool)]))
+    record["raw_text"] = ", ".join(parts)
+    return record
+
+
+def generate(workload: str, count: int, seed: int = DEFAULT_SEED) -> list[dict]:
+    """Return `count` triage request dicts for `workload`."""
+    if workload not in WORKLOADS:
+        raise ValueError(f"Unknown workload: {workload}")
+    rng = random.Random(f"{seed}:{workload}")
+
+    if workload == "chips":
+        return [_chips(rng) for _ in range(count)]
+    if workload == "free_text":
+        phrases = sorted(NLP_PHRASE_MAP)
+        return [_free_text(rng, phrases) for _ in range(count)]
+    if workload == "hindi":
+        phrases = _known(_HI_PHRASES)
+        return [
+            _regional(rng, "hi", phrases, _HI_TEMPLATES, _HI_NEGATIONS)
+            for _ in range(count)
+        ]
+    if workload == "marathi":
+        phrases = _known(_MR_PHRASES)
+        return [
+            _regional(rng, "mr", phrases, _MR_TEMPLATES, _MR_NEGATIONS)
+            for _ in range(count)
+        ]
+    if workload == "hindi_devanagari":
+        return [
+            _devanagari(rng, "hi", _HI_DEVANAGARI_TEMPLATES, _HI_DEVANAGARI_NEGATIONS)
+            for _ in range(count)
+        ]
+    return [
+        _devanagari(rng, "mr", _MR_DEVANAGARI_TEMPLATES, _MR_DEVANAGARI_NEGATIONS)
+        for _ in range(count)
+    ]
+
+
+def generate_all(count: int, seed: int = DEFAULT_SEED) -> dict[str, list[dict]]:
+    """Every workload, `count` requests each."""
+    return {name: generate(name, count, seed) for name in WORKLOADS}
@@ -0,0 +1,169 @@
+"""
+Model Artifact Bundle
+======================
+Everything the predictor needs, in one versioned directory (ml/artifacts/):
+
+  - manifest.json    – format version, model summary, SHA-256 of every file
+  - metadata.json    – symptom columns, class names, severity map, disease info
+  - nb_weights_t.npy – folded Naive Bayes weights / bias (NB models only),
+    nb_bias.npy        opened with np.load(mmap_mode="r") so forked workers
+                       share the pages instead of each holding a copy
+  - model.pkl        – the fitted sklearn estimator, for the "sklearn" backend
+
+Written by ml/train_model.py, read by ml/predictor.py. The loader
+rejects bundles of another format version and files whose checksum
+does not match the manifest.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import shutil
+from datetime import datetime, timezone
+
+import numpy as np
+
+ARTIFACT_FORMAT = "avalon-triage-artifacts"
+ARTIFACT_VERSION = 1
+
+MANIFEST_FILE = "manifest.json"
+METADATA_FILE = "metadata.json"
+MODEL_FILE = "model.pkl"
+NB_WEIGHTS_FILE = "nb_weights_t.npy"
+NB_BIAS_FILE = "nb_bias.npy"
+
+
+class ArtifactError(RuntimeError):
+    """The artifact bundle is missing, of another version, or corrupted."""
+
+
+def _sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _files_checksum(files: dict) -> str:
+    """Checksum over the per-file entries, so the manifest itself is covered."""
+    return hashlib.sha256(json.dumps(files, sort_keys=True).encode()).hexdigest()
+
+
+class ArtifactBundle:
+    """Read-only view of an artifact bundle directory."""
+
+    __slots__ = ("path", "manifest", "_metadata")
+
+    def __init__(self, path: str, verify: bool = True):
+        self.path = path
+        manifest_path = os.path.join(path, MANIFEST_FILE)
+        try:
+            with open(manifest_path, encoding="utf-8") as f:
+                self.manifest = json.load(f)
+        except FileNotFoundError:
+            raise ArtifactError(
+                f"No artifact bundle at {path}; run ml/train_model.py"
+            ) from None
+
+        if self.manifest.get("format") != ARTIFACT_FORMAT:
+            raise ArtifactError(f"{manifest_path} is not a {ARTIFACT_FORMAT} manifest")
+        version = self.manifest.get("version")
+        if version != ARTIFACT_VERSION:
+            raise ArtifactError(
+                f"Artifact bundle version {version} is not supported "
+                f"(expected {ARTIFACT_VERSION}); retrain with ml/train_model.py"
+            )
+        if verify:
+            self.verify()
+        self._metadata = None
+
+    def verify(self) -> None:
+        """Check the manifest checksum and every file's SHA-256."""
+        files = self.manifest.get("files", {})
+        if _files_checksum(files) != self.manifest.get("checksum"):
+            raise ArtifactError(f"Manifest checksum mismatch in {self.path}")
+        for name, entry in files.items():
+            path = os.path.join(self.path, name)
+            if not os.path.exists(path):
+                raise ArtifactError(f"Artifact file missing: {name}")
+            if _sha256(path) != entry["sha256"]:
+                raise ArtifactError(f"Checksum mismatch for artifact file: {name}")
+
+    def has(self, name: str) -> bool:
+        return name in self.manifest.get("files", {})
+
+    @property
+    def model_info(self) -> dict:
+        return self.manifest.get("model", {})
+
+    @property
+    def metadata(self) -> dict:
+        if self._metadata is None:
+            with open(os.path.join(self.path, METADATA_FILE), encoding="utf-8") as f:
+                self._metadata = json.load(f)
+        return self._metadata
+
+    def array(self, name: str) -> np.ndarray:
+        """A read-only, memory-mapped array from the bundle."""
+        if not self.has(name):
+            raise ArtifactError(f"Artifact bundle has no {name}")
+        return np.asarray(np.load(os.path.join(self.path, name), mmap_mode="r"))
+
+    def load_model(self):
+        """Unpickle the sklearn estimator (imports scikit-learn)."""
+        with open(os.path.join(self.path, MODEL_FILE), "rb") as f:
+            return pickle.load(f)
+
+
+def write_bundle(
+    path: str,
+    *,
+    model,
+    model_info: dict,
+    metadata: dict,
+    arrays: dict[str, np.ndarray] | None = None,
+) -> dict:
+    """
+    Write a complete bundle to `path` and return its manifest.
+
+    The bundle is assembled in a sibling directory and swapped in at the
+    end, so readers never see a half-written bundle.
+    """
+    staging = f"{path}.new"
+    shutil.rmtree(staging, ignore_errors=True)
+    os.makedirs(staging)
+
+    with open(os.path.join(staging, METADATA_FILE), "w", encoding="utf-8") as f:
+        json.dump(metadata, f, ensure_ascii=False, indent=1)
+    with open(os.path.join(staging, MODEL_FILE), "wb") as f:
+        pickle.dump(model, f)
+    for name, array in (arrays or {}).items():
+        np.save(os.path.join(staging, name), np.ascontiguousarray(array))
+
+    files = {
+        name: {
+            "sha256": _sha256(os.path.join(staging, name)),
+            "bytes": os.path.getsize(os.path.join(staging, name)),
+        }
+        for name in sorted(os.listdir(staging))
+    }
+    manifest = {
+        "format": ARTIFACT_FORMAT,
+        "version": ARTIFACT_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "model": model_info,
+        "files": files,
+        "checksum": _files_checksum(files),
+    }
+    with open(os.path.join(staging, MANIFEST_FILE), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+
+    previous = f"{path}.old"
+    shutil.rmtree(previous, ignore_errors=True)
+    if os.path.exists(path):
+        os.rename(path, previous)
+    os.rename(staging, path)
+    shutil.rmtree(previous, ignore_errors=True)
+    return manifest
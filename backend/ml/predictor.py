@@ -1,62 +1,276 @@
 """
 ML Predictor – loads trained model artifacts and provides prediction API.
+
+All artifacts come from one versioned bundle (see ml/bundle.py). Two
+scoring backends:
+  • "numpy"   – folded Naive Bayes parameters, memory-mapped from the
+                bundle and scored with one matrix product + log-sum-exp.
+                Never imports scikit-learn.
+  • "sklearn" – the pickled estimator in the bundle.
+"auto" (default) uses numpy when the bundle has Naive Bayes parameters.
+Override with the AVALON_PREDICTOR_BACKEND environment variable; point
+AVALON_ARTIFACT_DIR at another bundle to serve it instead.
 """
 
 import os
-import pickle
 import numpy as np
 
+from ml.bundle import ArtifactBundle, NB_BIAS_FILE, NB_WEIGHTS_FILE
+
 ML_DIR = os.path.dirname(os.path.abspath(__file__))
+ARTIFACT_DIR = os.environ.get("AVALON_ARTIFACT_DIR", os.path.join(ML_DIR, "artifacts"))
+PREDICTOR_BACKEND = os.environ.get("AVALON_PREDICTOR_BACKEND", "auto")
 
 # ── Lazy-loaded singletons ───────────────────────────────────────────────────
+_bundle = None
 _model = None
-_label_encoder = None
 _symptom_columns = None
 _severity_map = None
 _disease_info = None
+_symptom_index = None
+_label_names = None
+
+
+def get_bundle() -> ArtifactBundle:
+    global _bundle
+    if _bundle is None:
+        _bundle = ArtifactBundle(ARTIFACT_DIR)
+    return _bundle
+
+
+def fold_naive_bayes(kind: str, class_log_prior, feature_log_prob) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Fold Naive Bayes log-probabilities into (W.T, b) with jll = X @ W.T + b.
+    Returns the transposed weights (features × classes) and the bias.
+    """
+    class_log_prior = np.asarray(class_log_prior, dtype=np.float64)
+    feature_log_prob = np.asarray(feature_log_prob, dtype=np.float64)
+    if kind == "multinomial":
+        weights = feature_log_prob
+        bias = class_log_prior
+    elif kind == "bernoulli":
+        neg_prob = np.log1p(-np.exp(feature_log_prob))
+        weights = feature_log_prob - neg_prob
+        bias = class_log_prior + neg_prob.sum(axis=1)
+    else:
+        raise ValueError(f"Unsupported Naive Bayes kind: {kind}")
+    return np.ascontiguousarray(weights.T), bias
+
+
+class NumpyNaiveBayes:
+    """
+    Naive Bayes scorer over folded parameters (see fold_naive_bayes).
+
+    Mirrors the predict / predict_proba interface of the sklearn model
+    it was exported from; `predict` returns class indices and
+    `class_names` maps them to disease names.
+    """
+
+    def __init__(self, weights_t: np.ndarray, bias: np.ndarray, class_names, kind: str = "multinomial"):
+        self.kind = kind
+        self._weights_t = weights_t
+        self._bias = bias
+        self.class_names = np.asarray(class_names, dtype=object)
+        self.classes_ = np.arange(len(self.class_names))
+        self.n_features_in_ = weights_t.shape[0]
+
+    @classmethod
+    def from_params(cls, kind: str, class_log_prior, feature_log_prob, class_names) -> "NumpyNaiveBayes":
+        """Build from raw sklearn parameters (class_log_prior_, feature_log_prob_)."""
+        weights_t, bias = fold_naive_bayes(kind, class_log_prior, feature_log_prob)
+        return cls(weights_t, bias, class_names, kind)
+
+    @classmethod
+    def from_bundle(cls, bundle: ArtifactBundle) -> "NumpyNaiveBayes":
+        """Memory-map the folded parameters stored in an artifact bundle."""
+        return cls(
+            bundle.array(NB_WEIGHTS_FILE),
+            bundle.array(NB_BIAS_FILE),
+            bundle.metadata["classes"],
+            bundle.model_info.get("naive_bayes"),
+        )
+
+    def _joint_log_likelihood(self, X) -> np.ndarray:
+        return np.asarray(X, dtype=np.float64) @ self._weights_t + self._bias
 
+    def predict(self, X) -> np.ndarray:
+        return self._joint_log_likelihood(X).argmax(axis=1)
 
-def _load(filename):
-    path = os.path.join(ML_DIR, filename)
-    with open(path, "rb") as f:
-        return pickle.load(f)
+    def predict_proba(self, X) -> np.ndarray:
+        jll = self._joint_log_likelihood(X)
+        jll -= jll.max(axis=1, keepdims=True)
+        np.exp(jll, out=jll)
+        jll /= jll.sum(axis=1, keepdims=True)
+        return jll
+
+
+def _use_numpy_backend() -> bool:
+    if PREDICTOR_BACKEND == "numpy":
+        return True
+    if PREDICTOR_BACKEND == "sklearn":
+        return False
+    return get_bundle().has(NB_WEIGHTS_FILE)
 
 
 def get_model():
     global _model
     if _model is None:
-        _model = _load("model.pkl")
+        if _use_numpy_backend():
+            _model = NumpyNaiveBayes.from_bundle(get_bundle())
+        else:
+            _model = get_bundle().load_model()
     return _model
 
 
-def get_label_encoder():
-    global _label_encoder
-    if _label_encoder is None:
-        _label_encoder = _load("label_encoder.pkl")
-    return _label_encoder
-
-
 def get_symptom_columns() -> list[str]:
     global _symptom_columns
     if _symptom_columns is None:
-        _symptom_columns = _load("symptom_columns.pkl")
+        _symptom_columns = get_bundle().metadata["symptom_columns"]
     return _symptom_columns
 
 
 def get_severity_map() -> dict[str, int]:
     global _severity_map
     if _severity_map is None:
-        _severity_map = _load("severity_map.pkl")
+        _severity_map = get_bundle().metadata["severity_map"]
     return _severity_map
 
 
 def get_disease_info() -> dict:
     global _disease_info
     if _disease_info is None:
-        _disease_info = _load("disease_info.pkl")
+        _disease_info = get_bundle().metadata["disease_info"]
     return _disease_info
 
 
+def get_symptom_index() -> dict[str, int]:
+    """Symptom name → feature column index, built once."""
+    global _symptom_index
+    if _symptom_index is None:
+        _symptom_index = {s: i for i, s in enumerate(get_symptom_columns())}
+    return _symptom_index
+
+
+def get_label_names() -> np.ndarray:
+    """Class index → disease name, so decoding is a plain array lookup."""
+    global _label_names
+    if _label_names is None:
+        _label_names = np.asarray(get_bundle().metadata["classes"], dtype=object)
+    return _label_names
+
+
+def load_artifacts() -> None:
+    """Load every lazy artifact now instead of on the first prediction."""
+    get_model()
+    get_symptom_index()
+    get_label_names()
+    get_severity_map()
+    get_disease_info()
+
+
+def artifact_status() -> dict[str, bool]:
+    """Which lazy artifacts this process has loaded (loads nothing)."""
+    return {
+        "bundle": _bundle is not None,
+        "model": _model is not None,
+        "symptom_columns": _symptom_columns is not None,
+        "symptom_index": _symptom_index is not None,
+        "label_names": _label_names is not None,
+        "severity_map": _severity_map is not None,
+        "disease_info": _disease_info is not None,
+    }
+
+
+def bundle_info() -> dict | None:
+    """Version and model summary of the loaded bundle, or None if not loaded yet."""
+    if _bundle is None:
+        return None
+    manifest = _bundle.manifest
+    if _model is None:
+        backend = None
+    else:
+        backend = "numpy" if isinstance(_model, NumpyNaiveBayes) else "sklearn"
+    return {
+        "format": manifest["format"],
+        "version": manifest["version"],
+        "checksum": manifest["checksum"],
+        "created": manifest.get("created"),
+        "model": _bundle.model_info.get("name"),
+        "backend": backend,
+    }
+
+
+def build_feature_matrix(batch: list[list[str]]) -> np.ndarray:
+    """Build the N×131 binary feature matrix for a batch of symptom lists."""
+    col_index = get_symptom_index()
+    rows = []
+    cols = []
+    for row, symptoms in enumerate(batch):
+        for symptom in symptoms:
+            i = col_index.get(symptom.strip().lower())
+            if i is not None:
+                rows.append(row)
+                cols.append(i)
+
+    features = np.zeros((len(batch), len(col_index)), dtype=int)
+    features[rows, cols] = 1
+    return features
+
+
+def predict_disease_batch(batch: list[list[str]]) -> list[dict]:
+    """
+    Predict diseases for many symptom lists at once.
+
+    Runs a single predict_proba over the whole N×131 matrix and picks
+    argmax / top 3 with vectorized NumPy ops. Each entry in the returned
+    list has the same shape as `predict_disease`.
+    """
+    if not batch:
+        return []
+
+    model = get_model()
+    names = get_label_names()
+    disease_db = get_disease_info()
+    features = build_feature_matrix(batch)
+
+    if hasattr(model, "predict_proba"):
+        probas = model.predict_proba(features)
+        n = len(batch)
+        k = min(3, probas.shape[1])
+        predictions = probas.argmax(axis=1)
+        confidences = probas[np.arange(n), predictions]
+
+        # Top 3 by a stable sort, so equal probabilities keep the lower
+        # class index first, like argmax: top_3[0] is always the prediction
+        top_idx = np.argsort(-probas, axis=1, kind="stable")[:, :k]
+        top_p = np.take_along_axis(probas, top_idx, axis=1).round(4)
+        top_names = names[top_idx]
+
+        top_3s = [
+            list(zip(top_names[r].tolist(), top_p[r].tolist()))
+            for r in range(n)
+        ]
+    else:
+        predictions = model.predict(features)
+        confidences = np.ones(len(batch))
+        top_3s = [[(names[p], 1.0)] for p in predictions]
+
+    results = []
+    for prediction, confidence, top_3 in zip(predictions, confidences, top_3s):
+        disease_name = names[prediction]
+        info = disease_db.get(disease_name, {})
+        results.append({
+            "predicted_disease": disease_name,
+            "confidence": round(float(confidence), 4),
+            "top_3": top_3,
+            "disease_description": info.get("description", ""),
+            "precautions": info.get("precautions", []),
+            "severity_tier": info.get("severity_tier", "Low"),
+        })
+
+    return results
+
+
 def predict_disease(symptoms: list[str]) -> dict:
     """
     Given a list of normalized symptom names, predict the disease.
@@ -71,47 +285,7 @@ def predict_disease(symptoms: list[str]) -> dict:
             "severity_tier": "Low" | "Medium" | "High",
         }
     """
-    model = get_model()
-    le = get_label_encoder()
-    columns = get_symptom_columns()
-    disease_db = get_disease_info()
-
-    # Build binary feature vector
-    feature_vector = np.zeros((1, len(columns)), dtype=int)
-    col_index = {s: i for i, s in enumerate(columns)}
-    for symptom in symptoms:
-        s = symptom.strip().lower()
-        if s in col_index:
-            feature_vector[0, col_index[s]] = 1
-
-    # Predict
-    prediction = model.predict(feature_vector)[0]
-    disease_name = le.inverse_transform([prediction])[0]
-
-    # Probabilities (top 3)
-    if hasattr(model, "predict_proba"):
-        probas = model.predict_proba(feature_vector)[0]
-        top_indices = np.argsort(probas)[::-1][:3]
-        top_3 = [
-            (le.inverse_transform([i])[0], round(float(probas[i]), 4))
-            for i in top_indices
-        ]
-        confidence = float(probas[prediction])
-    else:
-        top_3 = [(disease_name, 1.0)]
-        confidence = 1.0
-
-    # Disease info
-    info = disease_db.get(disease_name, {})
-
-    return {
-        "predicted_disease": disease_name,
-        "confidence": round(confidence, 4),
-        "top_3": top_3,
-        "disease_description": info.get("description", ""),
-        "precautions": info.get("precautions", []),
-        "severity_tier": info.get("severity_tier", "Low"),
-    }
+    return predict_disease_batch([symptoms])[0]
 
 
 def get_all_symptoms() -> list[str]:
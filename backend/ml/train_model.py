@@ -2,7 +2,8 @@
 ML Model Training Pipeline for Health Triage Copilot
 =====================================================
 Trains multiple classifiers on the disease-symptom dataset,
-evaluates accuracy / precision / recall / F1, and saves the best model.
+evaluates accuracy / precision / recall / F1 and inference latency,
+and saves the best model (most accurate; ties go to the fastest).
 
 Dataset:
   - dataset.csv:             Disease → Symptom_1..Symptom_17
@@ -11,22 +12,29 @@ Dataset:
   - symptom_precaution.csv:  Disease → 4 precautions
 
 Output files (saved to ml/ directory):
-  - model.pkl             – best trained classifier
-  - label_encoder.pkl     – LabelEncoder for disease names
-  - symptom_columns.pkl   – ordered list of all 131 symptom feature names
-  - severity_map.pkl      – symptom → severity weight mapping
-  - disease_info.pkl      – disease → {description, precautions, severity_tier}
+  - artifacts/            – versioned bundle read by ml/predictor.py (see ml/bundle.py):
+      manifest.json       – format version, model summary, per-file SHA-256
+      metadata.json       – 131 symptom columns, disease names, severity map,
+                            disease → {description, precautions, severity_tier}
+      model.pkl           – best trained classifier
+      nb_weights_t.npy,   – folded Naive Bayes parameters for sklearn-free serving
+      nb_bias.npy           (only when the best model is Multinomial/Bernoulli NB)
   - training_report.txt   – full evaluation metrics
 """
 
 import os
 import sys
 import pickle
+import argparse
 import warnings
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
 
 import numpy as np
 import pandas as pd
-from sklearn.model_selection import train_test_split, cross_val_score, StratifiedKFold
+from scipy import sparse as sp
+from sklearn.base import clone
+from sklearn.model_selection import train_test_split, StratifiedKFold
 from sklearn.preprocessing import LabelEncoder
 from sklearn.naive_bayes import MultinomialNB, BernoulliNB, GaussianNB
 from sklearn.tree import DecisionTreeClassifier
@@ -50,6 +58,15 @@ DATA_DIR = BASE_DIR  # CSVs are in backend/
 ML_DIR = os.path.join(BASE_DIR, "ml")
 os.makedirs(ML_DIR, exist_ok=True)
 
+ARTIFACT_DIR = os.path.join(ML_DIR, "artifacts")
+
+# Allow `python ml/train_model.py` to import the serving code in ml/
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+from ml.bundle import NB_BIAS_FILE, NB_WEIGHTS_FILE, write_bundle  # noqa: E402
+from ml.predictor import NumpyNaiveBayes, fold_naive_bayes  # noqa: E402
+
 
 # ── Disease severity tiers (for triage risk mapping) ─────────────────────────
 HIGH_SEVERITY_DISEASES = {
@@ -88,38 +105,82 @@ def clean_dataset(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
-def build_binary_features(df: pd.DataFrame):
+def build_binary_features(df: pd.DataFrame, sparse: bool = False):
     """
     Convert the multi-column symptom format into a binary feature matrix.
     Each unique symptom becomes a column (1 = present, 0 = absent).
-    Returns: (feature_df, symptom_columns_sorted)
+
+    Vectorized: the symptom cells are factorized once, only the distinct
+    values are cleaned, and the ones are scattered in a single indexed
+    assignment, so the cost grows with the number of cells rather than
+    with a per-row Python loop.
+
+    Returns: (feature_df, symptom_columns_sorted), or with `sparse=True`
+    (scipy CSR matrix, symptom_columns_sorted).
     """
     symptom_cols = [c for c in df.columns if c.startswith("Symptom")]
+    n_rows, n_cols = len(df), len(symptom_cols)
 
-    # Collect all unique symptoms
-    all_symptoms = set()
-    for col in symptom_cols:
-        vals = df[col].dropna().str.strip().unique()
-        all_symptoms.update(v for v in vals if v and v != "nan")
-    all_symptoms.discard("")
+    # One code per distinct cell value, row-major over the symptom columns
+    cells = df[symptom_cols].to_numpy(dtype=object).ravel()
+    codes, uniques = pd.factorize(cells)
 
-    symptom_list = sorted(all_symptoms)
+    # Clean the distinct values only; blanks and "nan" are not symptoms
+    cleaned = [str(v).strip() for v in uniques]
+    symptom_list = sorted({v for v in cleaned if v and v != "nan"})
     print(f"  Total unique symptoms: {len(symptom_list)}")
 
-    # Build binary matrix
-    binary_data = np.zeros((len(df), len(symptom_list)), dtype=int)
     symptom_index = {s: i for i, s in enumerate(symptom_list)}
+    lookup = np.array([symptom_index.get(v, -1) for v in cleaned] + [-1], dtype=np.int64)
+    # Missing cells factorize to -1, which picks the trailing -1 above
+    columns = lookup[codes]
+    present = columns >= 0
+    rows = np.repeat(np.arange(n_rows), n_cols)[present]
+    columns = columns[present]
+
+    if sparse:
+        matrix = sp.csr_matrix(
+            (np.ones(len(rows), dtype=int), (rows, columns)),
+            shape=(n_rows, len(symptom_list)),
+        )
+        # A symptom listed twice in one row is still a single 1
+        matrix.data.fill(1)
+        return matrix, symptom_list
 
-    for _, row in df.iterrows():
-        for col in symptom_cols:
-            symptom = str(row[col]).strip()
-            if symptom and symptom != "nan" and symptom in symptom_index:
-                binary_data[row.name, symptom_index[symptom]] = 1
+    binary_data = np.zeros((n_rows, len(symptom_list)), dtype=int)
+    binary_data[rows, columns] = 1
 
     feature_df = pd.DataFrame(binary_data, columns=symptom_list)
     return feature_df, symptom_list
 
 
+# Models for which fitting unique rows with `sample_weight` = duplicate
+# counts is the same as fitting the duplicated rows. RandomForest
+# (bootstrap draws rows), SVM (Platt scaling cross-validates over rows)
+# and KNN (no weights; duplicates are neighbours) keep the full data.
+WEIGHT_EQUIVALENT_MODELS = (
+    MultinomialNB,
+    BernoulliNB,
+    GaussianNB,
+    DecisionTreeClassifier,
+    GradientBoostingClassifier,
+)
+
+
+def compact_rows(X, y):
+    """
+    Collapse duplicate (label, feature row) pairs of a dense matrix.
+
+    Returns (X_unique, y_unique, weights): each unique pair once, in
+    order of first appearance, weighted by how often it occurred.
+    """
+    keys = np.column_stack([y, X])
+    _, first, counts = np.unique(keys, axis=0, return_index=True, return_counts=True)
+    order = np.argsort(first)
+    rows = first[order]
+    return X[rows], y[rows], counts[order]
+
+
 def build_severity_map(severity_df: pd.DataFrame) -> dict:
     """Build symptom → weight mapping."""
     severity_df["Symptom"] = severity_df["Symptom"].str.strip().str.lower()
@@ -161,8 +222,222 @@ def build_disease_info(descriptions_df, precautions_df) -> dict:
     return info
 
 
-def train_and_evaluate(X_train, X_test, y_train, y_test, le: LabelEncoder):
-    """Train multiple models, evaluate, and return the best one."""
+# ── Training tasks ──────────────────────────────────────────────────────────
+# Every unit of work (one full fit, one CV fold) is a top-level function of
+# the model and fold number, so the serial and parallel modes run exactly
+# the same code. The data is handed to each worker process once, at start-up.
+
+_task_data: dict = {}
+
+
+def _init_tasks(X_train, y_train, X_test, cv_splits, compact=True, single_threaded=False):
+    _task_data.update(
+        X_train=X_train,
+        y_train=y_train,
+        X_test=X_test,
+        cv_splits=cv_splits,
+        compact=compact,
+        single_threaded=single_threaded,
+    )
+
+
+def _trains_compact(model) -> bool:
+    return _task_data["compact"] and isinstance(model, WEIGHT_EQUIVALENT_MODELS)
+
+
+def _training_rows(model, rows=None):
+    """(X, y, fit kwargs) for `model`, over the given training rows (default all)."""
+    X, y = _task_data["X_train"], _task_data["y_train"]
+    if rows is not None:
+        X, y = X[rows], y[rows]
+    if _trains_compact(model):
+        X, y, weights = compact_rows(X, y)
+        return X, y, {"sample_weight": weights}
+    return X, y, {}
+
+
+def _fresh(model):
+    """Unfitted copy of `model`; in a worker, without nested parallelism."""
+    est = clone(model)
+    if _task_data["single_threaded"] and "n_jobs" in est.get_params():
+        # Same fitted trees either way; avoids oversubscribing the pool
+        est.set_params(n_jobs=1)
+    return est
+
+
+def _fit_task(model):
+    """Fit on the full training split; return the model and test predictions."""
+    X, y, fit_kwargs = _training_rows(model)
+    est = _fresh(model)
+    est.fit(X, y, **fit_kwargs)
+    return est, est.predict(_task_data["X_test"])
+
+
+def _cv_task(model, fold: int) -> float:
+    """Accuracy of `model` on one cross-validation fold."""
+    train_idx, val_idx = _task_data["cv_splits"][fold]
+    X, y, fit_kwargs = _training_rows(model, train_idx)
+    est = _fresh(model)
+    est.fit(X, y, **fit_kwargs)
+    X_val, y_val = _task_data["X_train"][val_idx], _task_data["y_train"][val_idx]
+    return accuracy_score(y_val, est.predict(X_val))
+
+
+def _run_training_tasks(
+    models: dict, X_train, y_train, X_test, cv_splits, n_jobs: int, compact: bool = True,
+):
+    """
+    Fit every model and score every CV fold.
+
+    Returns {name: (fitted_model, y_pred, cv_scores)}. Results are
+    collected by (model, fold), never by completion order, so a parallel
+    run produces the same numbers as a serial one.
+    """
+    n_folds = len(cv_splits)
+    fits, folds = {}, {}
+
+    if n_jobs == 1:
+        _init_tasks(X_train, y_train, X_test, cv_splits, compact)
+        for name, model in models.items():
+            print(f"\n  Training {name}...")
+            fits[name] = _fit_task(model)
+            for fold in range(n_folds):
+                folds[name, fold] = _cv_task(model, fold)
+    else:
+        print(f"\n  Training {len(models)} models × {n_folds} CV folds on {n_jobs} workers...")
+        with ProcessPoolExecutor(
+            max_workers=n_jobs,
+            initializer=_init_tasks,
+            initargs=(X_train, y_train, X_test, cv_splits, compact, True),
+        ) as pool:
+            fit_futures = {name: pool.submit(_fit_task, model) for name, model in models.items()}
+            fold_futures = {
+                (name, fold): pool.submit(_cv_task, model, fold)
+                for name, model in models.items()
+                for fold in range(n_folds)
+            }
+            fits = {name: f.result() for name, f in fit_futures.items()}
+            folds = {key: f.result() for key, f in fold_futures.items()}
+
+    return {
+        name: (*fits[name], np.array([folds[name, fold] for fold in range(n_folds)]))
+        for name in models
+    }
+
+
+def _resolve_jobs(n_jobs: int | None) -> int:
+    """Worker count: None or 1 → serial, -1 (any value < 1) → all CPUs."""
+    if n_jobs is None:
+        return 1
+    if n_jobs < 1:
+        return os.cpu_count() or 1
+    return n_jobs
+
+
+# ── Inference cost & model selection ────────────────────────────────────────
+# Every candidate scores the same on this dataset, so picking "the most
+# accurate" alone tends to keep whichever model happened to come first.
+# The latency policy breaks ties (within `accuracy_tolerance`) by
+# single-row serving latency, which is what /triage pays per request.
+# Naive Bayes models that export to the NumPy backend are timed through
+# that backend, since that is what ml.predictor serves them with.
+
+SELECTION_POLICIES = ("latency", "accuracy")
+DEFAULT_SELECTION = "latency"
+LATENCY_SAMPLE_ROWS = 50
+LATENCY_REPEATS = 3
+# Latencies within this factor of the fastest count as a tie (timing noise)
+LATENCY_TIE_RATIO = 1.10
+
+
+def _serving_model(model):
+    """The object ml.predictor would serve `model` with, and its backend name."""
+    nb = naive_bayes_params(model)
+    if nb is not None:
+        return NumpyNaiveBayes.from_params(**nb, class_names=model.classes_), "numpy"
+    return model, "sklearn"
+
+
+def measure_inference(model, X) -> dict:
+    """
+    Single-row and batch predict_proba latency, and pickled size.
+
+    Exportable Naive Bayes models are timed through the NumPy serving
+    backend. Returns {"single_row_us", "batch_us_per_row", "size_kb",
+    "backend"}; the latencies are the median (single row) / best (batch)
+    of a few passes.
+    """
+    served, backend = _serving_model(model)
+    infer = served.predict_proba if hasattr(served, "predict_proba") else served.predict
+    rows = [X[i:i + 1] for i in range(min(LATENCY_SAMPLE_ROWS, len(X)))]
+    infer(rows[0])  # warm-up
+
+    single = []
+    for _ in range(LATENCY_REPEATS):
+        for row in rows:
+            start = perf_counter()
+            infer(row)
+            single.append(perf_counter() - start)
+
+    batch = []
+    for _ in range(LATENCY_REPEATS):
+        start = perf_counter()
+        infer(X)
+        batch.append(perf_counter() - start)
+
+    return {
+        "single_row_us": float(np.median(single)) * 1e6,
+        "batch_us_per_row": min(batch) / len(X) * 1e6,
+        "size_kb": len(pickle.dumps(model)) / 1024,
+        "backend": backend,
+    }
+
+
+def select_best_model(
+    results: dict,
+    selection: str = DEFAULT_SELECTION,
+    accuracy_tolerance: float = 0.0,
+) -> str:
+    """
+    Pick the best model name from `results` (in training order).
+
+    "accuracy": the first model to reach the top accuracy.
+    "latency":  among models within `accuracy_tolerance` of the top
+                accuracy, the one with the lowest single-row latency;
+                models within LATENCY_TIE_RATIO of the fastest are
+                treated as equal and the earliest one wins.
+    """
+    if selection not in SELECTION_POLICIES:
+        raise ValueError(f"Unknown selection policy: {selection}")
+    top = max(r["accuracy"] for r in results.values())
+    if selection == "accuracy":
+        return next(name for name, r in results.items() if r["accuracy"] == top)
+    eligible = [name for name, r in results.items() if r["accuracy"] >= top - accuracy_tolerance]
+    fastest = min(results[name]["single_row_us"] for name in eligible)
+    return next(
+        name for name in eligible
+        if results[name]["single_row_us"] <= fastest * LATENCY_TIE_RATIO
+    )
+
+
+def train_and_evaluate(
+    X_train, X_test, y_train, y_test, le: LabelEncoder,
+    n_jobs: int = 1,
+    selection: str = DEFAULT_SELECTION,
+    accuracy_tolerance: float = 0.0,
+    compact: bool = True,
+):
+    """
+    Train multiple models, evaluate, and return the best one.
+
+    With `compact`, models in WEIGHT_EQUIVALENT_MODELS train on the
+    unique rows weighted by duplicate count (every CV fold too), which
+    gives the same fitted models on far fewer rows. With `n_jobs` > 1
+    the model fits and CV folds run in a process pool; metrics are
+    identical to a serial run. Inference latency is always measured
+    afterwards in this process, one model at a time, and the best model
+    is chosen by `selection` (see select_best_model).
+    """
 
     models = {
         "MultinomialNB": MultinomialNB(),
@@ -182,30 +457,39 @@ def train_and_evaluate(X_train, X_test, y_train, y_test, le: LabelEncoder):
     report_lines.append("  HEALTH TRIAGE COPILOT – MODEL TRAINING REPORT")
     report_lines.append("=" * 70)
     report_lines.append(f"  Training samples: {len(X_train)}")
+    if compact:
+        n_unique = len(compact_rows(X_train, y_train)[0])
+        report_lines.append(
+            f"  Unique rows:      {n_unique}  ({len(X_train) / n_unique:.1f}× compression)"
+        )
     report_lines.append(f"  Testing samples:  {len(X_test)}")
     report_lines.append(f"  Features:         {X_train.shape[1]} symptoms")
     report_lines.append(f"  Classes:          {len(le.classes_)} diseases")
     report_lines.append("=" * 70)
     report_lines.append("")
 
-    best_model_name = None
-    best_accuracy = 0
-    best_model = None
+    fitted = {}
+    n_jobs = _resolve_jobs(n_jobs)
+
+    # Cross-validation (5-fold), same splits for every model
+    cv = StratifiedKFold(n_splits=5, shuffle=True, random_state=42)
+    cv_splits = list(cv.split(X_train, y_train))
 
-    for name, model in models.items():
-        print(f"\n  Training {name}...")
-        model.fit(X_train, y_train)
-        y_pred = model.predict(X_test)
+    trained = _run_training_tasks(models, X_train, y_train, X_test, cv_splits, n_jobs, compact)
+
+    for name in models:
+        model, y_pred, cv_scores = trained[name]
+        if n_jobs != 1:
+            print(f"\n  {name}")
 
         acc = accuracy_score(y_test, y_pred)
         prec = precision_score(y_test, y_pred, average="weighted", zero_division=0)
         rec = recall_score(y_test, y_pred, average="weighted", zero_division=0)
         f1 = f1_score(y_test, y_pred, average="weighted", zero_division=0)
 
-        # Cross-validation (5-fold)
-        cv = StratifiedKFold(n_splits=5, shuffle=True, random_state=42)
-        cv_scores = cross_val_score(model, X_train, y_train, cv=cv, scoring="accuracy")
+        cost = measure_inference(model, X_test)
 
+        fitted[name] = model
         results[name] = {
             "accuracy": acc,
             "precision": prec,
@@ -213,6 +497,7 @@ def train_and_evaluate(X_train, X_test, y_train, y_test, le: LabelEncoder):
             "f1": f1,
             "cv_mean": cv_scores.mean(),
             "cv_std": cv_scores.std(),
+            **cost,
         }
 
         print(f"    Accuracy:  {acc:.4f}")
@@ -220,6 +505,9 @@ def train_and_evaluate(X_train, X_test, y_train, y_test, le: LabelEncoder):
         print(f"    Recall:    {rec:.4f}")
         print(f"    F1 Score:  {f1:.4f}")
         print(f"    CV Mean:   {cv_scores.mean():.4f} ± {cv_scores.std():.4f}")
+        print(f"    Latency:   {cost['single_row_us']:.1f} µs/row single, "
+              f"{cost['batch_us_per_row']:.2f} µs/row batch ({cost['backend']}), "
+              f"{cost['size_kb']:.1f} KB")
 
         report_lines.append(f"── {name} {'─' * (50 - len(name))}")
         report_lines.append(f"  Accuracy:        {acc:.4f}  ({acc*100:.1f}%)")
@@ -227,17 +515,32 @@ def train_and_evaluate(X_train, X_test, y_train, y_test, le: LabelEncoder):
         report_lines.append(f"  Recall (wtd):    {rec:.4f}")
         report_lines.append(f"  F1 Score (wtd):  {f1:.4f}")
         report_lines.append(f"  5-Fold CV:       {cv_scores.mean():.4f} ± {cv_scores.std():.4f}")
+        if compact and isinstance(model, WEIGHT_EQUIVALENT_MODELS):
+            report_lines.append(f"  Trained on:      {n_unique} unique rows (weighted)")
+        else:
+            report_lines.append(f"  Trained on:      {len(X_train)} rows")
+        report_lines.append(f"  Latency (1 row): {cost['single_row_us']:.1f} µs  ({cost['backend']} backend)")
+        report_lines.append(f"  Latency (batch): {cost['batch_us_per_row']:.2f} µs/row")
+        report_lines.append(f"  Model size:      {cost['size_kb']:.1f} KB")
         report_lines.append("")
 
-        if acc > best_accuracy:
-            best_accuracy = acc
-            best_model_name = name
-            best_model = model
+    best_model_name = select_best_model(results, selection, accuracy_tolerance)
+    best_model = fitted[best_model_name]
+    best = results[best_model_name]
+    best_accuracy = best["accuracy"]
 
     # ── Best model detailed report ───────────────────────────────────────
+    if selection == "latency":
+        policy = f"lowest single-row latency within {accuracy_tolerance:.4f} of top accuracy"
+    else:
+        policy = "first model to reach top accuracy"
     report_lines.append("=" * 70)
     report_lines.append(f"  ★ BEST MODEL: {best_model_name}")
     report_lines.append(f"  ★ ACCURACY:   {best_accuracy:.4f}  ({best_accuracy*100:.1f}%)")
+    report_lines.append(f"  ★ LATENCY:    {best['single_row_us']:.1f} µs/row single, "
+                        f"{best['batch_us_per_row']:.2f} µs/row batch ({best['backend']} backend)")
+    report_lines.append(f"  ★ SIZE:       {best['size_kb']:.1f} KB")
+    report_lines.append(f"  ★ SELECTION:  {selection} ({policy})")
     report_lines.append("=" * 70)
     report_lines.append("")
 
@@ -253,19 +556,103 @@ def train_and_evaluate(X_train, X_test, y_train, y_test, le: LabelEncoder):
 
     # Comparison table
     report_lines.append("\n── MODEL COMPARISON TABLE ──────────────────────────")
-    report_lines.append(f"{'Model':<22} {'Accuracy':>10} {'Precision':>10} {'Recall':>10} {'F1':>10} {'CV Mean':>10}")
-    report_lines.append("-" * 74)
+    report_lines.append(
+        f"{'Model':<22} {'Accuracy':>10} {'Precision':>10} {'Recall':>10} {'F1':>10} {'CV Mean':>10}"
+        f" {'1-row µs':>10} {'Size KB':>10}"
+    )
+    report_lines.append("-" * 96)
     for name, r in sorted(results.items(), key=lambda x: x[1]["accuracy"], reverse=True):
         marker = " ★" if name == best_model_name else ""
         report_lines.append(
             f"{name:<22} {r['accuracy']:>9.4f} {r['precision']:>10.4f} "
-            f"{r['recall']:>10.4f} {r['f1']:>10.4f} {r['cv_mean']:>10.4f}{marker}"
+            f"{r['recall']:>10.4f} {r['f1']:>10.4f} {r['cv_mean']:>10.4f}"
+            f" {r['single_row_us']:>10.1f} {r['size_kb']:>10.1f}{marker}"
         )
 
     return best_model, best_model_name, results, "\n".join(report_lines)
 
 
-def main():
+def naive_bayes_params(model) -> dict | None:
+    """
+    Parameters of a fitted MultinomialNB / BernoulliNB for the NumPy
+    serving backend (see ml/predictor.py): the model kind, class
+    log-priors and feature log-probabilities. None for other model types.
+    """
+    if isinstance(model, MultinomialNB):
+        kind = "multinomial"
+    elif isinstance(model, BernoulliNB):
+        if model.binarize is not None and model.binarize != 0.0:
+            return None
+        kind = "bernoulli"
+    else:
+        return None
+    return {
+        "kind": kind,
+        "class_log_prior": model.class_log_prior_,
+        "feature_log_prob": model.feature_log_prob_,
+    }
+
+
+def write_artifact_bundle(
+    path: str,
+    model,
+    model_name: str,
+    le: LabelEncoder,
+    symptom_columns: list[str],
+    severity_map: dict,
+    disease_info: dict,
+) -> dict:
+    """
+    Write everything the predictor needs as one artifact bundle
+    (see ml/bundle.py). Naive Bayes models also get their folded
+    parameters as .npy arrays for the NumPy backend. Returns the manifest.
+    """
+    arrays = {}
+    nb = naive_bayes_params(model)
+    if nb is not None:
+        weights_t, bias = fold_naive_bayes(**nb)
+        arrays = {NB_WEIGHTS_FILE: weights_t, NB_BIAS_FILE: bias}
+
+    return write_bundle(
+        path,
+        model=model,
+        model_info={
+            "name": model_name,
+            "estimator": type(model).__name__,
+            "naive_bayes": nb["kind"] if nb else None,
+            "n_features": len(symptom_columns),
+            "n_classes": len(le.classes_),
+        },
+        metadata={
+            "symptom_columns": list(symptom_columns),
+            "classes": [str(c) for c in le.classes_],
+            "severity_map": {str(k): int(v) for k, v in severity_map.items()},
+            "disease_info": disease_info,
+        },
+        arrays=arrays,
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Train and evaluate the triage models")
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=1,
+        help="worker processes for model fits and CV folds (-1 = all CPUs; default 1)",
+    )
+    parser.add_argument(
+        "--no-dedup", dest="compact", action="store_false",
+        help="train every model on the full rows instead of unique weighted rows",
+    )
+    parser.add_argument(
+        "--selection", choices=SELECTION_POLICIES, default=DEFAULT_SELECTION,
+        help="how to pick the best model (default: latency)",
+    )
+    parser.add_argument(
+        "--accuracy-tolerance", type=float, default=0.0,
+        help="accuracy a faster model may give up under --selection latency (default 0)",
+    )
+    args = parser.parse_args(argv)
+
     print("\n╔══════════════════════════════════════════════════════╗")
     print("║   Health Triage Copilot – ML Training Pipeline       ║")
     print("╚══════════════════════════════════════════════════════╝\n")
@@ -302,47 +689,42 @@ def main():
         X_features.values, y, test_size=0.2, random_state=42, stratify=y
     )
     print(f"  Train: {X_train.shape[0]} | Test: {X_test.shape[0]}")
+    if args.compact:
+        n_unique = len(compact_rows(X_train, y_train)[0])
+        print(f"  Unique training rows: {n_unique} ({X_train.shape[0] / n_unique:.1f}× compression)")
 
     # 7. Train & evaluate all models
     print("\n🤖 Training & evaluating models...")
     best_model, best_name, results, report = train_and_evaluate(
-        X_train, X_test, y_train, y_test, le
+        X_train, X_test, y_train, y_test, le,
+        n_jobs=args.jobs,
+        selection=args.selection,
+        accuracy_tolerance=args.accuracy_tolerance,
+        compact=args.compact,
     )
 
     # 8. Save artifacts
     print(f"\n💾 Saving best model ({best_name}) and artifacts to ml/...")
 
-    with open(os.path.join(ML_DIR, "model.pkl"), "wb") as f:
-        pickle.dump(best_model, f)
-
-    with open(os.path.join(ML_DIR, "label_encoder.pkl"), "wb") as f:
-        pickle.dump(le, f)
-
-    with open(os.path.join(ML_DIR, "symptom_columns.pkl"), "wb") as f:
-        pickle.dump(symptom_columns, f)
-
-    with open(os.path.join(ML_DIR, "severity_map.pkl"), "wb") as f:
-        pickle.dump(severity_map, f)
-
-    with open(os.path.join(ML_DIR, "disease_info.pkl"), "wb") as f:
-        pickle.dump(disease_info, f)
+    manifest = write_artifact_bundle(
+        ARTIFACT_DIR, best_model, best_name, le,
+        symptom_columns, severity_map, disease_info,
+    )
 
     # Save training report
     report_path = os.path.join(ML_DIR, "training_report.txt")
     with open(report_path, "w", encoding="utf-8") as f:
         f.write(report)
 
-    print(f"  ✅ model.pkl")
-    print(f"  ✅ label_encoder.pkl")
-    print(f"  ✅ symptom_columns.pkl")
-    print(f"  ✅ severity_map.pkl")
-    print(f"  ✅ disease_info.pkl")
+    print(f"  ✅ artifacts/ (bundle v{manifest['version']}, checksum {manifest['checksum'][:12]})")
+    for name in manifest["files"]:
+        print(f"     • {name}")
     print(f"  ✅ training_report.txt")
 
     # 9. Print report
     print("\n" + report)
 
-    print("\n✅ Training complete! All artifacts saved to ml/ directory.\n")
+    print("\n✅ Training complete! Artifacts saved to ml/artifacts/\n")
 
 
 if __name__ == "__main__":
@@ -7,7 +7,6 @@ Tests ML model accuracy, all pipeline phases, and API endpoints.
 import os
 import sys
 import json
-import pickle
 import unittest
 
 import numpy as np
@@ -16,9 +15,12 @@ import pandas as pd
 # Add backend root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from ml.predictor import predict_disease, get_all_symptoms, get_symptom_severity, get_disease_info
+from ml.bundle import ARTIFACT_VERSION, MANIFEST_FILE, NB_BIAS_FILE, NB_WEIGHTS_FILE, ArtifactBundle, ArtifactError
+from ml.predictor import NumpyNaiveBayes, get_bundle, predict_disease, predict_disease_batch, get_all_symptoms, get_symptom_severity, get_disease_info
 from app.engine.phase1_input import process_input, normalize_symptoms_from_text, detect_language
-from app.engine.nlp import extract_symptoms_nlp
+from app.engine.nlp import extract_symptoms_nlp, IncrementalExtractor, PHRASE_AUTOMATON
+from app.engine.automaton import PhraseAutomaton
+from app.engine.rules import SymptomRuleIndex
 from app.engine.phase2_neglect import detect_neglect
 from app.engine.phase3_silent import detect_silent_emergency
 from app.engine.phase4_risk import classify_risk
@@ -27,8 +29,13 @@ from app.engine.phase6_outcome import generate_outcome_awareness
 from app.engine.phase7_action import generate_recommendations
 from app.engine.phase8_caregiver import evaluate_caregiver_alert
 from app.engine.phase9_language import localize_response
+from app.engine.translations import translate_full_text
+from app.engine.narratives import catalog_size, localize
+from app.engine import pipeline, instrumentation
 from app.engine.pipeline import run_triage
 from app import create_app
+from app.models import TriageResult
+from app.serialization import JSON_PROVIDERS, json_provider_class
 
 
 class TestMLModel(unittest.TestCase):
@@ -131,6 +138,306 @@ class TestMLModel(unittest.TestCase):
         self.assertGreater(accuracy, 0.90, f"Accuracy {accuracy:.2%} is below 90%")
 
 
+class TestBatchPredictor(unittest.TestCase):
+    """Test batched, vectorized disease prediction."""
+
+    def test_batch_matches_single(self):
+        """Each batch row equals the single-record prediction."""
+        batch = [
+            ["chest_pain", "breathlessness", "sweating"],
+            ["high_fever", "chills", "vomiting", "sweating", "headache", "nausea", "muscle_pain"],
+            ["xyz_unknown"],
+        ]
+        results = predict_disease_batch(batch)
+        self.assertEqual(len(results), 3)
+        for symptoms, result in zip(batch[:2], results[:2]):
+            self.assertEqual(result, predict_disease(symptoms))
+
+    def test_top_3_sorted(self):
+        """Top 3 probabilities come back in descending order."""
+        result = predict_disease_batch([["itching", "skin_rash"]])[0]
+        probs = [p for _, p in result["top_3"]]
+        self.assertEqual(len(probs), 3)
+        self.assertEqual(probs, sorted(probs, reverse=True))
+
+    def test_ties_keep_lower_class_first(self):
+        """Equal probabilities are ranked by class index, matching argmax."""
+        from unittest import mock
+        import ml.predictor as predictor
+        n_classes = len(predictor.get_label_names())
+        probas = np.zeros((1, n_classes))
+        probas[0, [3, 7, 9]] = 0.25
+
+        class TiedModel:
+            def predict_proba(self, features):
+                return probas
+
+        with mock.patch.object(predictor, "get_model", TiedModel):
+            result = predict_disease_batch([["itching"]])[0]
+        names = predictor.get_label_names()
+        self.assertEqual(result["predicted_disease"], names[3])
+        self.assertEqual([name for name, _ in result["top_3"]], [names[3], names[7], names[9]])
+
+        tied = predict_disease_batch([["drying_and_tingling_lips", "nodal_skin_eruptions", "headache"]])[0]
+        self.assertEqual([name for name, _ in tied["top_3"][1:]], ["Fungal infection", "Paralysis (brain hemorrhage)"])
+
+    def test_empty_batch(self):
+        """An empty batch returns an empty list."""
+        self.assertEqual(predict_disease_batch([]), [])
+
+
+class TestNumpyNaiveBayes(unittest.TestCase):
+    """Test the sklearn-free Naive Bayes scoring backend."""
+
+    def _random_features(self, n=200):
+        rng = np.random.default_rng(0)
+        return (rng.random((n, 131)) < 0.05).astype(int)
+
+    def test_matches_pickled_model(self):
+        """Bundled parameters reproduce the pickled sklearn model."""
+        bundle = get_bundle()
+        sk_model = bundle.load_model()
+        nb = NumpyNaiveBayes.from_bundle(bundle)
+        X = self._random_features()
+        np.testing.assert_allclose(nb.predict_proba(X), sk_model.predict_proba(X), atol=1e-9)
+        np.testing.assert_array_equal(nb.predict(X), sk_model.predict(X))
+
+    def test_bernoulli_export(self):
+        """BernoulliNB parameters round-trip through the NumPy backend."""
+        from sklearn.naive_bayes import BernoulliNB
+        from sklearn.preprocessing import LabelEncoder
+        from ml.train_model import naive_bayes_params
+
+        X = self._random_features(400)
+        le = LabelEncoder()
+        y = le.fit_transform([f"d{i % 5}" for i in range(len(X))])
+        model = BernoulliNB().fit(X, y)
+
+        params = naive_bayes_params(model)
+        self.assertEqual(params["kind"], "bernoulli")
+        nb = NumpyNaiveBayes.from_params(**params, class_names=le.classes_)
+        np.testing.assert_allclose(nb.predict_proba(X), model.predict_proba(X), atol=1e-9)
+        self.assertEqual(list(nb.class_names), list(le.classes_))
+
+    def test_unsupported_model(self):
+        """Models other than Multinomial/Bernoulli NB have no NumPy export."""
+        from sklearn.naive_bayes import BernoulliNB
+        from sklearn.tree import DecisionTreeClassifier
+        from ml.train_model import naive_bayes_params
+
+        X = self._random_features(50)
+        y = np.arange(50) % 2
+        self.assertIsNone(naive_bayes_params(DecisionTreeClassifier().fit(X, y)))
+        self.assertIsNone(naive_bayes_params(BernoulliNB(binarize=0.5).fit(X, y)))
+
+
+class TestArtifactBundle(unittest.TestCase):
+    """Test the versioned, checksummed model artifact bundle."""
+
+    def setUp(self):
+        import tempfile
+        from sklearn.naive_bayes import MultinomialNB
+        from sklearn.preprocessing import LabelEncoder
+        from ml.train_model import write_artifact_bundle
+
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.path = os.path.join(self._tmp.name, "artifacts")
+
+        X = np.eye(4, dtype=int)
+        self.le = LabelEncoder()
+        y = self.le.fit_transform(["flu", "cold", "flu", "cold"])
+        self.model = MultinomialNB().fit(X, y)
+        self.manifest = write_artifact_bundle(
+            self.path, self.model, "MultinomialNB", self.le,
+            ["a", "b", "c", "d"], {"a": 3}, {"flu": {"severity_tier": "low"}},
+        )
+        self.X = X
+
+    def _rewrite_manifest(self, **changes):
+        manifest_path = os.path.join(self.path, MANIFEST_FILE)
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+        manifest.update(changes)
+        with open(manifest_path, "w") as f:
+            json.dump(manifest, f)
+
+    def test_round_trip(self):
+        """The bundle serves the same probabilities as the trained model."""
+        bundle = ArtifactBundle(self.path)
+        self.assertEqual(bundle.model_info["naive_bayes"], "multinomial")
+        self.assertEqual(bundle.metadata["classes"], ["cold", "flu"])
+        self.assertEqual(bundle.metadata["severity_map"], {"a": 3})
+        nb = NumpyNaiveBayes.from_bundle(bundle)
+        np.testing.assert_allclose(nb.predict_proba(self.X), self.model.predict_proba(self.X), atol=1e-9)
+
+    def test_arrays_are_memory_mapped(self):
+        """NB arrays are read-only views onto the mapped files."""
+        weights = ArtifactBundle(self.path).array(NB_WEIGHTS_FILE)
+        self.assertIsInstance(weights.base, np.memmap)
+        self.assertFalse(weights.flags.writeable)
+
+    def test_version_mismatch(self):
+        """A bundle of another format version is rejected."""
+        self._rewrite_manifest(version=ARTIFACT_VERSION + 1)
+        with self.assertRaises(ArtifactError):
+            ArtifactBundle(self.path)
+
+    def test_tampered_file(self):
+        """A file that no longer matches its checksum is rejected."""
+        with open(os.path.join(self.path, NB_BIAS_FILE), "ab") as f:
+            f.write(b"\0")
+        with self.assertRaises(ArtifactError):
+            ArtifactBundle(self.path)
+
+    def test_missing_bundle(self):
+        """A missing bundle raises ArtifactError, not FileNotFoundError."""
+        with self.assertRaises(ArtifactError):
+            ArtifactBundle(os.path.join(self._tmp.name, "nowhere"))
+
+
+class TestBinaryFeatures(unittest.TestCase):
+    """Test the vectorized training feature builder."""
+
+    def setUp(self):
+        self.df = pd.DataFrame({
+            "Disease": ["A", "B", "C"],
+            "Symptom_1": [" itching", "cough", "nan"],
+            "Symptom_2": ["skin_rash", " cough ", ""],
+            "Symptom_3": [None, "fever", "itching"],
+        })
+
+    def test_dense_matrix(self):
+        """Columns are sorted; blanks, "nan" and repeats are handled."""
+        from ml.train_model import build_binary_features
+        features, columns = build_binary_features(self.df)
+        self.assertEqual(columns, ["cough", "fever", "itching", "skin_rash"])
+        self.assertEqual(list(features.columns), columns)
+        self.assertEqual(features.values.tolist(), [[0, 0, 1, 1], [1, 1, 0, 0], [0, 0, 1, 0]])
+
+    def test_sparse_matches_dense(self):
+        """The sparse matrix holds exactly the dense values."""
+        from ml.train_model import build_binary_features
+        dense, columns = build_binary_features(self.df)
+        matrix, sparse_columns = build_binary_features(self.df, sparse=True)
+        self.assertEqual(columns, sparse_columns)
+        np.testing.assert_array_equal(matrix.toarray(), dense.values)
+
+
+class TestCompactRows(unittest.TestCase):
+    """Test duplicate-row compaction for weighted training."""
+
+    def test_unique_rows_and_weights(self):
+        """Duplicates collapse in first-seen order with their counts."""
+        from ml.train_model import compact_rows
+        X = np.array([[1, 0], [0, 1], [1, 0], [1, 0], [0, 1]])
+        y = np.array([0, 1, 0, 1, 1])
+        Xc, yc, w = compact_rows(X, y)
+        self.assertEqual(Xc.tolist(), [[1, 0], [0, 1], [1, 0]])
+        self.assertEqual(yc.tolist(), [0, 1, 1])
+        self.assertEqual(w.tolist(), [2, 2, 1])
+
+    def test_weighted_fit_matches_full(self):
+        """Weighted fits on unique rows equal fits on all rows."""
+        from sklearn.naive_bayes import MultinomialNB
+        from sklearn.tree import DecisionTreeClassifier
+        from ml.train_model import compact_rows
+        rng = np.random.default_rng(5)
+        base = (rng.random((30, 15)) < 0.2).astype(int)
+        picks = rng.integers(0, 30, 400)
+        X, y = base[picks], picks % 4
+        Xc, yc, w = compact_rows(X, y)
+        self.assertLess(len(Xc), 31)
+
+        full = MultinomialNB().fit(X, y)
+        weighted = MultinomialNB().fit(Xc, yc, sample_weight=w)
+        np.testing.assert_allclose(weighted.feature_log_prob_, full.feature_log_prob_)
+
+        tree_full = DecisionTreeClassifier(random_state=42).fit(X, y)
+        tree_weighted = DecisionTreeClassifier(random_state=42).fit(Xc, yc, sample_weight=w)
+        np.testing.assert_array_equal(tree_weighted.predict(base), tree_full.predict(base))
+
+
+class TestParallelTraining(unittest.TestCase):
+    """Test that parallel training matches a serial run."""
+
+    def test_parallel_report_matches_serial(self):
+        """Same metrics, report and best model with a process pool."""
+        import contextlib
+        import io
+        from sklearn.preprocessing import LabelEncoder
+        from ml.train_model import train_and_evaluate
+
+        rng = np.random.default_rng(3)
+        labels = rng.integers(0, 3, 100)
+        X = (rng.random((100, 12)) < 0.1).astype(int)
+        X[np.arange(100), labels] = 1
+        le = LabelEncoder()
+        y = le.fit_transform([f"d{i}" for i in labels])
+        split = (X[:80], X[80:], y[:80], y[80:])
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            _, serial_name, serial_results, _ = train_and_evaluate(*split, le, selection="accuracy")
+            _, parallel_name, parallel_results, _ = train_and_evaluate(
+                *split, le, n_jobs=2, selection="accuracy"
+            )
+
+        # Inference cost is measured on each run's own fitted objects;
+        # every metric must match
+        cost = {"single_row_us", "batch_us_per_row", "size_kb"}
+        strip = lambda results: {
+            name: {k: v for k, v in r.items() if k not in cost} for name, r in results.items()
+        }
+        self.assertEqual(serial_name, parallel_name)
+        self.assertEqual(strip(serial_results), strip(parallel_results))
+        self.assertTrue(all(r["single_row_us"] > 0 for r in parallel_results.values()))
+
+
+class TestModelSelection(unittest.TestCase):
+    """Test latency-aware best-model selection."""
+
+    RESULTS = {
+        "SVM": {"accuracy": 1.0, "single_row_us": 900.0},
+        "DecisionTree": {"accuracy": 0.99, "single_row_us": 40.0},
+        "MultinomialNB": {"accuracy": 1.0, "single_row_us": 60.0},
+    }
+
+    def test_accuracy_policy_keeps_first(self):
+        """The accuracy policy keeps the first top-accuracy model."""
+        from ml.train_model import select_best_model
+        self.assertEqual(select_best_model(self.RESULTS, "accuracy"), "SVM")
+
+    def test_latency_policy_breaks_ties(self):
+        """Equally accurate models are ranked by single-row latency."""
+        from ml.train_model import select_best_model
+        self.assertEqual(select_best_model(self.RESULTS, "latency"), "MultinomialNB")
+        self.assertEqual(select_best_model(self.RESULTS, "latency", 0.02), "DecisionTree")
+
+    def test_latency_noise_keeps_training_order(self):
+        """Near-equal latencies do not reorder models."""
+        from ml.train_model import select_best_model
+        results = {
+            "MultinomialNB": {"accuracy": 1.0, "single_row_us": 19.6},
+            "BernoulliNB": {"accuracy": 1.0, "single_row_us": 19.0},
+        }
+        self.assertEqual(select_best_model(results, "latency"), "MultinomialNB")
+
+    def test_measure_inference(self):
+        """Latency and size are measured for a fitted model."""
+        from sklearn.naive_bayes import MultinomialNB
+        from sklearn.tree import DecisionTreeClassifier
+        from ml.train_model import measure_inference
+        X = np.eye(6, dtype=int)
+        y = np.array([0, 1] * 3)
+
+        nb_cost = measure_inference(MultinomialNB().fit(X, y), X)
+        self.assertEqual(nb_cost["backend"], "numpy")
+        self.assertTrue(nb_cost["single_row_us"] > 0 and nb_cost["size_kb"] > 0)
+
+        tree_cost = measure_inference(DecisionTreeClassifier().fit(X, y), X)
+        self.assertEqual(tree_cost["backend"], "sklearn")
+
+
 class TestPhase1Input(unittest.TestCase):
     """Test input parsing and normalization."""
 
@@ -167,6 +474,20 @@ class TestPhase1Input(unittest.TestCase):
         lang = detect_language("I have a headache and fever")
         self.assertEqual(lang, "en")
 
+    def test_language_markers_whole_words(self):
+        """Markers inside English words ("desire", "competent") don't count."""
+        self.assertEqual(detect_language("I desire a chair, my competent sister"), "en")
+
+    def test_language_detection_devanagari(self):
+        """Devanagari text is told apart as Hindi or Marathi."""
+        self.assertEqual(detect_language("मुझे बुखार है और सिर में दर्द है"), "hi")
+        self.assertEqual(detect_language("मला ताप आहे आणि डोकं दुखतंय"), "mr")
+
+    def test_language_detection_shared_markers(self):
+        """Markers both languages use don't tip Hindi text into Marathi."""
+        lang = detect_language("thoda sa ulti hai, thakaan nahi hai, gala dard nahi hai")
+        self.assertEqual(lang, "hi")
+
     def test_user_profile_created(self):
         """UserProfile is populated."""
         result = process_input({"age": 55, "gender": "male", "symptoms": ["cough"]})
@@ -262,6 +583,27 @@ class TestNLPEngine(unittest.TestCase):
         for n in negated:
             self.assertNotIn(n, symptoms)
 
+    def test_negation_scope_ends_at_clause(self):
+        """A negation word does not reach into the next clause."""
+        symptoms, negated = extract_symptoms_nlp("no fever, cough since morning")
+        self.assertIn("mild_fever", negated)
+        self.assertIn("cough", symptoms)
+
+    def test_negation_window(self):
+        """A negation word only covers the ~60 characters after it."""
+        filler = " for many many long days at home with the family around" * 2
+        symptoms, negated = extract_symptoms_nlp(f"no rest{filler} with cough")
+        self.assertIn("cough", symptoms)
+        self.assertEqual(negated, [])
+
+    def test_negation_whole_words_only(self):
+        """Negation words inside other words never negate ("casino", "knot")."""
+        text = "tied a knot" + " x" * 28 + " losing weight"
+        symptoms, negated = extract_symptoms_nlp(text)
+        self.assertIn("weight_loss", symptoms)
+        symptoms, _ = extract_symptoms_nlp("played piano with headache")
+        self.assertIn("headache", symptoms)
+
     def test_nlp_metadata_in_pipeline(self):
         """Pipeline response contains NLP metadata."""
         result = run_triage({
@@ -275,6 +617,89 @@ class TestNLPEngine(unittest.TestCase):
         self.assertGreater(result["nlp"]["symptom_count"], 0)
 
 
+class TestPhraseAutomaton(unittest.TestCase):
+    """Test the Aho-Corasick phrase automaton."""
+
+    def test_offsets_and_overlaps(self):
+        """Every occurrence is reported with offsets, nested ones included."""
+        automaton = PhraseAutomaton(["pain", "chest pain", "chest"])
+        matches = automaton.find_all("chest pain")
+        self.assertIn((0, 5, "chest"), matches)
+        self.assertIn((0, 10, "chest pain"), matches)
+        self.assertIn((6, 10, "pain"), matches)
+
+    def test_longest_first_at_same_end(self):
+        """Matches ending at the same offset come out longest first."""
+        automaton = PhraseAutomaton(["pain", "chest pain"])
+        self.assertEqual(
+            automaton.find_all("chest pain"),
+            [(0, 10, "chest pain"), (6, 10, "pain")],
+        )
+
+    def test_phrase_map_compiled(self):
+        """The module-level automaton covers the whole phrase map."""
+        matches = {p for _, _, p in PHRASE_AUTOMATON.iter_matches("i have chest pain")}
+        self.assertIn("chest pain", matches)
+
+    def test_no_match_across_clauses(self):
+        """A phrase split by a clause boundary is not matched."""
+        symptoms, _ = extract_symptoms_nlp("my chest, pain in my back")
+        self.assertNotIn("chest_pain", symptoms)
+
+    def test_feed_resumes_across_pieces(self):
+        """Feeding text in pieces finds phrases that span them."""
+        automaton = PhraseAutomaton(["pain", "chest pain"])
+        first, state = automaton.feed("my chest ")
+        second, _ = automaton.feed("pain", state, offset=9)
+        self.assertEqual(first, [])
+        self.assertEqual(second, automaton.find_all("my chest pain"))
+
+
+class TestIncrementalExtractor(unittest.TestCase):
+    """Test streaming symptom extraction over transcript chunks."""
+
+    CHUNKS = [
+        "I have had a headache since morning",
+        "and my chest",
+        "pain is worse. No fever",
+        "but I don't have any vomiting, feeling dizzy",
+    ]
+
+    def test_matches_batch_extraction(self):
+        """Final chunks give the same result as the joined transcript."""
+        extractor = IncrementalExtractor()
+        for chunk in self.CHUNKS:
+            extractor.update(chunk)
+        self.assertEqual(extractor.symptoms(), extract_symptoms_nlp(" ".join(self.CHUNKS)))
+        self.assertIn("chest_pain", extractor.symptoms()[0])
+
+    def test_empty_chunks_still_separate(self):
+        """Empty and blank chunks keep their separators, as in the joined text."""
+        for chunks in (["running stomach", "", "pain"], ["stomach", " ", "pain"], ["", "stomach pain", ""]):
+            extractor = IncrementalExtractor()
+            for chunk in chunks:
+                extractor.update(chunk)
+            with self.subTest(chunks=chunks):
+                self.assertEqual(extractor.symptoms(), extract_symptoms_nlp(" ".join(chunks)))
+        self.assertNotIn("stomach_pain", extract_symptoms_nlp("running stomach  pain")[0])
+
+    def test_deltas(self):
+        """Each chunk reports only what changed."""
+        extractor = IncrementalExtractor()
+        self.assertEqual(extractor.update("bad headache"), [{"symptom": "headache", "op": "add"}])
+        self.assertEqual(extractor.update("no fever"), [{"symptom": "mild_fever", "op": "negate"}])
+        self.assertEqual(extractor.update("really"), [])
+
+    def test_interim_chunk_is_replaced(self):
+        """A revised interim guess retracts what the previous one added."""
+        extractor = IncrementalExtractor()
+        extractor.update("i feel", final=True)
+        self.assertEqual(extractor.update("headache", final=False), [{"symptom": "headache", "op": "add"}])
+        self.assertEqual(extractor.update("head is fine", final=False), [{"symptom": "headache", "op": "remove"}])
+        extractor.update("head is fine", final=True)
+        self.assertEqual(extractor.symptoms(), extract_symptoms_nlp("i feel head is fine"))
+
+
 class TestPhase2Neglect(unittest.TestCase):
     """Test symptom neglect detection."""
 
@@ -355,6 +780,80 @@ class TestPhase4Risk(unittest.TestCase):
         self.assertIn("predicted_disease", result["ml_prediction"])
 
 
+class TestSymptomRuleIndex(unittest.TestCase):
+    """Test the bitmask rule index behind Phases 3 and 4."""
+
+    def setUp(self):
+        self.index = SymptomRuleIndex([
+            ({"fever", "rash"}, "a"),
+            ({"fever"}, "b"),
+            ({"cough", "fever", "rash"}, "c"),
+            (set(), "d"),
+        ])
+
+    def test_matches_subsets_in_rule_order(self):
+        """Every fully covered rule is returned, in original order."""
+        self.assertEqual(self.index.match(["rash", "fever", "cough"]), ["a", "b", "c", "d"])
+        self.assertEqual(self.index.match(["fever"]), ["b", "d"])
+
+    def test_partial_and_unknown_symptoms(self):
+        """Partial matches and unknown symptoms do not fire rules."""
+        self.assertEqual(self.index.match(["rash", "headache"]), ["d"])
+        self.assertEqual(self.index.match([]), ["d"])
+
+    def test_agrees_with_subset_scan(self):
+        """Results equal a plain issubset scan over the rules."""
+        import random
+        rng = random.Random(7)
+        symptoms = get_all_symptoms()[:20]
+        rules = [(frozenset(rng.sample(symptoms, rng.randint(1, 3))), i) for i in range(200)]
+        index = SymptomRuleIndex(rules)
+        for _ in range(100):
+            query = set(rng.sample(symptoms, rng.randint(0, 6)))
+            self.assertEqual(index.match(query), [i for r, i in rules if r <= query])
+
+
+class TestSymptomAutocomplete(unittest.TestCase):
+    """Test the prefix trie + trigram symptom search index."""
+
+    def setUp(self):
+        from app.engine.autocomplete import SOURCE_ALIAS, SOURCE_NAME, SOURCE_TRANSLATION, SymptomSearchIndex
+        self.index = SymptomSearchIndex([
+            ("headache", "headache", SOURCE_NAME),
+            ("sir dard", "headache", SOURCE_ALIAS),
+            ("head spinning", "dizziness", SOURCE_ALIAS),
+            ("stomach_pain", "stomach_pain", SOURCE_NAME),
+            ("पेट दर्द", "stomach_pain", SOURCE_TRANSLATION),
+            ("chest_pain", "chest_pain", SOURCE_NAME),
+        ])
+
+    def test_prefix_ranking(self):
+        """Whole-term prefixes and canonical names rank first."""
+        ids = [symptom for symptom, _, _ in self.index.search("head")]
+        self.assertEqual(ids, ["headache", "dizziness"])
+
+    def test_word_prefix(self):
+        """A prefix of any word in a term matches."""
+        ids = [symptom for symptom, _, _ in self.index.search("pa")]
+        self.assertEqual(ids, ["chest_pain", "stomach_pain"])
+        self.assertEqual(self.index.search("dard")[0][0], "headache")
+
+    def test_devanagari(self):
+        """Translations are searchable in their own script."""
+        self.assertEqual(self.index.search("पेट")[0][:2], ("stomach_pain", "पेट दर्द"))
+
+    def test_typo_tolerance(self):
+        """Misspellings fall back to trigram matches."""
+        symptom, _, match = self.index.search("hedache")[0]
+        self.assertEqual((symptom, match), ("headache", "fuzzy"))
+        self.assertEqual(self.index.search("zzzz"), [])
+
+    def test_limit_and_empty_query(self):
+        """`limit` caps the results; blank queries match nothing."""
+        self.assertEqual(len(self.index.search("pa", limit=1)), 1)
+        self.assertEqual(self.index.search("   "), [])
+
+
 class TestPhase5Explain(unittest.TestCase):
     """Test explainability narratives."""
 
@@ -445,6 +944,73 @@ class TestPhase9Language(unittest.TestCase):
         self.assertEqual(result["risk_level"], "High")
 
 
+class TestTranslator(unittest.TestCase):
+    """Test the compiled single-pass text translator."""
+
+    def test_longest_phrase_wins(self):
+        """A longer phrase is translated whole, not piecewise."""
+        self.assertEqual(translate_full_text("Hip joint pain", "hi"), "कूल्हे का दर्द")
+
+    def test_no_retranslation_inside_words(self):
+        """Output of one replacement is never scanned again."""
+        self.assertEqual(translate_full_text("Restlessness", "hi"), "बेचैनी")
+
+    def test_case_insensitive(self):
+        """Matching ignores case; unmatched text is kept as-is."""
+        self.assertEqual(
+            translate_full_text("VOMITING today", "hi"),
+            translate_full_text("vomiting", "hi") + " today",
+        )
+
+    def test_unicode_case_variants(self):
+        """Letters that only match under Unicode case folding do not fail."""
+        self.assertEqual(translate_full_text("ſkin rash", "hi"), translate_full_text("skin rash", "hi"))
+        self.assertEqual(translate_full_text("ıtching", "hi"), "ıtching")
+
+    def test_english_passthrough(self):
+        """English text is returned unchanged."""
+        text = "Your age is 45."
+        self.assertIs(translate_full_text(text, "en"), text)
+
+
+class TestNarrativeCatalog(unittest.TestCase):
+    """Test the pre-rendered Phase 5–8 narrative catalog."""
+
+    def test_catalog_populated(self):
+        """Every narrative language has fragments registered."""
+        sizes = catalog_size()
+        self.assertIn("hi", sizes)
+        self.assertTrue(all(n > 100 for n in sizes.values()))
+
+    def test_localized_phase_matches_translation(self):
+        """Emitting in Hindi matches translating the English output."""
+        ml = predict_disease(["chest_pain", "breathlessness"])
+        english = generate_recommendations("High", ml)
+        hindi = generate_recommendations("High", ml, language="hi")
+        self.assertEqual(hindi, "\n".join(
+            translate_full_text(part, "hi") for part in english.split("\n")
+        ))
+
+    def test_unknown_fragment_falls_back(self):
+        """Text outside the catalog is translated on the fly."""
+        self.assertEqual(localize("Your age is 45.", "hi"), translate_full_text("Your age is 45.", "hi"))
+
+    def test_pipeline_marathi_response(self):
+        """Marathi responses carry the localized templates."""
+        result = run_triage({
+            "age": 30, "gender": "female",
+            "symptoms": ["headache"], "language": "mr",
+        })
+        english = run_triage({
+            "age": 30, "gender": "female",
+            "symptoms": ["headache"], "language": "en",
+        })
+        self.assertEqual(
+            result["explanation"]["what_this_means"],
+            translate_full_text(english["explanation"]["what_this_means"], "mr"),
+        )
+
+
 class TestPipeline(unittest.TestCase):
     """Test the full triage pipeline."""
 
@@ -485,6 +1051,309 @@ class TestPipeline(unittest.TestCase):
         })
         self.assertIn(result["risk_level"], ["उच्च", "मध्यम", "कम"])
 
+    def test_result_model_is_slotted(self):
+        """The pipeline fills a slotted TriageResult; to_dict omits unset optionals."""
+        result = pipeline.run_triage_result({"age": 30, "symptoms": []})
+        self.assertIsInstance(result, TriageResult)
+        self.assertFalse(hasattr(result, "__dict__"))
+        response = result.to_dict()
+        self.assertNotIn("nlp", response)
+        self.assertNotIn("debug", response)
+        self.assertEqual(response["language"], "en")
+
+    def test_json_provider_encodes_result(self):
+        """The app's JSON provider writes a TriageResult like its dict form."""
+        app = create_app()
+        result = pipeline.run_triage_result({"age": 50, "symptoms": ["cough"], "language": "mr"})
+        self.assertEqual(json.loads(app.json.dumps(result)), json.loads(app.json.dumps(result.to_dict())))
+
+
+class TestJSONProviders(unittest.TestCase):
+    """Test the pluggable JSON providers."""
+
+    def setUp(self):
+        self.app = create_app()
+        self.result = pipeline.run_triage_result({"age": 50, "symptoms": ["cough"], "language": "hi"})
+
+    def test_utf8_output(self):
+        """Devanagari is written as UTF-8, not \\u escapes."""
+        body = self.app.json.response(self.result).get_data()
+        self.assertNotIn(b"\\u", body)
+        self.assertIn(self.result.risk_level.encode("utf-8"), body)
+
+    @unittest.skipIf("orjson" not in JSON_PROVIDERS, "orjson is not installed")
+    def test_backends_agree(self):
+        """orjson and stdlib providers produce the same bytes."""
+        stdlib = JSON_PROVIDERS["stdlib"](self.app)
+        fast = JSON_PROVIDERS["orjson"](self.app)
+        for provider in (stdlib, fast):
+            provider.compact = True
+        self.assertEqual(fast.response(self.result).get_data(), stdlib.response(self.result).get_data())
+        self.assertEqual(fast.dumps({"n": 2 ** 70}), stdlib.dumps({"n": 2 ** 70}))
+
+    @unittest.skipIf("orjson" not in JSON_PROVIDERS, "orjson is not installed")
+    def test_backends_agree_on_dumps(self):
+        """dumps gives the same text on both providers, with or without encoder arguments."""
+        stdlib = JSON_PROVIDERS["stdlib"](self.app)
+        fast = JSON_PROVIDERS["orjson"](self.app)
+        obj = {"b": [1, 2.5, "बुखार"], "a": None, "r": self.result}
+        self.assertEqual(stdlib.dumps({"b": 1, "a": [2]}), '{"a":[2],"b":1}')
+        for kwargs in (
+            {},
+            {"indent": 2},
+            {"indent": 4},
+            {"sort_keys": False},
+            {"separators": (", ", ": ")},
+            {"separators": [",", ":"]},
+            {"indent": 2, "separators": (",", ": ")},
+            {"ensure_ascii": True},
+        ):
+            with self.subTest(**kwargs):
+                self.assertEqual(fast.dumps(obj, **kwargs), stdlib.dumps(obj, **kwargs))
+
+    def test_unknown_backend(self):
+        """An unavailable JSON_BACKEND is a configuration error."""
+        with self.assertRaises(ValueError):
+            json_provider_class("simdjson")
+
+
+
+class TestTriageCache(unittest.TestCase):
+    """Test the canonical-input result cache."""
+
+    def setUp(self):
+        pipeline.clear_cache()
+        pipeline.configure_cache(pipeline.DEFAULT_CACHE_SIZE)
+
+    def tearDown(self):
+        pipeline.clear_cache()
+        pipeline.configure_cache(pipeline.DEFAULT_CACHE_SIZE)
+
+    def test_repeat_is_hit(self):
+        """Same canonical input is served from the cache."""
+        data = {"age": 45, "gender": "male", "symptoms": ["cough", "high_fever"]}
+        first = run_triage(data)
+        second = run_triage({**data, "symptoms": ["high_fever", "cough"]})
+        stats = pipeline.get_cache_stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(first["explanation"], second["explanation"])
+        self.assertEqual(second["input_summary"]["raw_symptoms"], "high_fever, cough")
+
+    def test_same_bucket_keeps_exact_age(self):
+        """A hit for a different age in the same bucket reports that age."""
+        pipeline.configure_cache(0)
+        expected = run_triage({"age": 47, "symptoms": ["chest_pain"], "language": "hi"})
+        pipeline.configure_cache(pipeline.DEFAULT_CACHE_SIZE)
+        run_triage({"age": 42, "symptoms": ["chest_pain"], "language": "hi"})
+        result = run_triage({"age": 47, "symptoms": ["chest_pain"], "language": "hi"})
+        self.assertEqual(pipeline.get_cache_stats()["hits"], 1)
+        self.assertEqual(result, expected)
+        self.assertIn("47", result["explanation"]["what_we_noticed"])
+
+    def test_changing_response_leaves_cache_intact(self):
+        """Editing a returned response (miss or hit) never changes later hits."""
+        data = {"age": 30, "symptoms": ["headache", "cough", "high_fever"]}
+        first = run_triage(data)
+        expected = json.loads(json.dumps(first))
+        localize_response(first, "hi")
+        first["top_3_conditions"].clear()
+        second = run_triage(data)
+        self.assertEqual(json.loads(json.dumps(second)), expected)
+        second["what_if_ignored"]["short_term"] = "changed"
+        second["nlp"]["extracted_symptoms"].append("changed")
+        self.assertEqual(json.loads(json.dumps(run_triage(data))), expected)
+        self.assertEqual(pipeline.get_cache_stats()["hits"], 2)
+
+    def test_debug_timings_not_cached(self):
+        """Debug timings attached to one response never reach the cached result."""
+        run_triage({"age": 30, "symptoms": ["cough"], "debug": True})
+        self.assertNotIn("debug", run_triage({"age": 30, "symptoms": ["cough"]}))
+        self.assertEqual(pipeline.get_cache_stats()["hits"], 1)
+
+    def test_threshold_crossing_is_miss(self):
+        """Ages on different sides of a rule threshold get separate entries."""
+        run_triage({"age": 39, "symptoms": ["chest_pain"]})
+        run_triage({"age": 41, "symptoms": ["chest_pain"]})
+        self.assertEqual(pipeline.get_cache_stats()["hits"], 0)
+
+    def test_lru_eviction(self):
+        """Entries past the capacity are evicted and counted."""
+        pipeline.configure_cache(2)
+        for symptoms in (["cough"], ["headache"], ["itching"]):
+            run_triage({"age": 30, "symptoms": symptoms})
+        stats = pipeline.get_cache_stats()
+        self.assertEqual(stats["size"], 2)
+        self.assertEqual(stats["evictions"], 1)
+
+
+class TestInstrumentation(unittest.TestCase):
+    """Test per-phase latency instrumentation."""
+
+    def tearDown(self):
+        instrumentation.configure_instrumentation(False)
+        instrumentation.reset_phase_latency()
+
+    def test_disabled_is_noop(self):
+        """With timing off, traces are the shared no-op and nothing is recorded."""
+        self.assertIs(instrumentation.start_trace(), instrumentation.NULL_TRACE)
+        pipeline.clear_cache()
+        run_triage({"age": 30, "symptoms": ["cough"]})
+        self.assertEqual(instrumentation.get_phase_latency(), {})
+
+    def test_debug_field(self):
+        """A debug request gets per-phase timings in the response."""
+        pipeline.clear_cache()
+        result = run_triage({"age": 30, "symptoms": ["cough"], "debug": True})
+        timings = result["debug"]["timings_ms"]
+        for phase in ("phase1_input", "phase4_risk", "phase9_language", "total"):
+            self.assertIn(phase, timings)
+        self.assertNotIn("debug", run_triage({"age": 30, "symptoms": ["cough"]}))
+
+    def test_histograms_recorded(self):
+        """Enabled timing feeds the phase histograms."""
+        instrumentation.configure_instrumentation(True)
+        pipeline.clear_cache()
+        for _ in range(3):
+            run_triage({"age": 30, "symptoms": ["cough"]})
+        latency = instrumentation.get_phase_latency()
+        self.assertEqual(latency["total"]["count"], 3)
+        self.assertEqual(latency["phase4_risk"]["count"], 1)
+        self.assertEqual(latency["cache_hit"]["count"], 2)
+        self.assertGreaterEqual(latency["total"]["p99_ms"], latency["total"]["p50_ms"])
+
+
+class TestBenchmarks(unittest.TestCase):
+    """Test the benchmark workloads and result comparison."""
+
+    def test_workloads_are_deterministic(self):
+        """The same seed always yields the same requests."""
+        from benchmarks.workloads import generate
+        self.assertEqual(generate("hindi", 20, seed=1), generate("hindi", 20, seed=1))
+        self.assertNotEqual(generate("hindi", 20, seed=1), generate("hindi", 20, seed=2))
+
+    def test_workloads_yield_symptoms(self):
+        """Generated free text is recognized by the NLP engine."""
+        from benchmarks.workloads import generate
+        for workload in ("free_text", "hindi", "marathi"):
+            records = generate(workload, 20)
+            hits = sum(bool(extract_symptoms_nlp(r["raw_text"])[0]) for r in records)
+            self.assertGreater(hits, 15, workload)
+
+    def test_devanagari_workloads_detect_language(self):
+        """Devanagari workloads leave the language to script detection."""
+        from benchmarks.workloads import generate
+        for workload, language in (("hindi_devanagari", "hi"), ("marathi_devanagari", "mr")):
+            for record in generate(workload, 20):
+                self.assertNotIn("language", record)
+                self.assertEqual(detect_language(record["raw_text"]), language, record["raw_text"])
+
+    def test_compare_flags_regressions(self):
+        """Slower medians beyond the threshold are regressions."""
+        from benchmarks.bench_triage import compare_results
+        base = {"results": {"a": {"median_us": 10.0}, "b": {"median_us": 10.0}, "c": {"median_us": 1.0}}}
+        new = {"results": {"a": {"median_us": 12.0}, "b": {"median_us": 10.5}, "d": {"median_us": 1.0}}}
+        status = {r["case"]: r["status"] for r in compare_results(base, new, threshold=0.1)}
+        self.assertEqual(status, {"a": "regression", "b": "same", "c": "removed", "d": "added"})
+
+    def test_run_small(self):
+        """A filtered run produces timings and restores the cache size."""
+        from benchmarks.bench_triage import run_benchmarks
+        before = pipeline.get_cache_stats()["maxsize"]
+        doc = run_benchmarks(count=3, rounds=1, name_filter="phase3")
+        self.assertTrue(doc["results"])
+        self.assertTrue(all(k.startswith("phase3.") for k in doc["results"]))
+        self.assertTrue(all("alloc_kb" in r for r in doc["results"].values()))
+        self.assertEqual(pipeline.get_cache_stats()["maxsize"], before)
+
+
+class TestWarmup(unittest.TestCase):
+    """Test preload / warm-up mode for pre-forking servers."""
+
+    def tearDown(self):
+        import gc
+        gc.unfreeze()
+
+    def test_preload_warms_and_freezes(self):
+        """create_app(preload=True) runs synthetic triages and freezes the heap."""
+        import gc
+        from app.warmup import WARMUP_GETS, WARMUP_REQUESTS, get_warmup_status
+        app = create_app(preload=True)
+        status = get_warmup_status()
+        self.assertTrue(status["warmed_up"])
+        self.assertEqual(
+            status["requests"],
+            len(WARMUP_GETS) + len(WARMUP_REQUESTS) * app.config["WARMUP_ROUNDS"],
+        )
+        self.assertGreater(gc.get_freeze_count(), 0)
+
+    def test_warmup_leaves_no_traces(self):
+        """Warm-up adds nothing to, and removes nothing from, the cache and latency stats."""
+        from app.engine import pipeline
+        from app.warmup import warm_up
+        app = create_app()
+        instrumentation.configure_instrumentation(True)
+        try:
+            app.test_client().post("/triage", json={"age": 52, "symptoms": ["cough", "chest_pain"]})
+            cache_before = pipeline.get_cache_stats()
+            latency_before = instrumentation.get_phase_latency()
+            warm_up(app, rounds=2)
+            self.assertEqual(pipeline.get_cache_stats(), cache_before)
+            self.assertEqual(instrumentation.get_phase_latency(), latency_before)
+        finally:
+            instrumentation.configure_instrumentation(False)
+            instrumentation.reset_phase_latency()
+
+    def test_ready_endpoint(self):
+        """GET /ready is 503 while the worker cannot be warmed up, then 200."""
+        from unittest import mock
+        from app import warmup
+        app = create_app()
+        client = app.test_client()
+        with mock.patch.dict(warmup._status, warmed_up=False):
+            with mock.patch.object(warmup, "WARMUP_GETS", ("/no-such-catalog",)):
+                response = client.get("/ready")
+            self.assertEqual(response.status_code, 503)
+            data = response.get_json()
+            self.assertFalse(data["ready"])
+            self.assertIn("/no-such-catalog", data["warmup"]["error"])
+
+            response = client.get("/ready")
+            self.assertEqual(response.status_code, 200)
+            data = response.get_json()
+            self.assertTrue(all(data["artifacts"].values()))
+            self.assertEqual(data["bundle"]["backend"], "numpy")
+            self.assertGreater(data["indexes"]["phrase_automaton"], 0)
+            self.assertIsNotNone(data["warmup"]["warmup_ms"])
+            self.assertIsNone(data["warmup"]["error"])
+
+    def test_ready_without_preload(self):
+        """An app created without preload warms up on its first probe, keeping its cache."""
+        from unittest import mock
+        from app import warmup
+        from app.engine import pipeline
+        app = create_app()
+        client = app.test_client()
+        with mock.patch.dict(warmup._status, warmed_up=False, requests=0):
+            client.post("/triage", json={"age": 61, "symptoms": ["headache", "vomiting"]})
+            cache_before = pipeline.get_cache_stats()
+            response = client.get("/ready")
+            self.assertEqual(response.status_code, 200)
+            self.assertTrue(response.get_json()["warmup"]["warmed_up"])
+            self.assertGreater(warmup._status["requests"], 0)
+        self.assertEqual(pipeline.get_cache_stats(), cache_before)
+
+    def test_ready_reports_any_warmup_error(self):
+        """Any exception during warm-up gives 503 with the error, not a 500."""
+        from unittest import mock
+        from app import warmup
+        client = create_app().test_client()
+        with mock.patch.dict(warmup._status, warmed_up=False), \
+                mock.patch.object(warmup, "load_artifacts", side_effect=ValueError("bad bundle")):
+            response = client.get("/ready")
+            self.assertEqual(response.status_code, 503)
+            self.assertEqual(response.get_json()["warmup"]["error"], "ValueError: bad bundle")
+
 
 class TestAPIEndpoints(unittest.TestCase):
     """Test Flask API endpoints."""
@@ -526,6 +1395,85 @@ class TestAPIEndpoints(unittest.TestCase):
         self.assertEqual(data["total"], 131)
         self.assertIn("categorized", data)
 
+    def test_triage_batch_json_array(self):
+        """POST /triage/batch with a JSON array streams one NDJSON line per record."""
+        records = [
+            {"age": 40, "gender": "male", "symptoms": ["high_fever", "cough", "headache"]},
+            {"age": 30},
+            {"age": 45, "symptoms": ["chest_pain"], "language": "hi"},
+        ]
+        response = self.client.post("/triage/batch", json=records)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, "application/x-ndjson")
+        lines = [json.loads(l) for l in response.get_data(as_text=True).splitlines()]
+        self.assertEqual([l["index"] for l in lines], [0, 1, 2])
+        self.assertEqual(lines[0]["result"], json.loads(json.dumps(run_triage(records[0]))))
+        self.assertIn("error", lines[1])
+        self.assertIn(lines[2]["result"]["risk_level"], ["उच्च", "मध्यम", "कम"])
+
+    def test_triage_batch_ndjson(self):
+        """POST /triage/batch accepts NDJSON input."""
+        body = "\n".join([
+            json.dumps({"age": 25, "raw_text": "I have headache and cough"}),
+            "not json",
+            "",
+        ])
+        response = self.client.post(
+            "/triage/batch", data=body, content_type="application/x-ndjson"
+        )
+        self.assertEqual(response.status_code, 200)
+        lines = [json.loads(l) for l in response.get_data(as_text=True).splitlines()]
+        self.assertEqual(len(lines), 2)
+        self.assertIn("risk_level", lines[0]["result"])
+        self.assertEqual(lines[1]["error"], "Invalid triage record")
+
+    def test_triage_batch_prediction_failure(self):
+        """A failed ML call turns its chunk into error lines; the stream goes on."""
+        from unittest import mock
+        records = [{"age": 40, "symptoms": ["cough", "high_fever"]} for _ in range(3)]
+        records[1] = {"age": 30, "raw_text": "just checking"}
+        calls = []
+
+        def failing_batch(batch):
+            calls.append(batch)
+            if len(calls) == 1:
+                raise RuntimeError("model unavailable")
+            return predict_disease_batch(batch)
+
+        with mock.patch.dict(self.app.config, TRIAGE_BATCH_CHUNK_SIZE=2), \
+                mock.patch.object(pipeline, "predict_disease_batch", failing_batch):
+            response = self.client.post("/triage/batch", json=records)
+            lines = [json.loads(l) for l in response.get_data(as_text=True).splitlines()]
+        self.assertEqual([l["index"] for l in lines], [0, 1, 2])
+        self.assertEqual(lines[0]["detail"], "model unavailable")
+        self.assertIn("result", lines[1])
+        self.assertIn("risk_level", lines[2]["result"])
+
+    def test_triage_batch_record_limit(self):
+        """A JSON array batch over TRIAGE_BATCH_MAX_RECORDS returns 413."""
+        from unittest import mock
+        records = [{"age": 40, "symptoms": ["cough"]}] * 3
+        with mock.patch.dict(self.app.config, TRIAGE_BATCH_MAX_RECORDS=2):
+            self.assertEqual(self.client.post("/triage/batch", json=records).status_code, 413)
+            self.assertEqual(self.client.post("/triage/batch", json=records[:2]).status_code, 200)
+
+    def test_triage_batch_rejects_object(self):
+        """POST /triage/batch with a non-array JSON body returns 400."""
+        response = self.client.post("/triage/batch", json={"age": 30})
+        self.assertEqual(response.status_code, 400)
+
+    def test_cache_metrics_endpoint(self):
+        """GET /metrics/cache returns cache counters."""
+        response = self.client.get("/metrics/cache")
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("hits", response.get_json())
+
+    def test_latency_metrics_endpoint(self):
+        """GET /metrics/latency returns the phase histograms."""
+        response = self.client.get("/metrics/latency")
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("phases", response.get_json())
+
     def test_diseases_endpoint(self):
         """GET /diseases returns disease list."""
         response = self.client.get("/diseases")
@@ -533,6 +1481,102 @@ class TestAPIEndpoints(unittest.TestCase):
         data = response.get_json()
         self.assertGreater(data["total"], 30)
 
+    def test_catalog_etag(self):
+        """Catalogs carry a strong ETag and answer If-None-Match with 304."""
+        response = self.client.get("/symptoms")
+        etag = response.headers["ETag"]
+        self.assertFalse(etag.startswith("W/"))
+        self.assertIn("max-age", response.headers["Cache-Control"])
+
+        cached = self.client.get("/symptoms", headers={"If-None-Match": etag})
+        self.assertEqual(cached.status_code, 304)
+        self.assertEqual(cached.data, b"")
+        self.assertEqual(cached.headers["ETag"], etag)
+
+    def test_localized_catalogs(self):
+        """?language= localizes display names; ids and disease names stay canonical."""
+        en = self.client.get("/symptoms").get_json()
+        hi = self.client.get("/symptoms?language=hi").get_json()
+        self.assertEqual(hi["language"], "hi")
+        self.assertEqual([s["id"] for s in hi["symptoms"]], [s["id"] for s in en["symptoms"]])
+        names = {s["id"]: s["name"] for s in hi["symptoms"]}
+        self.assertEqual(names["cough"], "खांसी")
+
+        diseases = self.client.get("/diseases?language=mr").get_json()["diseases"]
+        dengue = next(d for d in diseases if d["name"] == "Dengue")
+        self.assertEqual(dengue["display_name"], "डेंगू")
+
+    def test_catalog_unsupported_language(self):
+        """An unknown catalog language is rejected."""
+        response = self.client.get("/diseases?language=fr")
+        self.assertEqual(response.status_code, 400)
+
+    def test_autocomplete_endpoint(self):
+        """GET /symptoms/autocomplete returns ranked canonical ids."""
+        response = self.client.get("/symptoms/autocomplete?q=bukh&language=hi")
+        self.assertEqual(response.status_code, 200)
+        results = response.get_json()["results"]
+        self.assertIn("mild_fever", [r["id"] for r in results])
+        self.assertEqual(results[0]["match"], "prefix")
+        self.assertEqual(self.client.get("/symptoms/autocomplete?q=a&limit=99").status_code, 400)
+
+    def test_dictation_stream(self):
+        """Chunks posted to a stream come back as deltas and as SSE events."""
+        opened = self.client.post("/triage/stream")
+        self.assertEqual(opened.status_code, 201)
+        sid = opened.get_json()["session_id"]
+
+        event = self.client.post(f"/triage/stream/{sid}/chunks", json={"text": "headache", "final": False}).get_json()
+        self.assertEqual(event["deltas"], [{"symptom": "headache", "op": "add"}])
+        event = self.client.post(f"/triage/stream/{sid}/chunks", json={"text": "headache and no fever"}).get_json()
+        self.assertEqual(event["seq"], 2)
+        self.assertEqual(event["negated"], ["mild_fever"])
+        self.assertEqual(self.client.post(f"/triage/stream/{sid}/chunks", json={}).status_code, 400)
+
+        self.assertEqual(self.client.delete(f"/triage/stream/{sid}").status_code, 204)
+        self.assertEqual(self.client.post(f"/triage/stream/{sid}/chunks", json={"text": "x"}).status_code, 404)
+
+    def test_dictation_stream_events(self):
+        """The event stream replays events after Last-Event-ID, then ends on close."""
+        from app.streams import get_registry
+        sid = self.client.post("/triage/stream").get_json()["session_id"]
+        for text in ("headache", "no fever"):
+            self.client.post(f"/triage/stream/{sid}/chunks", json={"text": text})
+        get_registry(self.app.config).get(sid).close()
+
+        response = self.client.get(f"/triage/stream/{sid}/events", headers={"Last-Event-ID": "1"})
+        self.assertEqual(response.mimetype, "text/event-stream")
+        body = response.get_data(as_text=True)
+        self.assertNotIn("id: 1\n", body)
+        self.assertIn("id: 2\nevent: symptoms\n", body)
+        self.assertTrue(body.endswith("event: end\ndata: {}\n\n"))
+
+    def test_dictation_stream_limits(self):
+        """Streams keep only their latest events and expire after their lifetime."""
+        from app.streams import StreamRegistry
+        registry = StreamRegistry(ttl=60, lifetime=60, max_events=3)
+        session = registry.open()
+        for text in ("headache", "cough", "no fever", "vomiting", "itching"):
+            session.push(text)
+        self.assertEqual([e["seq"] for e in session.events], [3, 4, 5])
+        events, _ = session.wait(1, timeout=0)
+        self.assertEqual([e["seq"] for e in events], [3, 4, 5])
+        self.assertEqual([e["seq"] for e in session.wait(4, timeout=0)[0]], [5])
+
+        session.created -= 61
+        self.assertIsNone(registry.get(session.id))
+        self.assertTrue(session.closed)
+
+    def test_catalog_gzip(self):
+        """Catalogs are served pre-compressed when the client accepts gzip."""
+        import gzip
+        plain = self.client.get("/diseases")
+        response = self.client.get("/diseases", headers={"Accept-Encoding": "gzip"})
+        self.assertEqual(response.headers["Content-Encoding"], "gzip")
+        self.assertIn("Accept-Encoding", response.headers["Vary"])
+        self.assertNotEqual(response.headers["ETag"], plain.headers["ETag"])
+        self.assertEqual(json.loads(gzip.decompress(response.data)), plain.get_json())
+
 
 if __name__ == "__main__":
     print("\n" + "=" * 60)
@@ -0,0 +1,23 @@
+"""
+WSGI entry point for multi-worker servers.
+
+    gunicorn --preload -w 4 -k gthread --threads 8 -b 0.0.0.0:5000 wsgi:app
+
+The app is loaded and warmed up once in the parent process (see
+app/warmup.py); workers fork from it with artifacts already in memory.
+
+Dictation streams (/triage/stream, app/streams.py) live in the memory of
+the process that opened them:
+  • use a threaded (gthread) or async (gevent) worker class: each
+    connected /events stream holds a thread until it ends, so with sync
+    workers a few listeners would block the whole server
+  • every request for a stream must reach the same process. gunicorn
+    workers share one socket, so either serve streams from a single
+    worker (`-w 1 -k gthread --threads 32`), or run one single-worker
+    instance per port behind a load balancer with sticky routing on
+    the session id. Any other process answers 404 for the stream.
+"""
+
+from app import create_app
+
+app = create_app(preload=True)
@@ -1,5 +1,5 @@
 import axios from 'axios';
-import type { TriageRequest, TriageResult, SymptomEntry } from '../types';
+import type { TriageRequest, TriageResult, SymptomEntry, Language, DictationEvent } from '../types';
 
 const API_BASE = '/api';
 
@@ -14,18 +14,48 @@ export async function submitTriage(data: TriageRequest): Promise<TriageResult> {
   return res.data;
 }
 
-export async function fetchSymptoms(): Promise<SymptomEntry[]> {
-  const res = await api.get<{ symptoms: SymptomEntry[]; total: number }>('/symptoms');
+export async function fetchSymptoms(language: Language = 'en'): Promise<SymptomEntry[]> {
+  const res = await api.get<{ symptoms: SymptomEntry[]; total: number }>('/symptoms', {
+    params: { language },
+  });
   return res.data.symptoms;
 }
 
-export async function fetchDiseases(): Promise<
-  Array<{ name: string; description: string }>
+export async function fetchDiseases(language: Language = 'en'): Promise<
+  Array<{ name: string; display_name?: string; description: string }>
 > {
-  const res = await api.get('/diseases');
+  const res = await api.get('/diseases', { params: { language } });
   return res.data.diseases;
 }
 
+export async function openDictationStream(): Promise<string> {
+  const res = await api.post<{ session_id: string }>('/triage/stream');
+  return res.data.session_id;
+}
+
+export async function sendTranscriptChunk(
+  sessionId: string,
+  text: string,
+  final: boolean,
+): Promise<DictationEvent> {
+  const res = await api.post<DictationEvent>(`/triage/stream/${sessionId}/chunks`, { text, final });
+  return res.data;
+}
+
+export function subscribeDictation(
+  sessionId: string,
+  onEvent: (event: DictationEvent) => void,
+): EventSource {
+  const source = new EventSource(`${API_BASE}/triage/stream/${sessionId}/events`);
+  source.addEventListener('symptoms', (e) => onEvent(JSON.parse((e as MessageEvent).data)));
+  source.addEventListener('end', () => source.close());
+  return source;
+}
+
+export async function closeDictationStream(sessionId: string): Promise<void> {
+  await api.delete(`/triage/stream/${sessionId}`);
+}
+
 export async function healthCheck(): Promise<boolean> {
   try {
     const res = await api.get('/');
@@ -52,6 +52,19 @@ export interface SymptomEntry {
   name: string;
 }
 
+export interface SymptomDelta {
+  symptom: string;
+  op: 'add' | 'negate' | 'remove';
+}
+
+export interface DictationEvent {
+  seq: number;
+  final: boolean;
+  deltas: SymptomDelta[];
+  symptoms: string[];
+  negated: string[];
+}
+
 export interface HistoryEntry {
   id: string;
   timestamp: string;